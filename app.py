@@ -9,6 +9,8 @@ from resume_builder.tools.resume_generator import ResumeGenerator
 from resume_builder.tools.ats_optimizer import ATSOptimizer
 from resume_builder.formatters.html_formatter import HtmlFormatter
 from resume_builder.formatters.pdf_converter import PdfConverter
+from resume_builder.pipeline.stages import parse_and_analyze
+from resume_builder.pipeline.timing import StageTimer
 
 # Load environment variables
 load_dotenv()
@@ -124,33 +126,36 @@ def main():
             status_text = st.empty()
             
             with st.spinner("Processing your resume..."):
-                # Parse resume
-                status_text.text("Parsing resume...")
-                resume_parser = ResumeParser(api_key=api_key)
-                resume = resume_parser(resume_path)
-                progress_bar.progress(25)
+                timer = StageTimer()
                 
-                # Analyze job description
-                status_text.text("Analyzing job description...")
-                job_analyzer = JobDescriptionAnalyzer(api_key=api_key)
-                job = job_analyzer(job_description)
+                # Parse resume and analyze job description concurrently
+                status_text.text("Parsing resume and analyzing job description...")
+                resume, job = parse_and_analyze(
+                    ResumeParser(api_key=api_key),
+                    JobDescriptionAnalyzer(api_key=api_key),
+                    resume_path,
+                    job_description,
+                    timer=timer
+                )
                 progress_bar.progress(50)
                 
                 # Generate optimized resume
                 status_text.text("Generating optimized resume...")
                 resume_generator = ResumeGenerator(api_key=api_key)
-                optimized_resume = resume_generator({
-                    'resume': resume,
-                    'job': job,
-                    'keywords': []  # Optional keywords list
-                })
+                with timer.stage("generate resume"):
+                    optimized_resume = resume_generator({
+                        'resume': resume,
+                        'job': job,
+                        'keywords': []  # Optional keywords list
+                    })
                 progress_bar.progress(75)
                 
                 # ATS optimization
                 if not skip_ats:
                     status_text.text("Optimizing for ATS...")
                     ats_optimizer = ATSOptimizer(api_key=api_key)
-                    optimized_resume = ats_optimizer(optimized_resume, job)
+                    with timer.stage("ATS optimization"):
+                        optimized_resume = ats_optimizer(optimized_resume, job)
                 
                 # Generate output
                 status_text.text("Generating final output...")
@@ -177,6 +182,10 @@ def main():
                 
                 st.success("Resume optimization complete!")
                 
+                # Show where the time went
+                with st.expander("Stage timings"):
+                    st.table({stage: f"{seconds:.2f}s" for stage, seconds in timer.as_dict().items()})
+                
                 # Provide download button
                 with open(output_path, "rb") as file:
                     st.download_button(
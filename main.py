@@ -235,21 +235,17 @@
 #         main()
 
 import os
-import json
 import argparse
 from pathlib import Path
 from dotenv import load_dotenv
 
-from resume_builder.agent.react_agent import create_resume_agent
-from resume_builder.agent.ats_agent import create_ats_optimization_agent
-from resume_builder.tools.resume_parser import ResumeParser
-from resume_builder.tools.job_analyzer import JobDescriptionAnalyzer
-from resume_builder.tools.resume_generator import ResumeGenerator
-from resume_builder.tools.ats_optimizer import ATSOptimizer
-from resume_builder.formatters.html_formatter import HtmlFormatter
-from resume_builder.formatters.pdf_converter import PdfConverter
-from resume_builder.formatters.docx_converter import DocxConverter
+# Only lightweight modules are imported here so --help and --list-templates
+# start instantly; LangChain, Gemini, WeasyPrint, python-docx and the agents
+# are imported by the code paths that use them.
 from resume_builder.formatters.template_manager import TemplateManager
+from resume_builder.cache.settings import configure_caches
+from resume_builder.pipeline.timing import StageTimer
+from resume_builder.pipeline.tracing import tracer
 
 # Load environment variables from .env file
 load_dotenv()
@@ -275,13 +271,9 @@ def set_api_key(api_key=None):
     
     return api_key
 
-def save_json(data, file_path):
-    """Save data as JSON to a file."""
-    with open(file_path, 'w', encoding='utf-8') as f:
-        json.dump(data, f, indent=2)
-
 def optimize_resume(resume_file_path, job_description, output_format='pdf', output_dir='output', 
-                   api_key=None, skip_ats=False, template_name=None, user_keywords=None):
+                   api_key=None, skip_ats=False, template_name=None, user_keywords=None,
+                   concurrent=True):
     """
     Optimize a resume for a specific job description.
     
@@ -294,100 +286,27 @@ def optimize_resume(resume_file_path, job_description, output_format='pdf', outp
         skip_ats: Skip the ATS optimization step if True
         template_name: Name of the template to use (optional)
         user_keywords: List of keywords provided by the user (optional)
+        concurrent: Parse the resume and analyze the job description at the same time
         
     Returns:
         Path to the generated output file
     """
+    from resume_builder.pipeline.optimize import optimize_resume as run_pipeline
+    
     # Set API key
     api_key = set_api_key(api_key)
     
-    print("Parsing resume...")
-    resume_parser = ResumeParser(api_key=api_key)
-    resume = resume_parser(resume_file_path)
-    
-    print("Analyzing job description...")
-    job_analyzer = JobDescriptionAnalyzer(api_key=api_key)
-    job = job_analyzer(job_description)
-    
-    # Process user keywords if provided
-    selected_keywords = []
-    if user_keywords and len(user_keywords) > 0:
-        from resume_builder.tools.keyword_processor import KeywordProcessor
-        keyword_processor = KeywordProcessor()
-        selected_keywords = keyword_processor({
-            'keywords': user_keywords,
-            'max_count': 10,
-            'job': job
-        })
-        print(f"Selected keywords: {', '.join(selected_keywords)}")
-    
-    print("Generating optimized resume...")
-    resume_generator = ResumeGenerator(api_key=api_key)
-    optimized_resume = resume_generator({
-        'resume': resume, 
-        'job': job,
-        'keywords': selected_keywords
-    })
-    
-    # Create output directory if it doesn't exist
-    os.makedirs(output_dir, exist_ok=True)
-    
-    # Save initial optimized resume JSON for reference
-    initial_json_path = os.path.join(output_dir, "initial_resume.json")
-    save_json(optimized_resume.model_dump(), initial_json_path)
-    print(f"Initial optimized resume JSON saved to: {initial_json_path}")
-    
-    # ATS optimization step
-    if not skip_ats:
-        print("\nOptimizing for ATS...")
-        ats_optimizer = ATSOptimizer(api_key=api_key)
-        optimized_resume = ats_optimizer(optimized_resume, job)
-    
-    # Save final resume JSON
-    json_path = os.path.join(output_dir, "resume.json")
-    save_json(optimized_resume.model_dump(), json_path)
-    print(f"Final resume JSON saved to: {json_path}")
-    
-    if output_format in ['html', 'pdf', 'docx']:
-        # Initialize template manager and get template
-        template_manager = TemplateManager()
-        
-        # Use specified template or default to Harvard
-        template_filename = None
-        if template_name:
-            template_filename = template_manager.get_template_filename(template_name)
-        
-        if not template_filename:
-            template_filename = "harvard.html"  # Default template
-        
-        # Generate HTML
-        html_formatter = HtmlFormatter(template_name=template_filename)
-        html_path = os.path.join(output_dir, "resume.html")
-        html_content = html_formatter.format_resume(optimized_resume, html_path)
-        print(f"Resume HTML saved to: {html_path}")
-        
-        if output_format == 'pdf':
-            # Convert HTML to PDF
-            pdf_converter = PdfConverter()
-            pdf_path = pdf_converter.convert_html_to_pdf(
-                html_file=html_path, 
-                output_path=os.path.join(output_dir, "resume.pdf")
-            )
-            print(f"Resume PDF saved to: {pdf_path}")
-            return pdf_path
-        elif output_format == 'docx':
-            # Convert HTML to DOCX
-            docx_converter = DocxConverter()
-            docx_path = docx_converter.convert_html_to_docx(
-                html_file=html_path,
-                output_path=os.path.join(output_dir, "resume.docx")
-            )
-            print(f"Resume DOCX saved to: {docx_path}")
-            return docx_path
-        
-        return html_path
-    
-    return json_path
+    return run_pipeline(
+        resume_file_path,
+        job_description,
+        output_format=output_format,
+        output_dir=output_dir,
+        api_key=api_key,
+        skip_ats=skip_ats,
+        template_name=template_name,
+        user_keywords=user_keywords,
+        concurrent=concurrent
+    )
 
 def parse_command_line_args():
     """Parse command line arguments."""
@@ -405,24 +324,107 @@ def parse_command_line_args():
     optional_args.add_argument("--format", choices=["pdf", "html", "docx", "json"], default="pdf", 
                         help="Output format (pdf, html, docx, or json)")
     optional_args.add_argument("--output-dir", default="output", help="Directory to save output files")
-    optional_args.add_argument("--mode", choices=["direct", "agent"], default="direct",
-                        help="Running mode (direct or agent-based)")
+    optional_args.add_argument("--mode", choices=["direct", "agent", "serve"], default="direct",
+                        help="Running mode (direct, agent-based, or serve to run the job API server)")
     optional_args.add_argument("--api-key", help="Google API key for Gemini (optional if set in environment or .env file)")
     optional_args.add_argument("--skip-ats", action="store_true", help="Skip the ATS optimization step")
     optional_args.add_argument("--template", help="Template name to use for resume formatting")
     optional_args.add_argument("--keywords", nargs="+", help="Keywords to include in the resume (space-separated)")
     optional_args.add_argument("--list-templates", action="store_true", help="List available resume templates and exit")
+    optional_args.add_argument("--sequential", action="store_true",
+                        help="Parse the resume and analyze the job description one after the other instead of concurrently")
+    optional_args.add_argument("--no-cache", action="store_true", help="Do not read or write cached results")
+    optional_args.add_argument("--refresh", action="store_true",
+                        help="Ignore cached results but store fresh ones (e.g. after editing a resume's parse by hand)")
+    optional_args.add_argument("--keyword-corpus", metavar="CORPUS_DB",
+                        help="SQLite file of the keyword corpus used for local keyword extraction (default: in the cache directory)")
+    optional_args.add_argument("--no-keyword-corpus", action="store_true",
+                        help="Neither add postings to the keyword corpus nor rank keywords against it")
+    optional_args.add_argument("--llm-cache", choices=["disk", "memory", "off"], default="disk",
+                        help="Where to cache model responses to identical prompts (default: disk)")
+    optional_args.add_argument("--rpm", type=float,
+                        help="Maximum model requests per minute across all workers (default: 60)")
+    optional_args.add_argument("--tpm", type=float,
+                        help="Maximum model tokens per minute across all workers (default: 1000000)")
+    optional_args.add_argument("--ats-target", type=float,
+                        help="ATS score at which optimization stops (default: 90)")
+    optional_args.add_argument("--ats-max-llm-calls", type=int,
+                        help="Model calls allowed per resume once local ATS edits stop improving the score (default: 1)")
+    optional_args.add_argument("--ats-max-seconds", type=float,
+                        help="Wall time allowed for ATS optimization per resume (default: 120)")
+    optional_args.add_argument("--local-parse", action="store_true",
+                        help="Parse resumes with the local pre-parser only, without calling the model (works offline)")
+    optional_args.add_argument("--pdf-layout", action="store_true",
+                        help="Extract resume text with its page layout (columns, indented bullets) kept")
+    optional_args.add_argument("--section-parse-chars", type=int,
+                        help="Extract resumes with at least this many characters of text section by section, concurrently (default: 12000, 0 for all)")
+    optional_args.add_argument("--trace", metavar="TRACE_JSON",
+                        help="Write a Chrome trace (chrome://tracing or Perfetto) of stages, model calls and formatters to this file")
+    
+    # Batch arguments
+    batch_args = parser.add_argument_group('batch arguments')
+    batch_args.add_argument("--jobs-dir", help="Directory of job description text files to tailor the resume to")
+    batch_args.add_argument("--jobs-jsonl", help="JSONL feed of job descriptions to tailor the resume to")
+    batch_args.add_argument("--workers", type=int, default=4, help="Number of jobs or resumes to process at the same time in batch mode")
+    batch_args.add_argument("--resumes-dir", help="Directory of candidate PDF resumes to rank against --job")
+    batch_args.add_argument("--top-k", type=int, default=10, help="Number of candidates to keep on the leaderboard when screening")
+    batch_args.add_argument("--generate", action="store_true",
+                        help="Also generate tailored resumes for the leaderboard when screening with --resumes-dir")
+    batch_args.add_argument("--train-keywords", action="store_true",
+                        help="Add the postings from --job/--jobs-dir/--jobs-jsonl to the local keyword corpus and exit")
+    batch_args.add_argument("--queue", metavar="QUEUE_DB",
+                        help="Queue the jobs in this SQLite database and process everything pending in it; "
+                             "rerun with the same path to resume after a crash")
+    batch_args.add_argument("--max-attempts", type=int, default=3,
+                        help="Attempts per queued job before it is marked as failed (default: 3)")
+    batch_args.add_argument("--retry-failed", action="store_true",
+                        help="Give failed jobs in the --queue database a fresh set of attempts")
+    
+    # Server arguments
+    serve_args = parser.add_argument_group('server arguments (--mode serve)')
+    serve_args.add_argument("--host", default="127.0.0.1", help="Address to serve the job API on (default: 127.0.0.1)")
+    serve_args.add_argument("--port", type=int, default=8765, help="Port to serve the job API on (default: 8765)")
+    serve_args.add_argument("--socket", help="Serve the job API on this Unix socket path instead of a TCP port")
     
     args = parser.parse_args()
     
     # Check if required arguments are missing when not listing templates
-    if not args.list_templates and (args.resume is None or args.job is None):
-        if args.resume is None:
-            parser.error("the --resume argument is required unless using --list-templates")
-        if args.job is None:
-            parser.error("the --job argument is required unless using --list-templates")
+    has_resumes = args.resume is not None or args.resumes_dir is not None
+    has_jobs = args.job is not None or args.jobs_dir is not None or args.jobs_jsonl is not None
+    resuming_queue = args.queue is not None and not has_resumes and not has_jobs
+    if args.train_keywords and not has_jobs:
+        parser.error("--train-keywords needs postings from --job, --jobs-dir or --jobs-jsonl")
+    needs_resume = not (args.list_templates or args.train_keywords or resuming_queue or args.mode == "serve")
+    if needs_resume and (not has_resumes or not has_jobs):
+        if not has_resumes:
+            parser.error("the --resume argument (or --resumes-dir) is required unless using --list-templates")
+        if not has_jobs:
+            parser.error("the --job argument (or --jobs-dir/--jobs-jsonl) is required unless using --list-templates")
+    if args.resumes_dir and args.job is None:
+        parser.error("--resumes-dir screens resumes against a single --job")
+    if args.queue and args.resumes_dir:
+        parser.error("--queue tailors one --resume to jobs; it cannot be combined with --resumes-dir")
     
     return args
+
+def run_server_mode(args):
+    """Serve optimize jobs over HTTP from one warm process."""
+    from resume_builder.server.jobs import JobManager, warm_up
+    from resume_builder.server.api import run_server
+    
+    api_key = set_api_key(args.api_key)
+    configure_runtime(args)
+    
+    print("Warming up models, templates and converters...")
+    warm_up()
+    
+    manager = JobManager(
+        output_dir=os.path.join(args.output_dir, "jobs"),
+        max_workers=args.workers,
+        api_key=api_key
+    )
+    run_server(manager, host=args.host, port=args.port, socket_path=args.socket)
+
 # Modified function in main.py
 
 def list_available_templates():
@@ -458,6 +460,39 @@ def list_available_templates():
         except Exception as e:
             print(f"Error listing directories: {str(e)}")
             
+def train_keyword_corpus(args):
+    """Add job postings to the corpus used for local keyword extraction."""
+    from resume_builder.pipeline.batch import load_job_descriptions
+    from resume_builder.matching.keyword_extractor import get_keyword_extractor
+    
+    postings = []
+    if args.jobs_dir or args.jobs_jsonl:
+        postings = (text for _, text in load_job_descriptions(jobs_dir=args.jobs_dir, jobs_jsonl=args.jobs_jsonl))
+    if args.job:
+        with open(args.job, 'r', encoding='utf-8') as f:
+            postings = [f.read()] + list(postings)
+    
+    corpus = get_keyword_extractor().corpus
+    added = corpus.add_many(postings)
+    document_count, average_length = corpus.stats()
+    print(f"Added {added} new posting(s) to the keyword corpus: {corpus.db_path}")
+    print(f"The corpus now holds {document_count} postings ({average_length:.0f} words on average)")
+
+def configure_runtime(args):
+    """Configure the caches, keyword corpus, model rate limits, resume parsing and ATS optimization budget from the command-line arguments."""
+    from resume_builder.cache.response_cache import configure_response_cache
+    from resume_builder.llm.scheduler import configure_rate_limits
+    from resume_builder.matching.keyword_extractor import configure_keyword_corpus
+    from resume_builder.tools.ats_optimizer import configure_optimization_budget
+    from resume_builder.tools.resume_parser import configure_parsing
+    
+    configure_caches(enabled=not args.no_cache, refresh=args.refresh)
+    configure_response_cache(args.llm_cache)
+    configure_keyword_corpus(enabled=not args.no_keyword_corpus, path=args.keyword_corpus)
+    configure_rate_limits(args.rpm, args.tpm)
+    configure_optimization_budget(args.ats_max_llm_calls, args.ats_max_seconds, args.ats_target)
+    configure_parsing(local_only=args.local_parse, layout=args.pdf_layout, sectioned_min_chars=args.section_parse_chars)
+
 def main():
     """Direct mode for resume optimization."""
     args = parse_command_line_args()
@@ -467,6 +502,77 @@ def main():
         list_available_templates()
         return
     
+    configure_runtime(args)
+    
+    # Rank every resume in a directory against one job description
+    if args.resumes_dir:
+        from resume_builder.pipeline.screening import run_resume_screening
+        with open(args.job, 'r', encoding='utf-8') as f:
+            job_description = f.read()
+        leaderboard_path = run_resume_screening(
+            resumes_dir=args.resumes_dir,
+            job_description=job_description,
+            output_dir=args.output_dir,
+            api_key=set_api_key(args.api_key),
+            top_k=args.top_k,
+            max_workers=args.workers,
+            generate=args.generate,
+            output_format=args.format,
+            template_name=args.template,
+            skip_ats=args.skip_ats
+        )
+        print(f"\nResume screening complete! Leaderboard saved to: {leaderboard_path}")
+        return
+    
+    # Update the keyword corpus with more postings
+    if args.train_keywords:
+        train_keyword_corpus(args)
+        return
+    
+    # Queue the jobs durably and work through everything pending in the queue
+    if args.queue:
+        from resume_builder.pipeline.batch import load_job_descriptions
+        from resume_builder.pipeline.job_queue import run_job_queue
+        jobs = []
+        if args.jobs_dir or args.jobs_jsonl:
+            jobs = load_job_descriptions(jobs_dir=args.jobs_dir, jobs_jsonl=args.jobs_jsonl)
+        elif args.job:
+            with open(args.job, 'r', encoding='utf-8') as f:
+                jobs = [(os.path.splitext(os.path.basename(args.job))[0], f.read())]
+        summary_path = run_job_queue(
+            db_path=args.queue,
+            jobs=jobs,
+            resume_file_path=args.resume,
+            output_dir=args.output_dir,
+            api_key=set_api_key(args.api_key),
+            output_format=args.format,
+            template_name=args.template,
+            user_keywords=args.keywords,
+            skip_ats=args.skip_ats,
+            max_workers=args.workers,
+            max_attempts=args.max_attempts,
+            retry_failed=args.retry_failed
+        )
+        print(f"\nQueue processing complete! Summary saved to: {summary_path}")
+        return
+    
+    # Tailor the resume to every job in a directory or JSONL feed
+    if args.jobs_dir or args.jobs_jsonl:
+        from resume_builder.pipeline.batch import load_job_descriptions, run_job_batch
+        summary_path = run_job_batch(
+            resume_file_path=args.resume,
+            jobs=load_job_descriptions(jobs_dir=args.jobs_dir, jobs_jsonl=args.jobs_jsonl),
+            output_dir=args.output_dir,
+            api_key=set_api_key(args.api_key),
+            output_format=args.format,
+            template_name=args.template,
+            user_keywords=args.keywords,
+            skip_ats=args.skip_ats,
+            max_workers=args.workers
+        )
+        print(f"\nBatch optimization complete! Summary saved to: {summary_path}")
+        return
+    
     # Read job description from file
     with open(args.job, 'r', encoding='utf-8') as f:
         job_description = f.read()
@@ -480,15 +586,25 @@ def main():
         api_key=args.api_key,
         skip_ats=args.skip_ats,
         template_name=args.template,
-        user_keywords=args.keywords
+        user_keywords=args.keywords,
+        concurrent=not args.sequential
     )
     
     print(f"\nResume optimization complete! Output saved to: {output_path}")
 
 def run_with_agent(args):
     """Run the resume optimizer using the ReAct agent."""
+    from resume_builder.agent.react_agent import create_resume_agent
+    from resume_builder.tools.resume_parser import ResumeParser
+    from resume_builder.tools.job_analyzer import JobDescriptionAnalyzer
+    from resume_builder.tools.resume_generator import ResumeGenerator
+    from resume_builder.formatters.html_formatter import HtmlFormatter
+    from resume_builder.pipeline.outputs import save_json
+    from resume_builder.pipeline.stages import parse_and_analyze
+    
     # Set API key
     api_key = set_api_key(args.api_key)
+    configure_runtime(args)
     
     # Read job description from file
     with open(args.job, 'r', encoding='utf-8') as f:
@@ -516,11 +632,16 @@ def run_with_agent(args):
     
     try:
         # Parse the resume and job
-        resume_parser = ResumeParser(api_key=api_key)
-        resume = resume_parser(args.resume)
-        
-        job_analyzer = JobDescriptionAnalyzer(api_key=api_key)
-        job = job_analyzer(job_description)
+        timer = StageTimer()
+        resume, job = parse_and_analyze(
+            ResumeParser(api_key=api_key),
+            JobDescriptionAnalyzer(api_key=api_key),
+            args.resume,
+            job_description,
+            concurrent=not args.sequential,
+            timer=timer
+        )
+        timer.report()
         
         # Process user keywords if provided
         selected_keywords = []
@@ -549,6 +670,8 @@ def run_with_agent(args):
         # Run ATS optimization if not skipped
         if not args.skip_ats:
             print("\nRunning ATS Optimization Agent...")
+            from resume_builder.agent.ats_agent import create_ats_optimization_agent
+            from resume_builder.tools.ats_optimizer import ATSOptimizer
             ats_agent = create_ats_optimization_agent(model_name="gemini-1.5-pro", verbose=True, api_key=api_key)
             
             ats_result = ats_agent.invoke({
@@ -584,6 +707,7 @@ def run_with_agent(args):
         
         # Generate the requested format
         if args.format == "pdf":
+            from resume_builder.formatters.pdf_converter import PdfConverter
             pdf_converter = PdfConverter()
             output_path = pdf_converter.convert_html_to_pdf(
                 html_file=html_path,
@@ -591,6 +715,7 @@ def run_with_agent(args):
             )
             print(f"\nResume PDF saved to: {output_path}")
         elif args.format == "docx":
+            from resume_builder.formatters.docx_converter import DocxConverter
             docx_converter = DocxConverter()
             output_path = docx_converter.convert_html_to_docx(
                 html_file=html_path,
@@ -614,7 +739,17 @@ if __name__ == "__main__":
     
     args = parse_command_line_args()
     
-    if args.mode == "agent":
-        run_with_agent(args)
-    else:
-        main()
\ No newline at end of file
+    if args.trace:
+        print(f"Tracing run {tracer.start()}")
+    
+    try:
+        with tracer.span(f"{args.mode} run", "run"):
+            if args.mode == "agent":
+                run_with_agent(args)
+            elif args.mode == "serve":
+                run_server_mode(args)
+            else:
+                main()
+    finally:
+        if args.trace:
+            print(f"Trace saved to: {tracer.save(args.trace)}")
\ No newline at end of file
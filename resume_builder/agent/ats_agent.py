@@ -2,11 +2,11 @@ import os
 from langchain.agents import AgentExecutor, create_react_agent
 from langchain.tools import Tool
 from langchain.prompts import PromptTemplate
-from langchain_google_genai import ChatGoogleGenerativeAI
 
 from resume_builder.tools.ats_optimizer import ATSOptimizer
 from resume_builder.models.resume import Resume
 from resume_builder.models.job import JobDescription
+from resume_builder.llm.clients import get_chat_model
 
 def create_ats_optimization_agent(model_name="gemini-1.5-pro", verbose=True, api_key=None):
     """Create a ReAct agent for ATS optimization."""
@@ -29,7 +29,7 @@ def create_ats_optimization_agent(model_name="gemini-1.5-pro", verbose=True, api
     ]
     
     # Create the React agent
-    llm = ChatGoogleGenerativeAI(model=model_name, temperature=0)
+    llm = get_chat_model(model_name, temperature=0)
     
     agent_prompt = """You are an AI assistant specialized in optimizing resumes to pass Applicant Tracking Systems (ATS).
     Your goal is to help job seekers improve their resumes to maximize their chances of getting past automated resume screening systems.
@@ -2,12 +2,12 @@ import os
 from langchain.agents import AgentExecutor, create_react_agent
 from langchain.tools import Tool
 from langchain.prompts import PromptTemplate
-from langchain_google_genai import ChatGoogleGenerativeAI
 
 from resume_builder.tools.resume_parser import ResumeParser
 from resume_builder.tools.job_analyzer import JobDescriptionAnalyzer
 from resume_builder.tools.resume_generator import ResumeGenerator
 from resume_builder.tools.keyword_processor import KeywordProcessor  # New tool
+from resume_builder.llm.clients import get_chat_model
 
 def create_resume_agent(model_name="gemini-1.5-pro", verbose=True, api_key=None):
     """Create a ReAct agent for resume optimization."""
@@ -48,7 +48,7 @@ def create_resume_agent(model_name="gemini-1.5-pro", verbose=True, api_key=None)
     ]
     
     # Create the React agent
-    llm = ChatGoogleGenerativeAI(model=model_name, temperature=0)
+    llm = get_chat_model(model_name, temperature=0)
     
     agent_prompt = """You are an AI assistant specialized in resume optimization. Your goal is to help job seekers tailor their resumes to specific job descriptions to maximize their chances of getting interviews.
 
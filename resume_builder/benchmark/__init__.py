@@ -0,0 +1,2 @@
+"""Resume benchmark package."""
+# This file makes the benchmark directory a Python package
\ No newline at end of file
@@ -0,0 +1,5 @@
+import sys
+
+from resume_builder.benchmark.suite import main
+
+sys.exit(main())
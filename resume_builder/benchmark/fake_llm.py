@@ -0,0 +1,91 @@
+import json
+import time
+import random
+import threading
+from typing import Any, Dict, List, Optional
+
+from langchain_core.language_models import BaseChatModel
+from langchain_core.messages import AIMessage, BaseMessage
+from langchain_core.outputs import ChatGeneration, ChatResult
+from pydantic import Field, PrivateAttr
+
+# Text that identifies each tool's prompt, mapped to the canned response it gets
+PROMPT_ROUTES = [
+    ("Extract important keywords", "keywords"),
+    ("Optimize this resume summary", "ats"),
+    ("Analyze the following job description", "job"),
+    ("professional resume writer", "resume"),
+    ("Extract the following information from the resume text", "resume"),
+]
+
+def route_prompt(prompt: str) -> str:
+    """Get the canned response name for a prompt, defaulting to a resume."""
+    for marker, route in PROMPT_ROUTES:
+        if marker in prompt:
+            return route
+    return "resume"
+
+class FakeChatModel(BaseChatModel):
+    """
+    Deterministic stand-in for Gemini that answers with canned JSON.
+
+    Each call sleeps for latency seconds plus a uniform jitter of up to
+    +/- jitter seconds drawn from a seeded generator, so benchmark runs are
+    repeatable and spend no API quota.
+    """
+
+    responses: Dict[str, str] = Field(default_factory=dict)
+    latency: float = 0.0
+    jitter: float = 0.0
+    seed: int = 0
+    model: str = "fake-gemini"
+    temperature: Optional[float] = None
+    _rng: Any = PrivateAttr(default=None)
+    _lock: Any = PrivateAttr(default=None)
+
+    def model_post_init(self, __context: Any):
+        self._rng = random.Random(self.seed)
+        self._lock = threading.Lock()
+
+    @property
+    def _llm_type(self) -> str:
+        return "fake-chat"
+
+    @property
+    def _identifying_params(self) -> Dict[str, Any]:
+        return {"model": self.model, "temperature": self.temperature}
+
+    def _delay(self) -> float:
+        if not self.jitter:
+            return self.latency
+        with self._lock:
+            offset = self._rng.uniform(-self.jitter, self.jitter)
+        return max(0.0, self.latency + offset)
+
+    def _generate(self, messages: List[BaseMessage], stop: Optional[List[str]] = None,
+                  run_manager=None, **kwargs: Any) -> ChatResult:
+        prompt = "\n".join(str(message.content) for message in messages)
+        text = self.responses.get(route_prompt(prompt), "{}")
+
+        delay = self._delay()
+        if delay:
+            time.sleep(delay)
+
+        usage = {
+            "input_tokens": len(prompt) // 4,
+            "output_tokens": len(text) // 4,
+            "total_tokens": (len(prompt) + len(text)) // 4
+        }
+        return ChatResult(generations=[ChatGeneration(message=AIMessage(content=text, usage_metadata=usage))])
+
+def canned_responses(resume_dict: Dict[str, Any], job_dict: Dict[str, Any], keywords: List[str]) -> Dict[str, str]:
+    """Build the canned response for each prompt route from a sample resume, job and keyword list."""
+    return {
+        "resume": json.dumps(resume_dict),
+        "job": json.dumps(job_dict),
+        "keywords": json.dumps(keywords),
+        "ats": json.dumps({
+            "summary": resume_dict["summary"] + " Experienced with " + ", ".join(keywords[:3]) + ".",
+            "skills": keywords[:5]
+        })
+    }
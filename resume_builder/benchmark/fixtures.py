@@ -0,0 +1,116 @@
+from typing import List
+
+from resume_builder.models.resume import Resume
+from resume_builder.models.job import JobDescription
+
+SKILL_POOL = [
+    "Python", "Java", "Go", "SQL", "Docker", "Kubernetes", "AWS", "GCP", "Terraform", "React",
+    "TypeScript", "PostgreSQL", "Redis", "Kafka", "Spark", "Airflow", "Pandas", "Machine Learning",
+    "CI/CD", "Linux", "GraphQL", "REST APIs", "Microservices", "Agile"
+]
+
+LINES_PER_PAGE = 48
+
+def _skills(count: int, offset: int = 0) -> List[str]:
+    return [SKILL_POOL[(offset + i) % len(SKILL_POOL)] + ("" if i < len(SKILL_POOL) else f" {i // len(SKILL_POOL)}")
+            for i in range(count)]
+
+def make_resume(size: int = 1) -> Resume:
+    """Build a synthetic resume whose sections grow linearly with size."""
+    return Resume.model_validate({
+        "contact": {"name": "Jordan Smith", "email": "jordan@example.com", "phone": "555-0100",
+                    "linkedin": "linkedin.com/in/jordansmith"},
+        "summary": "Backend engineer building reliable data platforms and APIs. " * size,
+        "skills": {"technical": _skills(6 * size), "soft": ["Communication", "Mentoring"]},
+        "experience": [
+            {
+                "title": f"Software Engineer {i + 1}",
+                "company": f"Company {i + 1}",
+                "location": "Remote",
+                "duration": f"{2010 + i} - {2011 + i}",
+                "responsibilities": [
+                    f"Built {skill} services handling production traffic for team {i + 1}"
+                    for skill in _skills(4, offset=i)
+                ],
+                "achievements": [f"Reduced latency by {10 + i}% across {i + 2} services"]
+            }
+            for i in range(2 * size)
+        ],
+        "education": [{"degree": "BSc Computer Science", "institution": "State University", "year": "2009"}],
+        "projects": [
+            {"name": f"Project {i + 1}", "description": "Open-source data pipeline tooling",
+             "technologies": _skills(3, offset=i)}
+            for i in range(size)
+        ],
+        "certifications": ["AWS Certified Developer"]
+    })
+
+def make_job(size: int = 1) -> JobDescription:
+    """Build a synthetic job description whose requirements grow linearly with size."""
+    return JobDescription(
+        title="Senior Backend Engineer",
+        company="Example Corp",
+        location="Remote",
+        required_skills=_skills(4 * size, offset=2),
+        preferred_skills=_skills(2 * size, offset=10),
+        key_responsibilities=[f"Design and operate service {i + 1} at scale" for i in range(3 * size)],
+        experience_years="5+"
+    )
+
+def make_keywords(size: int = 1) -> List[str]:
+    """Build an ATS keyword list (25 per size step, every third one multi-word) for scoring benchmarks."""
+    return [f"{skill} {other.split()[0]}" if i % 3 == 0 else skill
+            for i, (skill, other) in enumerate(zip(_skills(25 * size), _skills(25 * size, offset=7)))]
+
+def job_text(job: JobDescription) -> str:
+    """Render a job description as the posting text a user would paste in."""
+    lines = [f"{job.title} at {job.company} ({job.location})", "", "Requirements:"]
+    lines += [f"- {skill}" for skill in job.required_skills]
+    lines += ["", "Nice to have:"] + [f"- {skill}" for skill in job.preferred_skills]
+    lines += ["", "Responsibilities:"] + [f"- {item}" for item in job.key_responsibilities]
+    return "\n".join(lines)
+
+def resume_lines(resume: Resume) -> List[str]:
+    """Render a resume as plain text lines."""
+    lines = [resume.contact.name, resume.contact.email, "", "Summary", resume.summary, "", "Experience"]
+    for experience in resume.experience:
+        lines.append(f"{experience.title}, {experience.company} ({experience.duration})")
+        lines += [f"- {item}" for item in experience.responsibilities]
+    lines += ["", "Skills", ", ".join(resume.skills.technical)]
+    return lines
+
+def _pdf_escape(text: str) -> str:
+    return text.replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)").encode('latin-1', 'replace').decode('latin-1')
+
+def write_resume_pdf(resume: Resume, file_path: str) -> str:
+    """Write a plain text PDF of a resume (no third-party PDF writer needed)."""
+    lines = [line[i:i + 90] for line in resume_lines(resume) for i in range(0, max(len(line), 1), 90)]
+    pages = [lines[i:i + LINES_PER_PAGE] for i in range(0, len(lines), LINES_PER_PAGE)] or [[]]
+
+    # Objects: 1 catalog, 2 page tree, 3 font, then a page and a content stream per page
+    page_ids = [4 + 2 * i for i in range(len(pages))]
+    objects = [
+        "<< /Type /Catalog /Pages 2 0 R >>",
+        f"<< /Type /Pages /Kids [{' '.join(f'{page_id} 0 R' for page_id in page_ids)}] /Count {len(pages)} >>",
+        "<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>"
+    ]
+    for page_id, page_lines in zip(page_ids, pages):
+        content = "BT /F1 10 Tf 50 760 Td 14 TL " + " ".join(f"({_pdf_escape(line)}) Tj T*" for line in page_lines) + " ET"
+        objects.append(f"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] /Contents {page_id + 1} 0 R "
+                       f"/Resources << /Font << /F1 3 0 R >> >> >>")
+        objects.append(f"<< /Length {len(content)} >>\nstream\n{content}\nendstream")
+
+    output = "%PDF-1.4\n"
+    offsets = []
+    for number, body in enumerate(objects, 1):
+        offsets.append(len(output))
+        output += f"{number} 0 obj\n{body}\nendobj\n"
+
+    xref_offset = len(output)
+    output += f"xref\n0 {len(objects) + 1}\n0000000000 65535 f \n"
+    output += "".join(f"{offset:010d} 00000 n \n" for offset in offsets)
+    output += f"trailer\n<< /Size {len(objects) + 1} /Root 1 0 R >>\nstartxref\n{xref_offset}\n%%EOF\n"
+
+    with open(file_path, 'w', encoding='latin-1') as f:
+        f.write(output)
+    return file_path
@@ -0,0 +1,157 @@
+import os
+import sys
+import json
+import atexit
+import runpy
+import argparse
+import tempfile
+import subprocess
+from typing import Any, Dict, List, Optional
+
+# Keep this module's imports light: it is also the wrapper that every timed
+# child process starts with, so anything imported here counts towards startup time.
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+RSS_MARKER = "startup-benchmark-peak-rss-kb="
+
+# CLI paths that need a chat model get the fake one; the others must not import it
+CLI_PATHS = ["help", "list-templates", "direct", "batch", "screening"]
+MODEL_PATHS = {"direct", "batch", "screening"}
+
+def _peak_rss_kb() -> int:
+    # Linux carries ru_maxrss over from the parent across fork/exec, so prefer
+    # the high-water mark of this process's own memory map when it is available
+    try:
+        with open("/proc/self/status", 'r', encoding='utf-8') as f:
+            for line in f:
+                if line.startswith("VmHWM:"):
+                    return int(line.split()[1])
+    except OSError:
+        pass
+
+    import resource
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macOS and kilobytes on Linux
+    return peak // 1024 if sys.platform == "darwin" else peak
+
+def _report_peak_rss():
+    sys.stderr.write(f"\n{RSS_MARKER}{_peak_rss_kb()}\n")
+
+def run_child(argv: List[str], fake_llm: bool):
+    """Run main.py in this process as the CLI would, optionally against the fake chat model."""
+    if os.name != "nt":
+        atexit.register(_report_peak_rss)
+
+    if fake_llm:
+        from resume_builder.benchmark.fake_llm import FakeChatModel, canned_responses
+        from resume_builder.benchmark.fixtures import make_resume, make_job
+        from resume_builder.llm.clients import chat_models
+
+        job = make_job(1)
+        responses = canned_responses(make_resume(1).model_dump(), job.model_dump(), job.required_skills)
+        chat_models.set_factory(lambda model_name, temperature, cache: FakeChatModel(
+            responses=responses, model=model_name, temperature=temperature, cache=cache))
+        os.environ.setdefault("GOOGLE_API_KEY", "startup-benchmark")
+
+    sys.argv = ["main.py"] + argv
+    sys.path.insert(0, PROJECT_ROOT)
+    runpy.run_path(os.path.join(PROJECT_ROOT, "main.py"), run_name="__main__")
+
+def prepare_inputs(work_dir: str) -> Dict[str, List[str]]:
+    """Write the sample inputs and build the main.py arguments for each CLI path."""
+    from resume_builder.benchmark.fixtures import make_resume, make_job, job_text, write_resume_pdf
+
+    resume = make_resume(1)
+    resumes_dir = os.path.join(work_dir, "resumes")
+    jobs_dir = os.path.join(work_dir, "jobs")
+    os.makedirs(resumes_dir, exist_ok=True)
+    os.makedirs(jobs_dir, exist_ok=True)
+
+    resume_path = write_resume_pdf(resume, os.path.join(resumes_dir, "candidate_1.pdf"))
+    write_resume_pdf(resume, os.path.join(resumes_dir, "candidate_2.pdf"))
+    job_path = os.path.join(work_dir, "job.txt")
+    for path in (job_path, os.path.join(jobs_dir, "job_1.txt"), os.path.join(jobs_dir, "job_2.txt")):
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(job_text(make_job(1)))
+
+    common = ["--no-cache", "--format", "json", "--output-dir", os.path.join(work_dir, "output")]
+    return {
+        "help": ["--help"],
+        "list-templates": ["--list-templates"],
+        "direct": ["--resume", resume_path, "--job", job_path] + common,
+        "batch": ["--resume", resume_path, "--jobs-dir", jobs_dir, "--workers", "2"] + common,
+        "screening": ["--resumes-dir", resumes_dir, "--job", job_path, "--workers", "2"] + common
+    }
+
+def time_cli_path(name: str, argv: List[str], iterations: int = 5) -> Dict[str, Any]:
+    """Time cold starts of one CLI path, each in a fresh interpreter."""
+    from resume_builder.benchmark.suite import measure
+
+    command = [sys.executable, "-m", "resume_builder.benchmark.startup", "--child"]
+    if name in MODEL_PATHS:
+        command.append("--fake-llm")
+    command += ["--"] + argv
+
+    peaks = []
+
+    def run_once():
+        completed = subprocess.run(command, cwd=PROJECT_ROOT, capture_output=True, text=True)
+        if completed.returncode != 0:
+            lines = [line for line in completed.stderr.splitlines() if line.strip() and RSS_MARKER not in line]
+            raise RuntimeError(lines[-1] if lines else f"exit status {completed.returncode}")
+        for line in completed.stderr.splitlines():
+            if line.startswith(RSS_MARKER):
+                peaks.append(int(line[len(RSS_MARKER):]))
+
+    try:
+        result = measure(f"startup:{name}", 0, run_once, iterations=iterations)
+    except RuntimeError as e:
+        return {"name": f"startup:{name}", "size": 0, "skipped": str(e)}
+
+    result["peak_rss_mb"] = round(max(peaks) / 1024, 1) if peaks else None
+    return result
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Cold-start time of each Resume Builder CLI path")
+    parser.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    parser.add_argument("--fake-llm", action="store_true", help=argparse.SUPPRESS)
+    parser.add_argument("--paths", nargs="+", choices=CLI_PATHS, default=CLI_PATHS, help="CLI paths to time")
+    parser.add_argument("--iterations", type=int, default=5, help="Cold starts per path")
+    parser.add_argument("--save-baseline", metavar="JSON", help="Save the results as a baseline file")
+    parser.add_argument("--compare", metavar="JSON", help="Compare the results against a baseline file")
+    parser.add_argument("--tolerance", type=float, default=0.10,
+                        help="Allowed slowdown before a regression is reported (default: 0.10)")
+    args, child_argv = parser.parse_known_args(argv)
+
+    if args.child:
+        run_child([arg for arg in child_argv if arg != "--"], args.fake_llm)
+        return 0
+
+    from resume_builder.benchmark.suite import format_result, save_baseline, compare_to_baseline
+
+    print(f"Timing cold starts ({args.iterations} per path, model calls answered by a fake chat model)")
+    results = []
+    with tempfile.TemporaryDirectory() as work_dir:
+        inputs = prepare_inputs(work_dir)
+        for name in args.paths:
+            result = time_cli_path(name, inputs[name], args.iterations)
+            print(format_result(result))
+            results.append(result)
+
+    if args.save_baseline:
+        settings = {"paths": args.paths, "iterations": args.iterations}
+        print(f"\nBaseline saved to: {save_baseline(results, args.save_baseline, settings)}")
+
+    if args.compare:
+        with open(args.compare, 'r', encoding='utf-8') as f:
+            regressions = compare_to_baseline(results, json.load(f), args.tolerance)
+        if regressions:
+            print(f"\n{len(regressions)} regression(s) beyond {args.tolerance:.0%}:")
+            for regression in regressions:
+                print(f"  {regression}")
+            return 1
+
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
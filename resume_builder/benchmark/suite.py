@@ -0,0 +1,334 @@
+import io
+import os
+import sys
+import json
+import time
+import argparse
+import platform
+import tempfile
+from contextlib import redirect_stdout
+from typing import Any, Callable, Dict, List, Optional
+
+from resume_builder.benchmark.fake_llm import FakeChatModel, canned_responses
+from resume_builder.benchmark.fixtures import make_resume, make_job, make_keywords, job_text, write_resume_pdf
+from resume_builder.cache.settings import configure_caches
+from resume_builder.cache.response_cache import configure_response_cache
+from resume_builder.cache.page_text_cache import PageTextCache
+from resume_builder.llm.clients import chat_models
+
+try:
+    import resource
+except ImportError:  # Not available on Windows
+    resource = None
+
+DEFAULT_SIZES = [1, 4, 16]
+DEFAULT_BATCH_SIZES = [1, 4, 16]
+DEFAULT_TOLERANCE = 0.10
+
+TOOL_BENCHMARKS = [
+    "pdf_loader", "pdf_text", "pdf_text_cached", "resume_parser", "job_analyzer", "resume_generator", "ats_optimizer", "ats_score", "ats_score_jobs",
+    "html_formatter", "pdf_converter", "docx_converter", "optimize_resume"
+]
+
+def percentile(values: List[float], fraction: float) -> float:
+    """Linearly interpolated percentile of a list of values (fraction between 0 and 1)."""
+    ordered = sorted(values)
+    if not ordered:
+        return 0.0
+    position = (len(ordered) - 1) * fraction
+    lower = int(position)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (position - lower)
+
+def peak_rss_mb() -> Optional[float]:
+    """Peak resident set size of this process so far, in MB."""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macOS and kilobytes on Linux
+    return round(peak / (1024 * 1024 if sys.platform == "darwin" else 1024), 1)
+
+def measure(name: str, size: int, func: Callable[[], Any], iterations: int = 5, warmup: int = 1,
+            ops_per_call: int = 1) -> Dict[str, Any]:
+    """
+    Time repeated calls of func with tool output suppressed.
+
+    Returns:
+        Dictionary with ops/sec, p50/p95/mean latency per call in ms and peak RSS
+    """
+    with redirect_stdout(io.StringIO()):
+        for _ in range(warmup):
+            func()
+
+        latencies = []
+        started = time.perf_counter()
+        for _ in range(iterations):
+            start = time.perf_counter()
+            func()
+            latencies.append(time.perf_counter() - start)
+        elapsed = time.perf_counter() - started
+
+    return {
+        "name": name,
+        "size": size,
+        "ops": iterations * ops_per_call,
+        "ops_per_sec": round(iterations * ops_per_call / elapsed, 2) if elapsed else 0.0,
+        "p50_ms": round(percentile(latencies, 0.50) * 1000, 2),
+        "p95_ms": round(percentile(latencies, 0.95) * 1000, 2),
+        "mean_ms": round(sum(latencies) / len(latencies) * 1000, 2),
+        "peak_rss_mb": peak_rss_mb()
+    }
+
+class PipelineBenchmark:
+    """
+    Benchmark the tools and the full pipeline offline against a fake chat model.
+
+    Every tool gets its model from the shared client registry, so installing a
+    FakeChatModel factory there runs the real parsing, prompting, JSON
+    handling, scoring and rendering code with no network calls. Caches are
+    disabled so each iteration does the full amount of work.
+    """
+
+    def __init__(self, latency: float = 0.0, jitter: float = 0.0, seed: int = 0, iterations: int = 5,
+                 workers: int = 4):
+        self.latency = latency
+        self.jitter = jitter
+        self.seed = seed
+        self.iterations = iterations
+        self.workers = workers
+
+    def _install_fake_model(self, resume, job):
+        keywords = job.required_skills + job.preferred_skills
+        responses = canned_responses(resume.model_dump(), job.model_dump(), keywords)
+
+        def factory(model_name, temperature, cache):
+            return FakeChatModel(responses=responses, latency=self.latency, jitter=self.jitter, seed=self.seed,
+                                 model=model_name, temperature=temperature, cache=cache)
+
+        chat_models.set_factory(factory)
+
+    def _tool_cases(self, size: int, work_dir: str) -> Dict[str, Callable[[], Any]]:
+        """Build the function timed by each tool benchmark at one input size."""
+        from resume_builder.tools.resume_parser import ResumeParser
+        from resume_builder.tools.job_analyzer import JobDescriptionAnalyzer
+        from resume_builder.tools.resume_generator import ResumeGenerator
+        from resume_builder.tools.ats_optimizer import ATSOptimizer
+        from resume_builder.tools.pdf_text import extract_pdf_text
+
+        resume = make_resume(size)
+        job = make_job(size)
+        posting = job_text(job)
+        keywords = make_keywords(size)
+        # A feed of 100 jobs whose keyword sets overlap, as postings for similar roles do
+        keyword_sets = {f"job_{i}": keywords[i % 5::2] for i in range(100)}
+        self._install_fake_model(resume, job)
+
+        pdf_path = write_resume_pdf(resume, os.path.join(work_dir, f"resume_{size}.pdf"))
+        html_path = os.path.join(work_dir, f"resume_{size}.html")
+
+        def html_formatter():
+            from resume_builder.formatters.html_formatter import HtmlFormatter
+            return HtmlFormatter().format_resume(resume, html_path)
+
+        def pdf_converter():
+            from resume_builder.formatters.pdf_converter import PdfConverter
+            return PdfConverter().convert_html_to_pdf(html_file=html_path,
+                                                      output_path=os.path.join(work_dir, f"converted_{size}.pdf"))
+
+        def docx_converter():
+            from resume_builder.formatters.docx_converter import DocxConverter
+            return DocxConverter().convert_html_to_docx(html_file=html_path,
+                                                        output_path=os.path.join(work_dir, f"resume_{size}.docx"))
+
+        def pdf_loader():
+            # The langchain loader resumes were read with before the direct pypdf path, for comparison
+            from langchain_community.document_loaders import PyPDFLoader
+            return "\n".join(doc.page_content for doc in PyPDFLoader(pdf_path).load())
+
+        page_cache = PageTextCache(os.path.join(work_dir, f"page_text_{size}.sqlite3"))
+
+        def pdf_text_cached():
+            # Caches are disabled for the other benchmarks, so enable them just for this one
+            configure_caches(enabled=True)
+            try:
+                return extract_pdf_text(pdf_path, cache=page_cache)
+            finally:
+                configure_caches(enabled=False)
+
+        def optimize_resume():
+            from main import optimize_resume as run_pipeline
+            return run_pipeline(pdf_path, posting, output_format='html',
+                                output_dir=os.path.join(work_dir, f"pipeline_{size}"))
+
+        # The formatter output feeds the converters, so render it once up front
+        with redirect_stdout(io.StringIO()):
+            html_formatter()
+
+        parser = ResumeParser()
+        analyzer = JobDescriptionAnalyzer()
+        generator = ResumeGenerator()
+        optimizer = ATSOptimizer()
+        return {
+            "pdf_loader": pdf_loader,
+            "pdf_text": lambda: extract_pdf_text(pdf_path),
+            "pdf_text_cached": pdf_text_cached,
+            "resume_parser": lambda: parser(pdf_path),
+            "job_analyzer": lambda: analyzer(posting),
+            "resume_generator": lambda: generator({'resume': resume, 'job': job, 'keywords': []}),
+            "ats_optimizer": lambda: optimizer.optimize(resume, job),
+            "ats_score": lambda: optimizer.analyze_resume_ats_score(resume, keywords),
+            "ats_score_jobs": lambda: optimizer.analyze_resume_ats_scores(resume, keyword_sets),
+            "html_formatter": html_formatter,
+            "pdf_converter": pdf_converter,
+            "docx_converter": docx_converter,
+            "optimize_resume": optimize_resume
+        }
+
+    def run(self, sizes: List[int] = DEFAULT_SIZES, batch_sizes: List[int] = DEFAULT_BATCH_SIZES,
+            only: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+        """Run every selected benchmark and return one result per benchmark and size."""
+        configure_caches(enabled=False)
+        configure_response_cache("off")
+        results = []
+
+        try:
+            with tempfile.TemporaryDirectory() as work_dir:
+                for size in sizes:
+                    cases = self._tool_cases(size, work_dir)
+                    for name in TOOL_BENCHMARKS:
+                        if only and name not in only:
+                            continue
+                        results.append(self._run_case(name, size, cases[name]))
+
+                if not only or "batch" in only:
+                    for batch_size in batch_sizes:
+                        results.append(self._run_batch(batch_size, work_dir))
+        finally:
+            chat_models.set_factory(None)
+
+        return results
+
+    def _run_case(self, name: str, size: int, func: Callable[[], Any], ops_per_call: int = 1) -> Dict[str, Any]:
+        try:
+            result = measure(name, size, func, iterations=self.iterations, ops_per_call=ops_per_call)
+        except (ImportError, OSError) as e:
+            result = self._skip(name, size, e)
+        print(format_result(result))
+        return result
+
+    @staticmethod
+    def _skip(name: str, size: int, error: Exception) -> Dict[str, Any]:
+        # Optional system libraries (e.g. Pango for WeasyPrint) may be missing
+        return {"name": name, "size": size, "skipped": str(error).splitlines()[0]}
+
+    def _run_batch(self, batch_size: int, work_dir: str) -> Dict[str, Any]:
+        """Tailor one resume to batch_size jobs with the batch runner; ops are jobs."""
+        try:
+            from resume_builder.pipeline.batch import JobBatchRunner
+        except (ImportError, OSError) as e:
+            result = self._skip("batch", batch_size, e)
+            print(format_result(result))
+            return result
+
+        resume = make_resume(1)
+        job = make_job(1)
+        self._install_fake_model(resume, job)
+        runner = JobBatchRunner(output_format='json', max_workers=self.workers)
+        jobs = [(f"job_{i}", job_text(job) + f"\nReference {i}") for i in range(batch_size)]
+
+        def run_batch():
+            return runner.run(resume, jobs, os.path.join(work_dir, f"batch_{batch_size}"))
+
+        return self._run_case("batch", batch_size, run_batch, ops_per_call=batch_size)
+
+def format_result(result: Dict[str, Any]) -> str:
+    """Format one benchmark result as a table row."""
+    label = f"{result['name']} [{result['size']}]"
+    if "skipped" in result:
+        return f"  {label:<26} skipped: {result['skipped']}"
+    rss = f"{result['peak_rss_mb']:8.1f} MB" if result.get("peak_rss_mb") is not None else ""
+    return (f"  {label:<26} {result['ops_per_sec']:10.2f} ops/s  p50 {result['p50_ms']:9.2f} ms  "
+            f"p95 {result['p95_ms']:9.2f} ms  {rss}")
+
+def save_baseline(results: List[Dict[str, Any]], file_path: str, settings: Dict[str, Any]) -> str:
+    """Save benchmark results (and the settings they were run with) as a baseline JSON file."""
+    baseline = {
+        "created_at": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "settings": settings,
+        "results": results
+    }
+    directory = os.path.dirname(file_path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with open(file_path, 'w', encoding='utf-8') as f:
+        json.dump(baseline, f, indent=2)
+    return file_path
+
+def compare_to_baseline(results: List[Dict[str, Any]], baseline: Dict[str, Any],
+                        tolerance: float = DEFAULT_TOLERANCE) -> List[str]:
+    """
+    Print each benchmark's change against a baseline.
+
+    Returns:
+        Descriptions of regressions: throughput down or p95 latency up by more than tolerance
+    """
+    previous = {(result["name"], result["size"]): result for result in baseline.get("results", [])}
+    regressions = []
+
+    print(f"\nCompared to baseline from {baseline.get('created_at', 'unknown date')}:")
+    for result in results:
+        old = previous.get((result["name"], result["size"]))
+        label = f"{result['name']} [{result['size']}]"
+        if old is None or "skipped" in result or "skipped" in old:
+            print(f"  {label:<26} no comparable baseline")
+            continue
+
+        throughput_change = result["ops_per_sec"] / old["ops_per_sec"] - 1 if old["ops_per_sec"] else 0.0
+        latency_change = result["p95_ms"] / old["p95_ms"] - 1 if old["p95_ms"] else 0.0
+        flag = ""
+        if throughput_change < -tolerance or latency_change > tolerance:
+            flag = "  REGRESSION"
+            regressions.append(f"{label}: throughput {throughput_change:+.1%}, p95 {latency_change:+.1%}")
+        print(f"  {label:<26} throughput {throughput_change:+7.1%}  p95 {latency_change:+7.1%}{flag}")
+
+    return regressions
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Offline Resume Builder benchmarks with a fake chat model")
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES,
+                        help="Resume and job description size multipliers to benchmark")
+    parser.add_argument("--batch-sizes", type=int, nargs="+", default=DEFAULT_BATCH_SIZES,
+                        help="Number of jobs per batch run")
+    parser.add_argument("--only", nargs="+", choices=TOOL_BENCHMARKS + ["batch"], help="Run only these benchmarks")
+    parser.add_argument("--iterations", type=int, default=5, help="Timed iterations per benchmark")
+    parser.add_argument("--latency", type=float, default=0.0, help="Simulated model latency in seconds")
+    parser.add_argument("--jitter", type=float, default=0.0, help="Random +/- latency jitter in seconds")
+    parser.add_argument("--seed", type=int, default=0, help="Seed for the latency jitter")
+    parser.add_argument("--workers", type=int, default=4, help="Workers for the batch benchmark")
+    parser.add_argument("--save-baseline", metavar="JSON", help="Save the results as a baseline file")
+    parser.add_argument("--compare", metavar="JSON", help="Compare the results against a baseline file")
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE,
+                        help="Allowed throughput drop or p95 increase before a regression is reported (default: 0.10)")
+    args = parser.parse_args(argv)
+
+    settings = {key: getattr(args, key) for key in ("sizes", "batch_sizes", "iterations", "latency", "jitter", "seed", "workers")}
+    print(f"Running benchmarks (latency {args.latency}s +/- {args.jitter}s, {args.iterations} iterations)")
+    benchmark = PipelineBenchmark(latency=args.latency, jitter=args.jitter, seed=args.seed,
+                                  iterations=args.iterations, workers=args.workers)
+    results = benchmark.run(sizes=args.sizes, batch_sizes=args.batch_sizes, only=args.only)
+
+    if args.save_baseline:
+        print(f"\nBaseline saved to: {save_baseline(results, args.save_baseline, settings)}")
+
+    if args.compare:
+        with open(args.compare, 'r', encoding='utf-8') as f:
+            regressions = compare_to_baseline(results, json.load(f), args.tolerance)
+        if regressions:
+            print(f"\n{len(regressions)} regression(s) beyond {args.tolerance:.0%}:")
+            for regression in regressions:
+                print(f"  {regression}")
+            return 1
+
+    return 0
@@ -0,0 +1,2 @@
+"""Resume cache package."""
+# This file makes the cache directory a Python package
\ No newline at end of file
@@ -0,0 +1,134 @@
+import os
+import re
+import time
+import sqlite3
+import hashlib
+import threading
+import unicodedata
+from typing import Optional
+
+from resume_builder.models.job import JobDescription
+from resume_builder.cache.settings import cache_settings
+from resume_builder.cache.sqlite import connect
+
+DEFAULT_TTL_SECONDS = 30 * 24 * 60 * 60
+DEFAULT_MAX_ENTRIES = 5000
+
+# Query parameters added by job boards and mailers that do not change the posting
+TRACKING_PARAMS = re.compile(
+    r'(?i)([?&])(utm_[a-z]+|gclid|fbclid|msclkid|mc_cid|mc_eid|trk|trackingid|refid|ref|src|source)=[^&\s#]*'
+)
+ZERO_WIDTH = re.compile(r'[\u200b-\u200f\u2060\ufeff]')
+HTML_TAG = re.compile(r'<[^>]+>')
+WHITESPACE = re.compile(r'\s+')
+
+def normalize_job_text(job_description: str) -> str:
+    """
+    Normalize posting text so trivially different copies share a cache key.
+
+    Unicode is NFKC-normalized, zero-width characters, HTML tags and tracking
+    query parameters are removed, whitespace is collapsed and case is folded.
+    """
+    text = unicodedata.normalize("NFKC", job_description)
+    text = ZERO_WIDTH.sub('', text)
+    text = HTML_TAG.sub(' ', text)
+
+    # Drop tracking parameters, then tidy any '?&' or trailing '?' they leave behind
+    text = TRACKING_PARAMS.sub(r'\1', text)
+    text = re.sub(r'\?&+', '?', text)
+    text = re.sub(r'[?&]+(?=[\s#]|$)', '', text)
+
+    return WHITESPACE.sub(' ', text).strip().casefold()
+
+class JobAnalysisCache:
+    """
+    SQLite-backed cache of job description analyses.
+
+    Entries are keyed by the normalized posting text together with the model
+    name and prompt version. Entries older than ttl_seconds are treated as
+    misses, and the least recently used entries are deleted once more than
+    max_entries are stored.
+    """
+
+    def __init__(self, db_path: Optional[str] = None, ttl_seconds: float = DEFAULT_TTL_SECONDS,
+                 max_entries: int = DEFAULT_MAX_ENTRIES):
+        self.db_path = db_path or os.path.join(cache_settings.cache_dir, "job_analyses.sqlite3")
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+
+        os.makedirs(os.path.dirname(os.path.abspath(self.db_path)), exist_ok=True)
+        with connect(self.db_path) as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS job_analyses (
+                    key TEXT PRIMARY KEY,
+                    model TEXT NOT NULL,
+                    result TEXT NOT NULL,
+                    created_at REAL NOT NULL,
+                    last_used REAL NOT NULL
+                )
+            """)
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_job_analyses_last_used ON job_analyses (last_used)")
+
+    @staticmethod
+    def make_key(job_description: str, model_name: str, prompt_version: str) -> str:
+        """Build a cache key from the normalized posting text, the model and the prompt version."""
+        normalized = normalize_job_text(job_description)
+        return hashlib.sha256(f"{normalized}|{model_name}|{prompt_version}".encode('utf-8')).hexdigest()
+
+    def get(self, key: str) -> Optional[JobDescription]:
+        """Get a cached analysis, or None on a miss, expired or unreadable entry."""
+        now = time.time()
+        try:
+            with self._lock, connect(self.db_path) as conn:
+                row = conn.execute(
+                    "SELECT result, created_at FROM job_analyses WHERE key = ?", (key,)
+                ).fetchone()
+                if row is None:
+                    return None
+                if now - row[1] > self.ttl_seconds:
+                    conn.execute("DELETE FROM job_analyses WHERE key = ?", (key,))
+                    return None
+                conn.execute("UPDATE job_analyses SET last_used = ? WHERE key = ?", (now, key))
+
+            return JobDescription.model_validate_json(row[0])
+        except Exception as e:
+            print(f"Warning: Ignoring job analysis cache entry {key}: {str(e)}")
+            return None
+
+    def put(self, key: str, job: JobDescription, model_name: str):
+        """Store an analysis and evict expired and least recently used entries."""
+        now = time.time()
+        try:
+            with self._lock, connect(self.db_path) as conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO job_analyses (key, model, result, created_at, last_used) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    (key, model_name, job.model_dump_json(), now, now)
+                )
+                conn.execute("DELETE FROM job_analyses WHERE created_at < ?", (now - self.ttl_seconds,))
+                conn.execute(
+                    "DELETE FROM job_analyses WHERE key IN ("
+                    "SELECT key FROM job_analyses ORDER BY last_used DESC LIMIT -1 OFFSET ?)",
+                    (self.max_entries,)
+                )
+        except sqlite3.Error as e:
+            print(f"Warning: Could not write job analysis cache entry {key}: {str(e)}")
+
+    def clear(self):
+        """Delete every cached analysis."""
+        with self._lock, connect(self.db_path) as conn:
+            conn.execute("DELETE FROM job_analyses")
+
+_default_cache = None
+_default_cache_lock = threading.Lock()
+
+def get_job_cache() -> JobAnalysisCache:
+    """Get the shared job analysis cache under the configured cache directory."""
+    global _default_cache
+    db_path = os.path.join(cache_settings.cache_dir, "job_analyses.sqlite3")
+    with _default_cache_lock:
+        if _default_cache is None or _default_cache.db_path != db_path:
+            _default_cache = JobAnalysisCache(db_path)
+        return _default_cache
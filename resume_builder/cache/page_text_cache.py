@@ -0,0 +1,91 @@
+import os
+import time
+import sqlite3
+import threading
+from typing import Dict, Iterable, Optional
+
+from resume_builder.cache.settings import cache_settings
+from resume_builder.cache.sqlite import connect
+
+DEFAULT_MAX_ENTRIES = 20000
+
+class PageTextCache:
+    """
+    SQLite-backed cache of text extracted from PDF pages.
+
+    Entries are keyed by a hash of the page's content stream and fonts (see
+    resume_builder.tools.pdf_text.page_key), so an unchanged page is never
+    extracted twice, even when it comes back in an edited or re-exported
+    resume whose file hash is new. The least recently used entries are
+    deleted once more than max_entries are stored.
+    """
+
+    def __init__(self, db_path: Optional[str] = None, max_entries: int = DEFAULT_MAX_ENTRIES):
+        self.db_path = db_path or os.path.join(cache_settings.cache_dir, "page_text.sqlite3")
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+
+        os.makedirs(os.path.dirname(os.path.abspath(self.db_path)), exist_ok=True)
+        with connect(self.db_path) as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS page_text (
+                    key TEXT PRIMARY KEY,
+                    text TEXT NOT NULL,
+                    last_used REAL NOT NULL
+                )
+            """)
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_page_text_last_used ON page_text (last_used)")
+
+    def get_many(self, keys: Iterable[str]) -> Dict[str, str]:
+        """Get the cached text of every page key that has an entry, in one query."""
+        keys = list(dict.fromkeys(keys))
+        if not keys:
+            return {}
+        placeholders = ",".join("?" * len(keys))
+        try:
+            with self._lock, connect(self.db_path) as conn:
+                rows = conn.execute(f"SELECT key, text FROM page_text WHERE key IN ({placeholders})", keys).fetchall()
+                if rows:
+                    conn.execute(f"UPDATE page_text SET last_used = ? WHERE key IN ({placeholders})",
+                                 [time.time()] + keys)
+            return dict(rows)
+        except sqlite3.Error as e:
+            print(f"Warning: Ignoring page text cache: {str(e)}")
+            return {}
+
+    def put_many(self, texts: Dict[str, str]):
+        """Store the text of several pages and evict the least recently used entries."""
+        if not texts:
+            return
+        now = time.time()
+        try:
+            with self._lock, connect(self.db_path) as conn:
+                conn.executemany(
+                    "INSERT OR REPLACE INTO page_text (key, text, last_used) VALUES (?, ?, ?)",
+                    [(key, text, now) for key, text in texts.items()]
+                )
+                conn.execute(
+                    "DELETE FROM page_text WHERE key IN ("
+                    "SELECT key FROM page_text ORDER BY last_used DESC LIMIT -1 OFFSET ?)",
+                    (self.max_entries,)
+                )
+        except sqlite3.Error as e:
+            print(f"Warning: Could not write page text cache: {str(e)}")
+
+    def clear(self):
+        """Delete every cached page."""
+        with self._lock, connect(self.db_path) as conn:
+            conn.execute("DELETE FROM page_text")
+
+_default_cache = None
+_default_cache_lock = threading.Lock()
+
+def get_page_text_cache() -> PageTextCache:
+    """Get the shared page text cache under the configured cache directory."""
+    global _default_cache
+    db_path = os.path.join(cache_settings.cache_dir, "page_text.sqlite3")
+    with _default_cache_lock:
+        if _default_cache is None or _default_cache.db_path != db_path:
+            _default_cache = PageTextCache(db_path)
+        return _default_cache
@@ -0,0 +1,234 @@
+import os
+import json
+import time
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Sequence
+
+from langchain_core.caches import BaseCache
+from langchain_core.outputs import Generation
+
+from resume_builder.cache.settings import cache_settings
+from resume_builder.cache.sqlite import connect
+
+DEFAULT_MAX_ENTRIES = 1024
+DEFAULT_MAX_BYTES = 200 * 1024 * 1024
+DEFAULT_MAX_AGE_SECONDS = 7 * 24 * 60 * 60
+
+class MemoryBackend:
+    """In-process LRU store of cached responses, bounded by entry count, size and age."""
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES, max_bytes: int = DEFAULT_MAX_BYTES,
+                 max_age_seconds: float = DEFAULT_MAX_AGE_SECONDS):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.max_age_seconds = max_age_seconds
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[str]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            value, created_at = entry
+            if time.time() - created_at > self.max_age_seconds:
+                self._remove(key)
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: str):
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = (value, time.time())
+            self._size += len(value)
+            while self._entries and (len(self._entries) > self.max_entries or self._size > self.max_bytes):
+                self._remove(next(iter(self._entries)))
+
+    def _remove(self, key: str):
+        value, _ = self._entries.pop(key)
+        self._size -= len(value)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+class DiskBackend:
+    """SQLite store of cached responses that survives across runs, bounded by size and age."""
+
+    def __init__(self, db_path: Optional[str] = None, max_bytes: int = DEFAULT_MAX_BYTES,
+                 max_age_seconds: float = DEFAULT_MAX_AGE_SECONDS):
+        self.db_path = db_path or os.path.join(cache_settings.cache_dir, "llm_responses.sqlite3")
+        self.max_bytes = max_bytes
+        self.max_age_seconds = max_age_seconds
+        self._lock = threading.Lock()
+
+        os.makedirs(os.path.dirname(os.path.abspath(self.db_path)), exist_ok=True)
+        with connect(self.db_path) as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS llm_responses (
+                    key TEXT PRIMARY KEY,
+                    value TEXT NOT NULL,
+                    size INTEGER NOT NULL,
+                    created_at REAL NOT NULL,
+                    last_used REAL NOT NULL
+                )
+            """)
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_llm_responses_last_used ON llm_responses (last_used)")
+
+    def get(self, key: str) -> Optional[str]:
+        now = time.time()
+        with self._lock, connect(self.db_path) as conn:
+            row = conn.execute("SELECT value, created_at FROM llm_responses WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                return None
+            if now - row[1] > self.max_age_seconds:
+                conn.execute("DELETE FROM llm_responses WHERE key = ?", (key,))
+                return None
+            conn.execute("UPDATE llm_responses SET last_used = ? WHERE key = ?", (now, key))
+            return row[0]
+
+    def set(self, key: str, value: str):
+        now = time.time()
+        with self._lock, connect(self.db_path) as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO llm_responses (key, value, size, created_at, last_used) VALUES (?, ?, ?, ?, ?)",
+                (key, value, len(value), now, now)
+            )
+            conn.execute("DELETE FROM llm_responses WHERE created_at < ?", (now - self.max_age_seconds,))
+
+            # Drop the least recently used responses until the total size fits
+            total = conn.execute("SELECT COALESCE(SUM(size), 0) FROM llm_responses").fetchone()[0]
+            if total > self.max_bytes:
+                rows = conn.execute("SELECT key, size FROM llm_responses ORDER BY last_used").fetchall()
+                stale = []
+                for stale_key, size in rows:
+                    if total <= self.max_bytes:
+                        break
+                    stale.append((stale_key,))
+                    total -= size
+                conn.executemany("DELETE FROM llm_responses WHERE key = ?", stale)
+
+    def clear(self):
+        with self._lock, connect(self.db_path) as conn:
+            conn.execute("DELETE FROM llm_responses")
+
+class ResponseCache(BaseCache):
+    """
+    LangChain cache shared by every chat model the tools and agents create.
+
+    Responses are keyed on the model name, temperature, call parameters (such
+    as stop sequences) and the fully rendered prompt, so re-runs and retries of
+    an identical prompt are answered locally. Storage is delegated to a
+    MemoryBackend or DiskBackend; hit and miss counts are kept for reporting.
+    """
+
+    def __init__(self, backend=None):
+        self.backend = backend or MemoryBackend()
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(prompt: str, llm_string: str) -> str:
+        """Build a cache key from the rendered prompt and the model's identifying parameters."""
+        # llm_string is '<serialized model>---<call params>'; keep only model and temperature
+        # from the serialized model so unrelated client settings do not change the key
+        serialized, _, call_params = llm_string.partition("---")
+        try:
+            kwargs = json.loads(serialized).get("kwargs", {})
+            model_id = f"{kwargs.get('model')}|{kwargs.get('temperature')}"
+        except (ValueError, AttributeError):
+            model_id = serialized
+
+        return hashlib.sha256(f"{model_id}|{call_params}|{prompt}".encode('utf-8')).hexdigest()
+
+    def lookup(self, prompt: str, llm_string: str) -> Optional[Sequence[Generation]]:
+        if cache_settings.refresh:
+            return None
+
+        value = None
+        try:
+            value = self.backend.get(self.make_key(prompt, llm_string))
+        except Exception as e:
+            print(f"Warning: LLM response cache lookup failed: {str(e)}")
+
+        with self._lock:
+            if value is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+
+        return [Generation(text=text) for text in json.loads(value)]
+
+    def update(self, prompt: str, llm_string: str, return_val: Sequence[Generation]):
+        try:
+            value = json.dumps([generation.text for generation in return_val])
+            self.backend.set(self.make_key(prompt, llm_string), value)
+        except Exception as e:
+            print(f"Warning: Could not store LLM response in cache: {str(e)}")
+
+    def clear(self, **kwargs: Any):
+        self.backend.clear()
+        with self._lock:
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self) -> Dict[str, Any]:
+        """Get hit and miss counts and the hit rate."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0
+            }
+
+    def report(self):
+        """Print hit and miss counts."""
+        stats = self.stats()
+        if stats["hits"] or stats["misses"]:
+            print(f"LLM response cache: {stats['hits']} hits, {stats['misses']} misses "
+                  f"({stats['hit_rate']:.0%} hit rate)")
+
+_response_cache = None
+_response_cache_lock = threading.RLock()
+
+def configure_response_cache(backend: str = "disk", **backend_options):
+    """
+    Select the response cache backend for this process.
+
+    Args:
+        backend: 'memory' for an in-process LRU, 'disk' for a SQLite store
+                 under the cache directory, or 'off' to disable response caching
+        backend_options: Size and age limits passed to the backend
+    """
+    global _response_cache
+    with _response_cache_lock:
+        if backend == "off":
+            _response_cache = False
+        elif backend == "memory":
+            _response_cache = ResponseCache(MemoryBackend(**backend_options))
+        elif backend == "disk":
+            _response_cache = ResponseCache(DiskBackend(**backend_options))
+        else:
+            raise ValueError(f"Unknown response cache backend: {backend}")
+
+def get_response_cache() -> Optional[ResponseCache]:
+    """
+    Get the shared response cache, or None if caching is disabled.
+
+    Defaults to the on-disk backend the first time it is needed.
+    """
+    if not cache_settings.enabled:
+        return None
+    with _response_cache_lock:
+        if _response_cache is None:
+            configure_response_cache("disk")
+        return _response_cache or None
@@ -0,0 +1,104 @@
+import os
+import hashlib
+import threading
+from typing import Optional
+
+from resume_builder.models.resume import Resume
+from resume_builder.cache.settings import cache_settings
+
+DEFAULT_MAX_BYTES = 100 * 1024 * 1024
+
+class ResumeCache:
+    """
+    Persistent on-disk cache of parsed resumes.
+
+    Entries are keyed by the SHA-256 of the PDF bytes together with the model
+    name and prompt version, so re-uploading the same CV skips both text
+    extraction and the model call, while a prompt or model change misses.
+    Each entry is one JSON file; reads refresh its modification time and the
+    least recently used files are evicted once the directory exceeds max_bytes.
+    """
+
+    def __init__(self, cache_dir: Optional[str] = None, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.cache_dir = cache_dir or os.path.join(cache_settings.cache_dir, "resumes")
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        os.makedirs(self.cache_dir, exist_ok=True)
+
+    @staticmethod
+    def make_key(file_path: str, model_name: str, prompt_version: str) -> str:
+        """Build a cache key from the file's content hash, the model and the prompt version."""
+        digest = hashlib.sha256()
+        with open(file_path, 'rb') as f:
+            for block in iter(lambda: f.read(1024 * 1024), b''):
+                digest.update(block)
+
+        return hashlib.sha256(f"{digest.hexdigest()}|{model_name}|{prompt_version}".encode('utf-8')).hexdigest()
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, f"{key}.json")
+
+    def get(self, key: str) -> Optional[Resume]:
+        """Get a cached Resume, or None on a miss or unreadable entry."""
+        path = self._path(key)
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                resume = Resume.model_validate_json(f.read())
+            # Mark the entry as recently used for LRU eviction
+            os.utime(path)
+            return resume
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            print(f"Warning: Ignoring unreadable resume cache entry {path}: {str(e)}")
+            return None
+
+    def put(self, key: str, resume: Resume):
+        """Store a Resume and evict the least recently used entries if over budget."""
+        path = self._path(key)
+        tmp_path = f"{path}.{threading.get_ident()}.tmp"
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                f.write(resume.model_dump_json())
+            os.replace(tmp_path, path)
+            self._evict()
+        except OSError as e:
+            print(f"Warning: Could not write resume cache entry {path}: {str(e)}")
+
+    def _evict(self):
+        """Delete the least recently used entries until the cache fits in max_bytes."""
+        with self._lock:
+            entries = []
+            for entry in os.scandir(self.cache_dir):
+                if entry.name.endswith('.json'):
+                    stat = entry.stat()
+                    entries.append((stat.st_mtime, stat.st_size, entry.path))
+
+            total = sum(size for _, size, _ in entries)
+            for _, size, path in sorted(entries):
+                if total <= self.max_bytes:
+                    break
+                try:
+                    os.remove(path)
+                    total -= size
+                except FileNotFoundError:
+                    pass
+
+    def clear(self):
+        """Delete every cached resume."""
+        with self._lock:
+            for entry in os.scandir(self.cache_dir):
+                if entry.name.endswith('.json'):
+                    os.remove(entry.path)
+
+_default_cache = None
+_default_cache_lock = threading.Lock()
+
+def get_resume_cache() -> ResumeCache:
+    """Get the shared resume cache under the configured cache directory."""
+    global _default_cache
+    cache_dir = os.path.join(cache_settings.cache_dir, "resumes")
+    with _default_cache_lock:
+        if _default_cache is None or _default_cache.cache_dir != cache_dir:
+            _default_cache = ResumeCache(cache_dir)
+        return _default_cache
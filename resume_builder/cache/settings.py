@@ -0,0 +1,28 @@
+import os
+
+class CacheSettings:
+    """Process-wide switches shared by every cache (set from --no-cache/--refresh)."""
+
+    def __init__(self):
+        self.enabled = os.environ.get("RESUME_BUILDER_NO_CACHE", "") == ""
+        self.refresh = False
+        self.cache_dir = os.environ.get(
+            "RESUME_BUILDER_CACHE_DIR",
+            os.path.join(os.path.expanduser("~"), ".cache", "resume_builder")
+        )
+
+cache_settings = CacheSettings()
+
+def configure_caches(enabled=True, refresh=False, cache_dir=None):
+    """
+    Configure all caches for this process.
+
+    Args:
+        enabled: Look up and store results in the caches if True
+        refresh: Ignore existing cache entries but store fresh results
+        cache_dir: Root directory for on-disk caches (optional)
+    """
+    cache_settings.enabled = enabled
+    cache_settings.refresh = refresh
+    if cache_dir:
+        cache_settings.cache_dir = cache_dir
@@ -0,0 +1,34 @@
+import sqlite3
+from contextlib import contextmanager
+from typing import Any, Callable, Iterator, Optional
+
+# Seconds a connection waits for another one to release the write lock
+BUSY_TIMEOUT = 30
+
+@contextmanager
+def connect(db_path: str, autocommit: bool = False,
+            row_factory: Optional[Callable[..., Any]] = None) -> Iterator[sqlite3.Connection]:
+    """
+    Open a short-lived SQLite connection for one operation.
+
+    The on-disk caches, the keyword corpus and the job queue open a connection
+    per operation instead of sharing one, which keeps them safe to use from
+    several threads.
+
+    Args:
+        db_path: Path to the database file
+        autocommit: Leave transactions to the caller (e.g. BEGIN IMMEDIATE)
+            instead of committing when the block exits, or rolling back if it raises
+        row_factory: Row factory of the connection, e.g. sqlite3.Row (optional)
+    """
+    conn = sqlite3.connect(db_path, timeout=BUSY_TIMEOUT, isolation_level=None if autocommit else "")
+    if row_factory is not None:
+        conn.row_factory = row_factory
+    try:
+        if autocommit:
+            yield conn
+        else:
+            with conn:
+                yield conn
+    finally:
+        conn.close()
@@ -7,6 +7,8 @@ from docx import Document
 from docx.shared import Pt, Inches
 from docx.enum.text import WD_ALIGN_PARAGRAPH
 
+from resume_builder.pipeline.tracing import tracer
+
 class DocxConverter:
     """Convert HTML to DOCX format using direct python-docx implementation."""
     
@@ -189,7 +191,9 @@ class DocxConverter:
             
             # Try direct conversion
             print("Converting HTML to DOCX using direct python-docx implementation...")
-            success = self._direct_html_to_docx(html_content, output_path)
+            with tracer.span("convert docx", "format", html_chars=len(html_content)) as span:
+                success = self._direct_html_to_docx(html_content, output_path)
+                span["success"] = bool(success)
             
             if success:
                 print(f"Successfully converted HTML to DOCX: {output_path}")
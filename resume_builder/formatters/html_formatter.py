@@ -1,6 +1,7 @@
 import os
 from jinja2 import Environment, FileSystemLoader
 from resume_builder.models.resume import Resume
+from resume_builder.pipeline.tracing import tracer
 
 class HtmlFormatter:
     """Format a resume as HTML using a template."""
@@ -32,7 +33,9 @@ class HtmlFormatter:
             print("Falling back to harvard.html template")
             template = self.env.get_template("harvard.html")
             
-        html_content = template.render(resume=resume)
+        with tracer.span("render html", "format", template=template.name) as span:
+            html_content = template.render(resume=resume)
+            span["html_chars"] = len(html_content)
         
         if output_path:
             os.makedirs(os.path.dirname(output_path), exist_ok=True)
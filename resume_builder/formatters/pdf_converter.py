@@ -1,6 +1,8 @@
 import os
 from weasyprint import HTML
 
+from resume_builder.pipeline.tracing import tracer
+
 class PdfConverter:
     """Convert HTML to PDF."""
     
@@ -28,9 +30,11 @@ class PdfConverter:
         # Create directory if it doesn't exist
         os.makedirs(os.path.dirname(output_path) if os.path.dirname(output_path) else ".", exist_ok=True)
         
-        if html_file:
-            HTML(filename=html_file).write_pdf(output_path)
-        else:
-            HTML(string=html_content).write_pdf(output_path)
+        with tracer.span("convert pdf", "format") as span:
+            if html_file:
+                HTML(filename=html_file).write_pdf(output_path)
+            else:
+                HTML(string=html_content).write_pdf(output_path)
+            span["output_bytes"] = os.path.getsize(output_path)
         
         return output_path
\ No newline at end of file
@@ -0,0 +1,2 @@
+"""Resume LLM package."""
+# This file makes the llm directory a Python package
\ No newline at end of file
@@ -0,0 +1,168 @@
+import os
+import time
+import hashlib
+import threading
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from uuid import UUID
+
+from langchain_core.callbacks import BaseCallbackHandler
+from langchain_core.language_models import BaseChatModel
+from langchain_core.messages import BaseMessage
+from langchain_core.outputs import ChatResult, LLMResult
+from langchain_google_genai import ChatGoogleGenerativeAI
+
+from resume_builder.cache.response_cache import get_response_cache
+from resume_builder.llm.scheduler import quota_scheduler
+from resume_builder.pipeline.tracing import Tracer, tracer
+
+# Rough characters-per-token ratio used to charge prompts against the token budget up front
+CHARS_PER_TOKEN = 4
+
+def estimate_tokens(messages: List[BaseMessage]) -> int:
+    """Estimate the prompt size of a request in tokens."""
+    return sum(len(str(message.content)) for message in messages) // CHARS_PER_TOKEN + 1
+
+def _total_tokens(result: ChatResult) -> Optional[int]:
+    for generation in result.generations:
+        usage = getattr(generation.message, "usage_metadata", None)
+        if usage:
+            return usage.get("total_tokens")
+    return None
+
+class TraceCallbackHandler(BaseCallbackHandler):
+    """Trace every chat model call, including cache hits, with prompt and response sizes."""
+
+    def __init__(self, tracer: Tracer):
+        self.tracer = tracer
+        self._calls: Dict[UUID, tuple] = {}
+        self._lock = threading.Lock()
+
+    def on_chat_model_start(self, serialized: Dict[str, Any], messages: List[List[Any]], *, run_id: UUID,
+                            **kwargs: Any):
+        if not self.tracer.enabled:
+            return
+        prompt_chars = sum(len(str(message.content)) for batch in messages for message in batch)
+        model = (kwargs.get("invocation_params") or {}).get("model") or serialized.get("name")
+        with self._lock:
+            self._calls[run_id] = (time.perf_counter(), threading.current_thread(), model, prompt_chars)
+
+    def _finish(self, run_id: UUID, args: Dict[str, Any]):
+        with self._lock:
+            call = self._calls.pop(run_id, None)
+        if call is None:
+            return
+        start, thread, model, prompt_chars = call
+        self.tracer.record("llm call", "llm", start, time.perf_counter(),
+                           {"model": model, "prompt_chars": prompt_chars, **args}, thread=thread)
+
+    def on_llm_end(self, response: LLMResult, *, run_id: UUID, **kwargs: Any):
+        generations = [generation for batch in response.generations for generation in batch]
+        args = {"response_chars": sum(len(generation.text) for generation in generations)}
+
+        usage = next((getattr(generation, "message", None).usage_metadata for generation in generations
+                      if getattr(getattr(generation, "message", None), "usage_metadata", None)), None)
+        if usage:
+            args.update({
+                "input_tokens": usage.get("input_tokens"),
+                "output_tokens": usage.get("output_tokens")
+            })
+        self._finish(run_id, args)
+
+    def on_llm_error(self, error: BaseException, *, run_id: UUID, **kwargs: Any):
+        self._finish(run_id, {"error": str(error)})
+
+trace_callbacks = TraceCallbackHandler(tracer)
+
+class ScheduledChatGoogleGenerativeAI(ChatGoogleGenerativeAI):
+    """
+    Gemini chat model whose requests go through the process-wide quota scheduler.
+
+    Cache hits are answered before _generate is reached, so only real API calls
+    take a slot. 429 handling is left to the scheduler (which pauses every
+    caller of the model) rather than to per-call client retries.
+    """
+
+    def _generate(self, messages: List[BaseMessage], stop: Optional[List[str]] = None,
+                  run_manager=None, **kwargs: Any) -> ChatResult:
+        parent = super()
+
+        def request() -> ChatResult:
+            with tracer.span("api request", "llm", model=self.model):
+                return parent._generate(messages, stop=stop, run_manager=run_manager, **kwargs)
+
+        return quota_scheduler.run(
+            self.model,
+            request,
+            estimated_tokens=estimate_tokens(messages),
+            usage=_total_tokens
+        )
+
+class ChatModelRegistry:
+    """
+    Hand out one warm chat model client per (model, temperature).
+
+    Building a ChatGoogleGenerativeAI sets up a new API client and connection,
+    so tools that construct one per call pay for authentication and connection
+    setup every time. The registry keeps a single client for each model and
+    temperature and reuses it across calls and threads, which keeps the
+    underlying connection alive. A client is rebuilt if the API key or the
+    response cache configuration changes.
+
+    A factory can be installed to hand out a different chat model (such as the
+    fake model used by the offline benchmarks) to every tool and agent.
+    """
+
+    def __init__(self):
+        self._clients: Dict[Tuple[str, Optional[float], str], Tuple[BaseChatModel, object]] = {}
+        self._factory: Optional[Callable[..., BaseChatModel]] = None
+        self._lock = threading.Lock()
+
+    def set_factory(self, factory: Optional[Callable[..., BaseChatModel]]):
+        """
+        Build clients with factory(model_name, temperature, cache) instead of Gemini.
+
+        Pass None to go back to Gemini clients. Pooled clients are dropped either way.
+        """
+        with self._lock:
+            self._factory = factory
+            self._clients.clear()
+
+    @staticmethod
+    def _api_key_fingerprint() -> str:
+        api_key = os.environ.get("GOOGLE_API_KEY", "")
+        return hashlib.sha256(api_key.encode('utf-8')).hexdigest()
+
+    def get(self, model_name: str, temperature: Optional[float] = None) -> BaseChatModel:
+        """Get the shared client for a model and temperature, creating it on first use."""
+        key = (model_name, temperature, self._api_key_fingerprint())
+        cache = get_response_cache()
+
+        with self._lock:
+            entry = self._clients.get(key)
+            if entry is not None and entry[1] is cache:
+                return entry[0]
+
+            client = self._create(model_name, temperature, cache)
+            self._clients[key] = (client, cache)
+            return client
+
+    def _create(self, model_name: str, temperature: Optional[float], cache) -> BaseChatModel:
+        if self._factory is not None:
+            return self._factory(model_name, temperature, cache)
+
+        # A single attempt per request: retries on 429 are scheduled globally
+        kwargs = {"model": model_name, "cache": cache, "max_retries": 1, "callbacks": [trace_callbacks]}
+        if temperature is not None:
+            kwargs["temperature"] = temperature
+        return ScheduledChatGoogleGenerativeAI(**kwargs)
+
+    def clear(self):
+        """Drop every pooled client."""
+        with self._lock:
+            self._clients.clear()
+
+chat_models = ChatModelRegistry()
+
+def get_chat_model(model_name: str = "gemini-1.5-pro", temperature: Optional[float] = None) -> BaseChatModel:
+    """Get the shared, thread-safe chat model client for a model and temperature."""
+    return chat_models.get(model_name, temperature)
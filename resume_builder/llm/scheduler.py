@@ -0,0 +1,231 @@
+import re
+import time
+import threading
+from typing import Any, Callable, Dict, Optional
+
+from resume_builder.pipeline.tracing import tracer
+
+DEFAULT_REQUESTS_PER_MINUTE = 60
+DEFAULT_TOKENS_PER_MINUTE = 1_000_000
+DEFAULT_MAX_ATTEMPTS = 4
+DEFAULT_BACKOFF_SECONDS = 2.0
+MAX_BACKOFF_SECONDS = 60.0
+
+# Google returns the suggested wait in a RetryInfo detail or in the message text
+RETRY_AFTER_PATTERNS = [
+    re.compile(r'retry_delay\s*\{\s*seconds:\s*(\d+)', re.IGNORECASE),
+    re.compile(r'retry[- ]after[:=\s]+(\d+(?:\.\d+)?)', re.IGNORECASE),
+    re.compile(r'retry in (\d+(?:\.\d+)?)\s*s', re.IGNORECASE),
+]
+
+class QuotaExhaustedError(RuntimeError):
+    """Raised when a model keeps returning 429 after every retry."""
+
+def is_rate_limit_error(error: Exception) -> bool:
+    """Check whether an exception is a 429 / resource exhausted response."""
+    message = str(error)
+    return (type(error).__name__ == "ResourceExhausted" or '429' in message
+            or 'Resource has been exhausted' in message or 'RESOURCE_EXHAUSTED' in message)
+
+def retry_after_seconds(error: Exception) -> Optional[float]:
+    """Get the retry-after hint from a rate limit error, if it carries one."""
+    retry_after = getattr(error, "retry_after", None)
+    if retry_after:
+        return float(retry_after)
+
+    for pattern in RETRY_AFTER_PATTERNS:
+        match = pattern.search(str(error))
+        if match:
+            return float(match.group(1))
+    return None
+
+class TokenBucket:
+    """Token bucket refilled continuously at a per-minute rate."""
+
+    def __init__(self, per_minute: float):
+        self.capacity = float(per_minute)
+        self.rate = self.capacity / 60.0
+        self.level = self.capacity
+        self.updated = time.monotonic()
+
+    def _refill(self, now: float):
+        self.level = min(self.capacity, self.level + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def wait_time(self, amount: float, now: float) -> float:
+        """Seconds until amount can be taken (requests larger than the bucket wait for a full bucket)."""
+        self._refill(now)
+        needed = min(amount, self.capacity) - self.level
+        return needed / self.rate if needed > 0 else 0.0
+
+    def take(self, amount: float):
+        self.level -= min(amount, self.capacity)
+
+    def adjust(self, amount: float):
+        """Charge (or refund, if negative) tokens after the fact; the level may go below zero."""
+        self.level = min(self.capacity, self.level - amount)
+
+class _ModelState:
+    """Buckets, pause window and queue depth for one model."""
+
+    def __init__(self, requests_per_minute: float, tokens_per_minute: float):
+        self.requests = TokenBucket(requests_per_minute)
+        self.tokens = TokenBucket(tokens_per_minute)
+        self.paused_until = 0.0
+        self.exhausted_until = 0.0
+        self.waiting = 0
+
+class QuotaScheduler:
+    """
+    Process-wide rate limiter for model calls.
+
+    Every request waits for a slot in its model's requests-per-minute and
+    tokens-per-minute buckets, so callers queue instead of failing. When a call
+    is rejected with a 429, every caller of that model is paused for the
+    retry-after hint (or an exponential backoff) and the call is retried; once
+    the retries run out the model is reported as exhausted so tools can fall
+    back to local processing.
+    """
+
+    def __init__(self, requests_per_minute: float = DEFAULT_REQUESTS_PER_MINUTE,
+                 tokens_per_minute: float = DEFAULT_TOKENS_PER_MINUTE,
+                 max_attempts: int = DEFAULT_MAX_ATTEMPTS):
+        self.default_limits = (requests_per_minute, tokens_per_minute)
+        self.model_limits: Dict[str, tuple] = {}
+        self.max_attempts = max_attempts
+        self._models: Dict[str, _ModelState] = {}
+        self._cond = threading.Condition()
+
+    @staticmethod
+    def _normalize(model: str) -> str:
+        return model.split("/")[-1]
+
+    def configure(self, model: Optional[str] = None, requests_per_minute: Optional[float] = None,
+                  tokens_per_minute: Optional[float] = None):
+        """
+        Set the limits for one model, or the defaults for all models if model is None.
+
+        Limits that are not given keep their current value.
+        """
+        with self._cond:
+            if model is None:
+                rpm, tpm = self.default_limits
+                self.default_limits = (requests_per_minute or rpm, tokens_per_minute or tpm)
+                # Rebuild buckets of models without their own limits
+                for name in list(self._models):
+                    if name not in self.model_limits:
+                        del self._models[name]
+            else:
+                model = self._normalize(model)
+                rpm, tpm = self.model_limits.get(model, self.default_limits)
+                self.model_limits[model] = (requests_per_minute or rpm, tokens_per_minute or tpm)
+                self._models.pop(model, None)
+            self._cond.notify_all()
+
+    def _state(self, model: str) -> _ModelState:
+        # Callers hold self._cond
+        state = self._models.get(model)
+        if state is None:
+            state = _ModelState(*self.model_limits.get(model, self.default_limits))
+            self._models[model] = state
+        return state
+
+    def acquire(self, model: str, tokens: float = 0):
+        """Block until a request of the given estimated size may be sent to model."""
+        model = self._normalize(model)
+        with self._cond:
+            state = self._state(model)
+            state.waiting += 1
+            try:
+                while True:
+                    now = time.monotonic()
+                    wait = max(
+                        state.paused_until - now,
+                        state.requests.wait_time(1, now),
+                        state.tokens.wait_time(tokens, now)
+                    )
+                    if wait <= 0:
+                        state.requests.take(1)
+                        state.tokens.take(tokens)
+                        return
+                    self._cond.wait(timeout=wait)
+            finally:
+                state.waiting -= 1
+
+    def record_usage(self, model: str, estimated_tokens: float, actual_tokens: float):
+        """Correct the token bucket once the real usage of a request is known."""
+        with self._cond:
+            self._state(self._normalize(model)).tokens.adjust(actual_tokens - estimated_tokens)
+
+    def pause(self, model: str, seconds: float):
+        """Hold every caller of model for the given number of seconds."""
+        model = self._normalize(model)
+        with self._cond:
+            state = self._state(model)
+            state.paused_until = max(state.paused_until, time.monotonic() + seconds)
+            self._cond.notify_all()
+
+    def is_exhausted(self, model: str) -> bool:
+        """Check whether model recently ran out of retries on 429 responses."""
+        with self._cond:
+            return time.monotonic() < self._state(self._normalize(model)).exhausted_until
+
+    def queue_depth(self, model: Optional[str] = None) -> int:
+        """Number of callers currently waiting for a slot (for one model or all)."""
+        with self._cond:
+            if model is not None:
+                state = self._models.get(self._normalize(model))
+                return state.waiting if state else 0
+            return sum(state.waiting for state in self._models.values())
+
+    def run(self, model: str, call: Callable[[], Any], estimated_tokens: float = 0,
+            usage: Optional[Callable[[Any], Optional[float]]] = None) -> Any:
+        """
+        Run a model call under the rate limits, retrying it after 429 responses.
+
+        Args:
+            model: Model name the limits apply to
+            call: Function that sends the request and returns its result
+            estimated_tokens: Expected prompt and response tokens, charged up front
+            usage: Optional function returning the actual tokens used from the result
+
+        Raises:
+            QuotaExhaustedError: if the call is still rate limited after max_attempts
+        """
+        model = self._normalize(model)
+        backoff = DEFAULT_BACKOFF_SECONDS
+        for attempt in range(1, self.max_attempts + 1):
+            with tracer.span("rate limit wait", "llm", model=model, estimated_tokens=estimated_tokens):
+                self.acquire(model, estimated_tokens)
+            try:
+                result = call()
+            except Exception as e:
+                if not is_rate_limit_error(e):
+                    raise
+
+                delay = retry_after_seconds(e) or backoff
+                backoff = min(backoff * 2, MAX_BACKOFF_SECONDS)
+                self.pause(model, delay)
+
+                if attempt == self.max_attempts:
+                    with self._cond:
+                        state = self._state(model)
+                        state.exhausted_until = max(state.exhausted_until, time.monotonic() + max(delay, MAX_BACKOFF_SECONDS))
+                    raise QuotaExhaustedError(f"429 rate limit for {model} after {attempt} attempts: {str(e)}") from e
+
+                print(f"Rate limited by {model}; pausing all requests for {delay:.1f}s "
+                      f"({self.queue_depth(model)} queued, attempt {attempt}/{self.max_attempts})")
+                continue
+
+            if usage is not None:
+                actual_tokens = usage(result)
+                if actual_tokens is not None:
+                    self.record_usage(model, estimated_tokens, actual_tokens)
+            return result
+
+quota_scheduler = QuotaScheduler()
+
+def configure_rate_limits(requests_per_minute: Optional[float] = None, tokens_per_minute: Optional[float] = None,
+                          model: Optional[str] = None):
+    """Set the process-wide request and token limits, for one model or as the default."""
+    quota_scheduler.configure(model, requests_per_minute, tokens_per_minute)
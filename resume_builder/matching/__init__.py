@@ -0,0 +1,2 @@
+"""Resume matching package."""
+# This file makes the matching directory a Python package
\ No newline at end of file
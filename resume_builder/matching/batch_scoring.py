@@ -0,0 +1,129 @@
+from typing import Dict, Iterable, List, Mapping, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+from resume_builder.models.resume import Resume
+from resume_builder.matching.resume_index import ResumeIndex
+
+# Match status of a keyword in the resume term vector
+MISSING, PARTIAL, EXACT = 0, 1, 2
+MATCH_STATUS = {None: MISSING, "partial": PARTIAL, "exact": EXACT}
+
+SCORE_COLUMNS = [
+    "score", "total_keywords", "matched", "partial", "missing",
+    "matches", "partial_matches", "missing_keywords"
+]
+
+KeywordSets = Union[Mapping[str, List[str]], Iterable[Tuple[str, List[str]]]]
+
+class KeywordSetMatrix:
+    """
+    Sparse keyword-by-job matrix for scoring resumes against many jobs at once.
+
+    Stored as coordinate arrays: entry i says job rows[i] lists keyword
+    cols[i] of the shared vocabulary. Each distinct keyword is looked up in
+    a resume once, however many jobs list it, and the per-job counts are then
+    summed with NumPy instead of scoring every job separately.
+    """
+
+    def __init__(self, keyword_sets: KeywordSets):
+        """
+        Args:
+            keyword_sets: Mapping (or iterable of pairs) of job ID to that job's ATS keywords
+        """
+        items = keyword_sets.items() if isinstance(keyword_sets, Mapping) else keyword_sets
+
+        self.job_ids: List[str] = []
+        self.vocabulary: List[str] = []
+        vocabulary_ids: Dict[str, int] = {}
+        rows: List[int] = []
+        cols: List[int] = []
+
+        for row, (job_id, keywords) in enumerate(items):
+            self.job_ids.append(job_id)
+            for keyword in keywords:
+                col = vocabulary_ids.get(keyword)
+                if col is None:
+                    col = vocabulary_ids[keyword] = len(self.vocabulary)
+                    self.vocabulary.append(keyword)
+                rows.append(row)
+                cols.append(col)
+
+        # Entries are in job order, so each job's keywords form one contiguous run
+        self.rows = np.asarray(rows, dtype=np.int32)
+        self.cols = np.asarray(cols, dtype=np.int32)
+        self.totals = np.bincount(self.rows, minlength=len(self.job_ids))
+
+    def __len__(self) -> int:
+        return len(self.job_ids)
+
+    def resume_vector(self, index: ResumeIndex) -> np.ndarray:
+        """Match status (MISSING, PARTIAL or EXACT) of every vocabulary keyword in an indexed resume."""
+        return np.fromiter(
+            (MATCH_STATUS[index.match(keyword)] for keyword in self.vocabulary),
+            dtype=np.int8,
+            count=len(self.vocabulary)
+        )
+
+    def score(self, index: ResumeIndex, include_keywords: bool = True) -> pd.DataFrame:
+        """
+        Score an indexed resume against every job.
+
+        Scores follow analyze_resume_ats_score: exact matches count fully,
+        partial matches count half, and a job without keywords scores 100.
+
+        Args:
+            index: ResumeIndex of the resume
+            include_keywords: Also list the matched, partial and missing keywords of each job
+
+        Returns:
+            DataFrame indexed by job ID with the columns in SCORE_COLUMNS
+            (without the keyword lists if include_keywords is False)
+        """
+        job_count = len(self.job_ids)
+        statuses = self.resume_vector(index)[self.cols]
+
+        matched = np.bincount(self.rows, weights=statuses == EXACT, minlength=job_count).astype(np.int64)
+        partial = np.bincount(self.rows, weights=statuses == PARTIAL, minlength=job_count).astype(np.int64)
+        scores = np.where(
+            self.totals > 0,
+            (matched + 0.5 * partial) / np.maximum(self.totals, 1) * 100,
+            100.0
+        )
+
+        frame = pd.DataFrame({
+            "score": scores,
+            "total_keywords": self.totals,
+            "matched": matched,
+            "partial": partial,
+            "missing": self.totals - matched - partial
+        }, index=pd.Index(self.job_ids, name="job_id"))
+
+        if include_keywords:
+            vocabulary = np.asarray(self.vocabulary, dtype=object)
+            for column, status in (("matches", EXACT), ("partial_matches", PARTIAL), ("missing_keywords", MISSING)):
+                # Entries keep their job order when masked, so each job's keywords are one slice
+                selected = statuses == status
+                keywords = vocabulary[self.cols[selected]].tolist()
+                ends = np.cumsum(np.bincount(self.rows[selected], minlength=job_count)).tolist()
+                frame[column] = [keywords[start:end] for start, end in zip([0] + ends[:-1], ends)]
+
+        return frame
+
+def score_keyword_sets(resume: Resume, keyword_sets: KeywordSets, stemming: bool = True,
+                       include_keywords: bool = True) -> pd.DataFrame:
+    """
+    Score one resume against the ATS keywords of many jobs in one pass.
+
+    Args:
+        resume: The resume to score
+        keyword_sets: Mapping (or iterable of pairs) of job ID to that job's ATS keywords
+        stemming: Match inflected forms of keywords (see ResumeIndex)
+        include_keywords: Also list the matched, partial and missing keywords of each job
+
+    Returns:
+        DataFrame of scores indexed by job ID, see KeywordSetMatrix.score
+    """
+    index = ResumeIndex.build(resume, stemming=stemming)
+    return KeywordSetMatrix(keyword_sets).score(index, include_keywords=include_keywords)
@@ -0,0 +1,130 @@
+from collections import defaultdict
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+GRAM_SIZE = 2
+
+# Words shorter than this only ever match exactly; "go" is not a typo of "r"
+MIN_FUZZY_LENGTH = 4
+
+# A near miss: (indexed term, edit distance, confidence between 0 and 1)
+NearMiss = Tuple[str, int, float]
+
+def max_edits(length: int) -> int:
+    """Get the number of typos tolerated in a term of this length."""
+    if length < MIN_FUZZY_LENGTH:
+        return 0
+    return 1 if length < 8 else 2
+
+def grams(term: str, size: int = GRAM_SIZE) -> Set[str]:
+    """Get the character n-grams of a term, padded so its first and last characters get their own grams."""
+    padded = "\x02" + term + "\x03"
+    return {padded[start:start + size] for start in range(len(padded) - size + 1)}
+
+def edit_distance(a: str, b: str, limit: int) -> int:
+    """
+    Get the edit distance between two strings, counting a swap of adjacent characters as one edit.
+
+    Gives up early once the distance must exceed limit, and then returns limit + 1.
+    """
+    if abs(len(a) - len(b)) > limit:
+        return limit + 1
+
+    # Only cells within limit of the diagonal can hold a distance within limit
+    beyond = limit + 1
+    previous2: List[int] = []
+    previous = [j if j <= limit else beyond for j in range(len(b) + 1)]
+    for i in range(1, len(a) + 1):
+        current = [beyond] * (len(b) + 1)
+        if i <= limit:
+            current[0] = i
+        for j in range(max(1, i - limit), min(len(b), i + limit) + 1):
+            cost = 0 if a[i - 1] == b[j - 1] else 1
+            distance = min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + cost)
+            if i > 1 and j > 1 and a[i - 1] == b[j - 2] and a[i - 2] == b[j - 1]:
+                distance = min(distance, previous2[j - 2] + 1)
+            current[j] = distance
+        if min(current) > limit:
+            return beyond
+        previous2, previous = previous, current
+    return min(previous[-1], beyond)
+
+class FuzzyIndex:
+    """
+    Character n-gram index for finding the terms within a few typos of a query.
+
+    Two strings within k edits share all but at most k * (n + 1) of their
+    n-grams, so a term within k edits of the query must contain at least one
+    of any k * (n + 1) + 1 of the query's n-grams. Candidates are collected
+    from the postings of the query's rarest n-grams only, filtered by the
+    number of n-grams they share, and only the survivors are verified with
+    the (bounded) edit distance, instead of comparing the query with every term.
+    """
+
+    def __init__(self, terms: Iterable[str], gram_size: int = GRAM_SIZE):
+        self.gram_size = gram_size
+        self.terms: List[str] = []
+        self._grams: List[Set[str]] = []
+        self._postings: Dict[str, List[int]] = defaultdict(list)
+
+        for term in dict.fromkeys(terms):
+            term_grams = grams(term, gram_size)
+            for gram in term_grams:
+                self._postings[gram].append(len(self.terms))
+            self.terms.append(term)
+            self._grams.append(term_grams)
+        self._postings = dict(self._postings)
+
+    def __len__(self) -> int:
+        return len(self.terms)
+
+    def near(self, query: str, max_distance: Optional[int] = None) -> List[NearMiss]:
+        """
+        Find the indexed terms within max_distance edits of a query, closest first.
+
+        Args:
+            query: The term to look up, normalized the same way as the indexed terms
+            max_distance: Edits tolerated; by default depends on the query length (see max_edits)
+
+        Returns:
+            List of (term, edit distance, confidence), where confidence is
+            1 minus the share of the longer string that had to be edited
+        """
+        limit = max_edits(len(query)) if max_distance is None else max_distance
+        found = []
+        for term in self._candidates(query, limit):
+            distance = edit_distance(query, term, limit)
+            if distance <= limit:
+                found.append((term, distance, 1 - distance / max(len(query), len(term))))
+        found.sort(key=lambda item: (item[1], -item[2], item[0]))
+        return found
+
+    def closest(self, query: str, max_distance: Optional[int] = None) -> Optional[NearMiss]:
+        """Get the closest indexed term within max_distance edits of a query, or None."""
+        limit = max_edits(len(query)) if max_distance is None else max_distance
+        best: Optional[NearMiss] = None
+        for term in self._candidates(query, limit):
+            # Once a match is found, only terms at least as close can replace it
+            distance = edit_distance(query, term, best[1] if best else limit)
+            if distance <= (best[1] if best else limit):
+                candidate = (term, distance, 1 - distance / max(len(query), len(term)))
+                if best is None or (distance, -candidate[2], term) < (best[1], -best[2], best[0]):
+                    best = candidate
+        return best
+
+    def _candidates(self, query: str, limit: int) -> List[str]:
+        # Terms that pass the n-gram filters, those sharing the most n-grams with the query first
+        query_grams = grams(query, self.gram_size)
+        lost = limit * (self.gram_size + 1)
+
+        rarest = sorted(query_grams, key=lambda gram: len(self._postings.get(gram, ())))[:lost + 1]
+        candidates = {term_id for gram in rarest for term_id in self._postings.get(gram, ())}
+
+        needed = len(query_grams) - lost
+        passed = []
+        for term_id in candidates:
+            term_grams = self._grams[term_id]
+            shared = len(query_grams & term_grams)
+            if shared >= needed and shared >= len(term_grams) - lost:
+                passed.append((-shared, term_id))
+        passed.sort()
+        return [self.terms[term_id] for _, term_id in passed]
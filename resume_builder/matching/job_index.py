@@ -0,0 +1,109 @@
+from functools import lru_cache
+from typing import Dict, FrozenSet, Optional, Set, Tuple
+
+from resume_builder.models.job import JobDescription
+from resume_builder.matching.tokens import stem, tokenize
+from resume_builder.matching.skill_taxonomy import get_skill_taxonomy, skill_token
+from resume_builder.matching.resume_index import SectionIndex, keyword_terms
+from resume_builder.matching.fuzzy import FuzzyIndex
+
+class JobIndex:
+    """
+    Lookup structures for the requirements of one job description.
+
+    Skills are kept as their keyword phrases (see keyword_terms), under which
+    every spelling of a known skill is the same, and the skills, title and
+    responsibilities as token indexes. Checking where a keyword appears in
+    the job then costs a few lookups, however many keywords are checked or
+    however long the posting is. Matching is by whole words, like resume
+    scoring: "Java" is not found in "JavaScript".
+    """
+
+    def __init__(self, job: JobDescription, stemming: bool = True):
+        self.stemming = stemming
+        self.required: Set[Tuple[str, ...]] = {keyword_terms(skill, stemming)[0] for skill in job.required_skills}
+        self.preferred: Set[Tuple[str, ...]] = {keyword_terms(skill, stemming)[0] for skill in job.preferred_skills}
+        self._skill_phrases = (self.required | self.preferred) - {()}
+
+        self.skills = SectionIndex("skills", tuple(job.required_skills + job.preferred_skills), stemming)
+        self.title = SectionIndex("title", (job.title,), stemming)
+        self.responsibilities = SectionIndex("responsibilities", tuple(job.key_responsibilities), stemming)
+
+        # Skills by their normalized text, for catching misspelled keywords ("Pyhton")
+        self._skill_names: Dict[str, str] = {}
+        for skill in job.required_skills + job.preferred_skills:
+            self._skill_names.setdefault(" ".join(tokenize(skill, stemming=False)), skill)
+        self._fuzzy: Optional[FuzzyIndex] = None
+        self._closest: Dict[str, Optional[Tuple[str, float]]] = {}
+
+    def _phrase(self, keyword: str) -> Tuple[str, ...]:
+        return keyword_terms(keyword, self.stemming)[0]
+
+    def is_skill(self, keyword: str) -> bool:
+        """Whether the keyword is one of the required or preferred skills, in any spelling."""
+        tokens = self._phrase(keyword)
+        return tokens in self.required or tokens in self.preferred
+
+    def is_required(self, keyword: str) -> bool:
+        """Whether the keyword is one of the required skills, in any spelling."""
+        return self._phrase(keyword) in self.required
+
+    def in_skills(self, keyword: str) -> bool:
+        """Whether the keyword appears within a skill ("Python" in "Python scripting") or a skill within it."""
+        tokens = self._phrase(keyword)
+        if tokens and self.skills.has_phrase(tokens):
+            return True
+        return not self._skill_phrases.isdisjoint(sub_phrases(keyword, self.stemming))
+
+    def closest_skill(self, keyword: str) -> Optional[Tuple[str, int, float]]:
+        """
+        Get the job skill a keyword is a near miss of ("Tensorflow2" for "TensorFlow").
+
+        Returns:
+            Tuple of (the skill as the job writes it, edit distance, confidence
+            between 0 and 1), or None
+        """
+        if keyword not in self._closest:
+            if self._fuzzy is None:
+                self._fuzzy = FuzzyIndex(self._skill_names)
+            closest = self._fuzzy.closest(" ".join(tokenize(keyword, stemming=False)))
+            self._closest[keyword] = (self._skill_names[closest[0]],) + closest[1:] if closest else None
+        return self._closest[keyword]
+
+    def in_title(self, keyword: str) -> bool:
+        tokens = self._phrase(keyword)
+        return bool(tokens) and self.title.has_phrase(tokens)
+
+    def in_responsibilities(self, keyword: str) -> bool:
+        """Whether the keyword appears in any one of the key responsibilities."""
+        tokens = self._phrase(keyword)
+        return bool(tokens) and self.responsibilities.has_phrase(tokens)
+
+@lru_cache(maxsize=8192)
+def sub_phrases(keyword: str, stemming: bool = True) -> FrozenSet[Tuple[str, ...]]:
+    """Every run of a keyword's tokens, plus the skill token of each known skill it names."""
+    words = tokenize(keyword, stemming=False)
+    tokens = [stem(word) for word in words] if stemming else words
+    phrases = {tuple(tokens[start:end]) for start in range(len(tokens)) for end in range(start + 1, len(tokens) + 1)}
+    phrases.update((skill_token(skill_id),) for _, _, skill_id in get_skill_taxonomy().find(words))
+    return frozenset(phrases)
+
+def _fingerprint(job: JobDescription) -> Tuple:
+    # Tuples of the same string objects compare by identity, so checking an unchanged job is cheap
+    return (job.title, tuple(job.required_skills), tuple(job.preferred_skills), tuple(job.key_responsibilities))
+
+def job_index(job: JobDescription, stemming: bool = True) -> JobIndex:
+    """
+    Get the index of a job description, building it on first use.
+
+    The index is cached on the job object itself and rebuilt only if the
+    title, skills or responsibilities have changed since.
+    """
+    fingerprint = _fingerprint(job)
+    cached = job._indexes.get(stemming)
+    if cached is not None and cached[0] == fingerprint:
+        return cached[1]
+
+    index = JobIndex(job, stemming)
+    job._indexes[stemming] = (fingerprint, index)
+    return index
@@ -0,0 +1,266 @@
+import os
+import re
+import math
+import time
+import hashlib
+import threading
+from collections import Counter
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from resume_builder.cache.settings import cache_settings
+from resume_builder.cache.job_cache import normalize_job_text
+from resume_builder.cache.sqlite import connect
+from resume_builder.matching.tokens import TOKEN_PATTERN
+
+# Phrases never span punctuation, bullets or line breaks ("." only ends a sentence when followed by a space)
+CHUNK_BOUNDARY = re.compile(r"[,;:!?()\[\]{}|\"*•·–—\n\r\t]+|\.(?=\s|$)|\s-\s")
+
+MAX_PHRASE_WORDS = 3
+# Without enough postings the document frequencies say little about what is distinctive
+MIN_CORPUS_DOCUMENTS = 20
+# A phrase is only a candidate if other postings use it too, or this posting repeats it
+MIN_PHRASE_DOCUMENT_FREQUENCY = 2
+
+# Terms used by more than this share of postings are boilerplate, however often a posting repeats them
+MAX_DOCUMENT_SHARE = 0.25
+
+# BM25 term-frequency saturation and length normalization
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+class CorpusSettings:
+    """Process-wide keyword corpus switches (set from --keyword-corpus/--no-keyword-corpus), independent of the caches."""
+
+    def __init__(self):
+        self.enabled = os.environ.get("RESUME_BUILDER_NO_KEYWORD_CORPUS", "") == ""
+        # None keeps the corpus in the cache directory
+        self.path = os.environ.get("RESUME_BUILDER_KEYWORD_CORPUS") or None
+
+corpus_settings = CorpusSettings()
+
+def configure_keyword_corpus(enabled: bool = True, path: Optional[str] = None):
+    """
+    Configure the keyword corpus for this process.
+
+    Args:
+        enabled: Add analyzed postings to the corpus and rank keywords against it if True
+        path: SQLite file of the corpus (None keeps the current one)
+    """
+    corpus_settings.enabled = enabled
+    if path:
+        corpus_settings.path = path
+
+def corpus_path() -> str:
+    """Get the path of the configured keyword corpus."""
+    return corpus_settings.path or os.path.join(cache_settings.cache_dir, "keyword_corpus.sqlite3")
+
+STOPWORDS = frozenset("""
+a about above across after again against all also am an and any are as at be because been before being
+below between both but by can could did do does doing down during each either etc e.g i.e few for from
+further had has have having he her here hers him his how if in into is it its itself just least less
+like may me might more most must my no nor not now of off on once only or other our ours out over own
+per plus same shall she should so some such than that the their theirs them then there these they this
+those through to too under until up upon us very via was we were what when where whether which while
+who whom why will with within without would yet you your yours
+ability able around based big candidate candidates company concern day deep excellent expect expertise
+familiar field good great help highly ideal including join key knowledge looking lot many new
+nice part plus preferred proven related required requirement requirements responsibilities
+responsibility role seeking skills strong team teams track using well work working year years
+""".split())
+
+# Verbs that open responsibility bullets; they may end a phrase ("system design") but never start a term
+ACTION_VERBS = frozenset("""
+apply build collaborate contribute create define deliver design develop drive ensure evaluate help
+implement improve lead maintain manage own partner provide research support use work write
+""".split())
+
+def _chunks(text: str) -> Iterator[List[str]]:
+    # Runs of tokens that a phrase may span, in their original case
+    for chunk in CHUNK_BOUNDARY.split(text):
+        tokens = TOKEN_PATTERN.findall(chunk)
+        if tokens:
+            yield tokens
+
+def _is_term_word(word: str) -> bool:
+    return len(word) > 1 and word not in STOPWORDS and not word.replace(".", "").isdigit()
+
+def candidate_terms(text: str) -> Tuple[Counter, Dict[str, str]]:
+    """
+    Count the candidate keyword terms of a text: single words and phrases of up to three words.
+
+    Terms are lower-cased. Stopwords and numbers are never terms, and phrases
+    contain no stopwords and stay within one clause.
+
+    Returns:
+        Tuple of (term counts, the first surface form of each term as written in the text)
+    """
+    counts: Counter = Counter()
+    surface: Dict[str, str] = {}
+    for tokens in _chunks(text):
+        words = [token.lower() for token in tokens]
+        for start in range(len(words)):
+            if not _is_term_word(words[start]) or words[start] in ACTION_VERBS:
+                continue
+            for end in range(start + 1, min(start + MAX_PHRASE_WORDS, len(words)) + 1):
+                if not _is_term_word(words[end - 1]):
+                    break
+                term = " ".join(words[start:end])
+                counts[term] += 1
+                surface.setdefault(term, " ".join(tokens[start:end]))
+    return counts, surface
+
+class KeywordCorpus:
+    """
+    SQLite-backed document frequencies of keyword terms over a corpus of job postings.
+
+    Postings are added one at a time and the statistics are updated in place,
+    so the corpus grows as new postings arrive. Each posting is counted once,
+    keyed by its normalized text (see normalize_job_text).
+    """
+
+    def __init__(self, db_path: Optional[str] = None):
+        self.db_path = db_path or corpus_path()
+        self._lock = threading.Lock()
+        self._stats: Optional[Tuple[int, float]] = None
+
+        os.makedirs(os.path.dirname(os.path.abspath(self.db_path)), exist_ok=True)
+        with connect(self.db_path) as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS documents (
+                    key TEXT PRIMARY KEY,
+                    length INTEGER NOT NULL,
+                    added_at REAL NOT NULL
+                )
+            """)
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS terms (
+                    term TEXT PRIMARY KEY,
+                    df INTEGER NOT NULL
+                )
+            """)
+
+    def add(self, posting_text: str) -> bool:
+        """Add a posting's terms to the corpus. Returns False if the posting was already in it."""
+        key = hashlib.sha256(normalize_job_text(posting_text).encode('utf-8')).hexdigest()
+        counts, _ = candidate_terms(posting_text)
+        length = sum(count for term, count in counts.items() if " " not in term)
+
+        with self._lock, connect(self.db_path) as conn:
+            cursor = conn.execute(
+                "INSERT OR IGNORE INTO documents (key, length, added_at) VALUES (?, ?, ?)",
+                (key, length, time.time())
+            )
+            if cursor.rowcount == 0:
+                return False
+            conn.executemany(
+                "INSERT INTO terms (term, df) VALUES (?, 1) ON CONFLICT(term) DO UPDATE SET df = df + 1",
+                ((term,) for term in counts)
+            )
+            self._stats = None
+        return True
+
+    def add_many(self, posting_texts: Iterable[str]) -> int:
+        """Add several postings. Returns the number that were new to the corpus."""
+        return sum(1 for text in posting_texts if self.add(text))
+
+    def stats(self) -> Tuple[int, float]:
+        """Get the number of postings and their average length in words."""
+        with self._lock:
+            if self._stats is None:
+                with connect(self.db_path) as conn:
+                    count, average = conn.execute("SELECT COUNT(*), AVG(length) FROM documents").fetchone()
+                self._stats = (count, average or 0.0)
+            return self._stats
+
+    def document_frequencies(self, terms: Iterable[str]) -> Dict[str, int]:
+        """Get the number of postings containing each term (terms never seen are left out)."""
+        terms = list(terms)
+        frequencies = {}
+        with connect(self.db_path) as conn:
+            # Stay under SQLite's limit on query parameters
+            for start in range(0, len(terms), 500):
+                batch = terms[start:start + 500]
+                placeholders = ", ".join("?" * len(batch))
+                frequencies.update(conn.execute(
+                    f"SELECT term, df FROM terms WHERE term IN ({placeholders})", batch
+                ).fetchall())
+        return frequencies
+
+class KeywordExtractor:
+    """
+    Rank the terms and phrases of a job description by how distinctive they are.
+
+    Terms are scored with BM25 against the corpus: frequent in this posting,
+    rare across postings. Boilerplate shared by most postings ("team",
+    "communication skills") sinks, while tools, domains and skills specific
+    to the role rise. Needs no model calls.
+    """
+
+    def __init__(self, corpus: KeywordCorpus, min_documents: int = MIN_CORPUS_DOCUMENTS):
+        self.corpus = corpus
+        self.min_documents = min_documents
+
+    @property
+    def ready(self) -> bool:
+        """Whether the corpus holds enough postings for its statistics to be meaningful."""
+        return self.corpus.stats()[0] >= self.min_documents
+
+    def rank(self, text: str, top_n: int = 20) -> List[Tuple[str, float]]:
+        """
+        Get the top_n most distinctive terms of a text with their scores, best first.
+
+        Single words that only occur as part of a higher-ranked phrase are left out.
+        """
+        document_count, average_length = self.corpus.stats()
+        if document_count == 0:
+            return []
+
+        counts, surface = candidate_terms(text)
+        frequencies = self.corpus.document_frequencies(counts)
+        length = sum(count for term, count in counts.items() if " " not in term)
+        length_norm = 1 - BM25_B + BM25_B * length / max(average_length, 1.0)
+
+        scored = []
+        for term, count in counts.items():
+            df = frequencies.get(term, 0)
+            if df > MAX_DOCUMENT_SHARE * document_count:
+                continue
+            if " " in term and df < MIN_PHRASE_DOCUMENT_FREQUENCY and count < 2:
+                continue
+            idf = math.log(1 + (document_count - df + 0.5) / (df + 0.5))
+            scored.append((term, idf * count * (BM25_K1 + 1) / (count + BM25_K1 * length_norm)))
+        scored.sort(key=lambda item: (-item[1], item[0]))
+
+        ranked: List[Tuple[str, float]] = []
+        # Occurrences of each word already accounted for by a chosen phrase
+        covered: Counter = Counter()
+        for term, score in scored:
+            words = term.split()
+            if len(words) == 1 and counts[term] <= covered[term]:
+                continue
+            ranked.append((surface[term], score))
+            if len(words) > 1:
+                for word in words:
+                    covered[word] = max(covered[word], counts[term])
+            if len(ranked) >= top_n:
+                break
+        return ranked
+
+    def extract(self, text: str, top_n: int = 20) -> List[str]:
+        """Get the top_n most distinctive terms of a text, or [] while the corpus is too small."""
+        if not self.ready:
+            return []
+        return [term for term, _ in self.rank(text, top_n)]
+
+_default_extractor = None
+_default_extractor_lock = threading.Lock()
+
+def get_keyword_extractor() -> KeywordExtractor:
+    """Get the shared keyword extractor over the configured corpus (see corpus_path)."""
+    global _default_extractor
+    db_path = corpus_path()
+    with _default_extractor_lock:
+        if _default_extractor is None or _default_extractor.corpus.db_path != db_path:
+            _default_extractor = KeywordExtractor(KeywordCorpus(db_path))
+        return _default_extractor
@@ -0,0 +1,153 @@
+import threading
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Any, Dict, FrozenSet, List, Sequence, Set, Tuple
+
+from resume_builder.models.resume import Resume
+from resume_builder.matching.tokens import stem
+from resume_builder.matching.resume_index import keyword_terms, resume_sections, section_index
+from resume_builder.matching.skill_taxonomy import SKILL_TOKEN_PREFIX, get_skill_taxonomy
+from resume_builder.matching.fuzzy import MIN_FUZZY_LENGTH
+
+# What one section holds of a keyword set: the keyword phrases found in it, the keyword tokens
+# present, and near misses (token, section word, confidence) of keyword tokens it lacks
+SectionMatches = Tuple[FrozenSet[Tuple[str, ...]], FrozenSet[str], Tuple[Tuple[str, str, float], ...]]
+
+DEFAULT_MAX_SECTIONS = 512
+
+class KeywordScorer:
+    """
+    ATS keyword scoring for one keyword set that remembers what each resume section matched.
+
+    The match state of every section is kept by the section's text. Scoring
+    a resume again after some sections changed (an optimization round
+    usually only rewrites the summary and skills) examines just the changed
+    sections and merges their state with the stored state of the rest, so
+    repeated optimize/score rounds cost little beyond the edited text.
+    Safe to share across threads.
+    """
+
+    def __init__(self, keywords: Sequence[str], stemming: bool = True, max_sections: int = DEFAULT_MAX_SECTIONS):
+        self.keywords = list(keywords)
+        self.stemming = stemming
+        self.max_sections = max_sections
+        self.sections_examined = 0
+
+        self._terms = [keyword_terms(keyword, stemming) for keyword in self.keywords]
+        self._phrases = {tokens for tokens, _ in self._terms if tokens}
+        self._tokens = {token for tokens, significant in self._terms for token in tokens + significant}
+        # Words looked up for near misses, each with the keyword token it stands for. A skill token
+        # stands for the skill's one-word name and aliases ("Pyhton" is a near miss of "python");
+        # short words only match exactly
+        self._fuzzy_tokens: Dict[str, str] = {}
+        taxonomy = get_skill_taxonomy()
+        for token in self._tokens:
+            if token.startswith(SKILL_TOKEN_PREFIX):
+                variants = [tokens[0] for tokens in taxonomy.variants(token[len(SKILL_TOKEN_PREFIX):]) if len(tokens) == 1]
+                words = [stem(word) if stemming else word for word in variants]
+            else:
+                words = [token]
+            for word in words:
+                if len(word) >= MIN_FUZZY_LENGTH:
+                    self._fuzzy_tokens.setdefault(word, token)
+
+        self._sections: "OrderedDict[Tuple[str, Tuple[str, ...]], SectionMatches]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _examine(self, name: str, fields: Tuple[str, ...]) -> SectionMatches:
+        section = section_index(name, fields, self.stemming)
+        phrases = frozenset(tokens for tokens in self._phrases if section.has_phrase(tokens))
+        tokens = frozenset(token for token in self._tokens if section.has_token(token))
+        # Best near miss of each keyword token the section lacks, over the words standing for it
+        near: Dict[str, Tuple[str, float]] = {}
+        for word, token in self._fuzzy_tokens.items():
+            if token in tokens:
+                continue
+            closest = section.near_miss(word)
+            if closest and (token not in near or closest[2] > near[token][1]):
+                near[token] = (section.words.get(closest[0], closest[0]), closest[2])
+        return phrases, tokens, tuple((token, word, confidence) for token, (word, confidence) in near.items())
+
+    def section_matches(self, name: str, fields: Tuple[str, ...]) -> SectionMatches:
+        """Get the match state of one section, examining it only if this text has not been seen before."""
+        key = (name, fields)
+        with self._lock:
+            matches = self._sections.get(key)
+            if matches is not None:
+                self._sections.move_to_end(key)
+                return matches
+
+        matches = self._examine(name, fields)
+        with self._lock:
+            self.sections_examined += 1
+            self._sections[key] = matches
+            while len(self._sections) > self.max_sections:
+                self._sections.popitem(last=False)
+        return matches
+
+    def score(self, resume: Resume) -> Dict[str, Any]:
+        """
+        Score a resume against the keyword set.
+
+        Returns:
+            Dict with 'score', 'matches', 'missing', 'partial_matches',
+            'fuzzy_matches' and 'total_keywords', as returned by
+            ATSOptimizer.analyze_resume_ats_score
+        """
+        found_phrases: Set[Tuple[str, ...]] = set()
+        found_tokens: Set[str] = set()
+        # Best near miss of each keyword token, as (resume word, confidence)
+        found_near: Dict[str, Tuple[str, float]] = {}
+        for name, fields in resume_sections(resume):
+            phrases, tokens, near = self.section_matches(name, fields)
+            found_phrases |= phrases
+            found_tokens |= tokens
+            for token, word, confidence in near:
+                if token not in found_near or confidence > found_near[token][1]:
+                    found_near[token] = (word, confidence)
+
+        matches: List[str] = []
+        missing: List[str] = []
+        partial_matches: List[str] = []
+        for keyword, (tokens, significant) in zip(self.keywords, self._terms):
+            # Exact: the keyword's words appear together; partial: all its significant words appear somewhere
+            if tokens in found_phrases:
+                matches.append(keyword)
+            elif len(tokens) > 1 and significant and found_tokens.issuperset(significant):
+                partial_matches.append(keyword)
+            else:
+                missing.append(keyword)
+
+        # Near misses are reported, not credited: an ATS would not match them either
+        fuzzy_matches: List[Dict[str, Any]] = []
+        for keyword in missing:
+            tokens, _ = keyword_terms(keyword, self.stemming)
+            typos = [token for token in tokens if token not in found_tokens]
+            if tokens and typos and all(token in found_near for token in typos):
+                fuzzy_matches.append({
+                    "keyword": keyword,
+                    "match": " ".join(found_near[token][0] for token in typos),
+                    "confidence": min(found_near[token][1] for token in typos)
+                })
+
+        total_keywords = len(self.keywords)
+        if total_keywords == 0:
+            return {"score": 100, "matches": [], "missing": [], "partial_matches": [], "fuzzy_matches": [],
+                    "total_keywords": 0}
+
+        # Partial matches get half credit
+        match_percentage = ((len(matches) + (len(partial_matches) * 0.5)) / total_keywords) * 100
+
+        return {
+            "score": match_percentage,
+            "matches": matches,
+            "missing": missing,
+            "partial_matches": partial_matches,
+            "fuzzy_matches": fuzzy_matches,
+            "total_keywords": total_keywords
+        }
+
+@lru_cache(maxsize=32)
+def get_keyword_scorer(keywords: Tuple[str, ...], stemming: bool = True) -> KeywordScorer:
+    """Get the shared scorer for a keyword set, so every scoring of it reuses the same section state."""
+    return KeywordScorer(keywords, stemming)
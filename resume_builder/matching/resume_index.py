@@ -0,0 +1,191 @@
+from collections import defaultdict
+from functools import lru_cache
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple
+
+from resume_builder.models.resume import Resume
+from resume_builder.matching.tokens import stem, tokenize
+from resume_builder.matching.skill_taxonomy import SKILL_TOKEN_PREFIX, get_skill_taxonomy, skill_token
+from resume_builder.matching.fuzzy import FuzzyIndex, NearMiss
+
+# Words of a multi-word keyword shorter than this are ignored when checking for a partial match
+MIN_PARTIAL_WORD_LENGTH = 4
+
+@lru_cache(maxsize=4096)
+def keyword_terms(keyword: str, stemming: bool = True) -> Tuple[Tuple[str, ...], Tuple[str, ...]]:
+    """
+    Get the tokens of a keyword and the significant ones among them.
+
+    A keyword that names a known skill ("K8s") becomes that skill's token, so
+    it matches whichever variant the resume uses ("Kubernetes"). Within a
+    longer keyword, skill names count towards a partial match the same way.
+
+    Returns:
+        Tuple of (all tokens, tokens of words long enough to count towards a partial match)
+    """
+    taxonomy = get_skill_taxonomy()
+    words = tokenize(keyword, stemming=False)
+    skill_id = taxonomy.lookup(words)
+    if skill_id:
+        return (skill_token(skill_id),), ()
+
+    tokens = tuple(stem(word) for word in words) if stemming else tuple(words)
+    # Words of a skill name count towards a partial match through the skill's token instead
+    spans = list(taxonomy.find(words))
+    covered = {index for start, end, _ in spans for index in range(start, end)}
+    significant = [
+        token for index, (word, token) in enumerate(zip(words, tokens))
+        if index not in covered and len(word) >= MIN_PARTIAL_WORD_LENGTH
+    ]
+    significant += [skill_token(skill_id) for _, _, skill_id in spans]
+    return tokens, tuple(significant)
+
+class SectionIndex:
+    """
+    Token positions within one section of a resume (e.g. experience or skills).
+
+    Besides its words, each known skill written in the section is indexed as
+    its skill token at the position where its name starts.
+    """
+
+    def __init__(self, name: str, fields: Tuple[str, ...], stemming: bool = True):
+        self.name = name
+        self.positions: Dict[str, Set[int]] = defaultdict(set)
+        # The first word (lower-cased, unstemmed) written for each token
+        self.words: Dict[str, str] = {}
+
+        taxonomy = get_skill_taxonomy()
+        position = 0
+        for field in fields:
+            words = tokenize(field, stemming=False)
+            for start, _, skill_id in taxonomy.find(words):
+                self.positions[skill_token(skill_id)].add(position + start)
+            for word in words:
+                token = stem(word) if stemming else word
+                self.positions[token].add(position)
+                self.words.setdefault(token, word)
+                position += 1
+            # Leave a gap so a phrase never spans two fields
+            position += 1
+        self.positions = dict(self.positions)
+        # Phrase lookups already answered; the index is immutable, so they stay valid while it is cached
+        self._phrases: Dict[Tuple[str, ...], bool] = {}
+        self._fuzzy: Optional[FuzzyIndex] = None
+        self._near: Dict[str, Optional[NearMiss]] = {}
+
+    def has_token(self, token: str) -> bool:
+        return token in self.positions
+
+    def near_miss(self, token: str) -> Optional[NearMiss]:
+        """Get the section token closest to a token within a few typos (see FuzzyIndex.closest), or None."""
+        if token not in self._near:
+            if self._fuzzy is None:
+                self._fuzzy = FuzzyIndex(token for token in self.positions if not token.startswith(SKILL_TOKEN_PREFIX))
+            self._near[token] = self._fuzzy.closest(token)
+        return self._near[token]
+
+    def has_phrase(self, tokens: Tuple[str, ...]) -> bool:
+        """Whether the tokens appear next to each other, in order, within one field."""
+        found = self._phrases.get(tokens)
+        if found is None:
+            found = self._phrases[tokens] = self._find_phrase(tokens)
+        return found
+
+    def _find_phrase(self, tokens: Tuple[str, ...]) -> bool:
+        postings = [self.positions.get(token) for token in tokens]
+        if not postings or not all(postings):
+            return False
+        if len(postings) == 1:
+            return True
+
+        # Try each occurrence of the rarest token as the anchor of the phrase
+        anchor = min(range(len(postings)), key=lambda i: len(postings[i]))
+        return any(
+            all(position - anchor + offset in positions for offset, positions in enumerate(postings))
+            for position in postings[anchor]
+        )
+
+def _string_values(value: Any) -> Iterator[str]:
+    if isinstance(value, str):
+        yield value
+    elif isinstance(value, dict):
+        for item in value.values():
+            yield from _string_values(item)
+    elif isinstance(value, (list, tuple)):
+        for item in value:
+            yield from _string_values(item)
+
+@lru_cache(maxsize=1024)
+def section_index(name: str, fields: Tuple[str, ...], stemming: bool = True) -> SectionIndex:
+    """Get the index of a section, cached by its text so unchanged sections are never re-tokenized."""
+    return SectionIndex(name, fields, stemming)
+
+def resume_sections(resume: Resume) -> List[Tuple[str, Tuple[str, ...]]]:
+    """Get the non-empty top-level sections of a resume as (name, field values) pairs."""
+    return [
+        (name, tuple(_string_values(value)))
+        for name, value in resume.model_dump().items()
+        if value
+    ]
+
+class ResumeIndex:
+    """
+    Token index of a resume's text, used for word-boundary-aware keyword matching.
+
+    Each top-level section (summary, skills, experience, ...) gets its own map
+    of normalized token -> positions, built from the field values only (not
+    field names). Keywords are then looked up instead of rescanning the text:
+    "Java" no longer matches "JavaScript", and "R" only matches the token "r".
+    Section indexes are cached by their text, so scoring an optimized copy of
+    a resume reuses every section the optimization left unchanged.
+    """
+
+    def __init__(self, sections: List[SectionIndex], stemming: bool = True):
+        self.sections = sections
+        self.stemming = stemming
+
+        # Which sections hold each token, so a lookup only visits sections that can match
+        self.token_sections: Dict[str, List[SectionIndex]] = defaultdict(list)
+        for section in sections:
+            for token in section.positions:
+                self.token_sections[token].append(section)
+        self.token_sections = dict(self.token_sections)
+
+    @classmethod
+    def build(cls, resume: Resume, stemming: bool = True) -> "ResumeIndex":
+        """Build (or reuse from the cache) the section indexes of a resume."""
+        sections = [section_index(name, fields, stemming) for name, fields in resume_sections(resume)]
+        return cls(sections, stemming)
+
+    def _candidate_sections(self, tokens: Tuple[str, ...]) -> List[SectionIndex]:
+        # Sections that contain every token of a phrase
+        holders = [self.token_sections.get(token) for token in tokens]
+        if not holders or not all(holders):
+            return []
+        fewest = min(holders, key=len)
+        return [section for section in fewest if all(section in sections for sections in holders)]
+
+    def has_phrase(self, tokens: Tuple[str, ...]) -> bool:
+        return any(section.has_phrase(tokens) for section in self._candidate_sections(tokens))
+
+    def has_token(self, token: str) -> bool:
+        return token in self.token_sections
+
+    def sections_with(self, keyword: str) -> List[str]:
+        """Names of the sections in which a keyword appears as a phrase."""
+        tokens, _ = keyword_terms(keyword, self.stemming)
+        return [section.name for section in self._candidate_sections(tokens) if section.has_phrase(tokens)]
+
+    def match(self, keyword: str) -> Optional[str]:
+        """
+        Look up a keyword.
+
+        Returns:
+            'exact' if its tokens appear as a phrase, 'partial' if it has several
+            words and all the significant ones appear somewhere, otherwise None
+        """
+        tokens, significant = keyword_terms(keyword, self.stemming)
+        if self.has_phrase(tokens):
+            return "exact"
+        if len(tokens) > 1 and significant and all(self.has_token(token) for token in significant):
+            return "partial"
+        return None
@@ -0,0 +1,136 @@
+import os
+import json
+import threading
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Set, Tuple
+
+from resume_builder.matching.tokens import tokenize
+
+DEFAULT_TAXONOMY_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "skill_taxonomy.json")
+
+# Section indexes hold this token (plus the skill ID) wherever any variant of a skill is written
+SKILL_TOKEN_PREFIX = "skill:"
+
+def skill_token(skill_id: str) -> str:
+    """Get the index token standing for every variant of a skill."""
+    return SKILL_TOKEN_PREFIX + skill_id
+
+class SkillTaxonomy:
+    """
+    Canonical skills and the variants they are written as ("JS", "ECMAScript" -> javascript).
+
+    Every variant is compiled to its lower-cased token tuple (see tokenize)
+    in one hash table, so looking up a skill name, or finding the skills in a
+    run of tokens, costs a few dict lookups per token rather than a scan of
+    the whole taxonomy.
+    """
+
+    def __init__(self, skills: Dict[str, Dict[str, Any]]):
+        """
+        Args:
+            skills: Mapping of skill ID to {"name": display name, "aliases": [other variants]}
+        """
+        self.names: Dict[str, str] = {}
+        self._variants: Dict[Tuple[str, ...], str] = {}
+        self._skill_variants: Dict[str, List[Tuple[str, ...]]] = {}
+        # A run of tokens can only start a variant if its first token starts one
+        self._first_tokens: Set[str] = set()
+        self.max_variant_length = 0
+
+        for skill_id, entry in skills.items():
+            name = entry.get("name", skill_id)
+            self.names[skill_id] = name
+            for variant in [name] + list(entry.get("aliases", [])):
+                tokens = tuple(tokenize(variant, stemming=False))
+                if not tokens:
+                    continue
+                owner = self._variants.setdefault(tokens, skill_id)
+                if owner != skill_id:
+                    raise ValueError(f"Skill variant '{variant}' is listed under both '{owner}' and '{skill_id}'")
+                if owner == skill_id and tokens not in self._skill_variants.get(skill_id, ()):
+                    self._skill_variants.setdefault(skill_id, []).append(tokens)
+                self._first_tokens.add(tokens[0])
+                self.max_variant_length = max(self.max_variant_length, len(tokens))
+
+    @classmethod
+    def load(cls, path: str = DEFAULT_TAXONOMY_PATH) -> "SkillTaxonomy":
+        """Load a taxonomy from a JSON file in the format of skill_taxonomy.json."""
+        with open(path, "r", encoding="utf-8") as f:
+            skills = json.load(f)
+        if not isinstance(skills, dict):
+            raise ValueError(f"Skill taxonomy {path} must map skill IDs to entries")
+        return cls(skills)
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def lookup(self, tokens: Sequence[str]) -> Optional[str]:
+        """Get the skill ID of a variant given as unstemmed tokens, or None if it is no known variant."""
+        return self._variants.get(tuple(tokens))
+
+    def canonical_id(self, text: str) -> Optional[str]:
+        """Get the skill ID a piece of text names ("K8s" -> "kubernetes"), or None if it names no known skill."""
+        return self.lookup(tokenize(text, stemming=False))
+
+    def canonical_key(self, text: str) -> str:
+        """
+        Get a key under which all spellings of the same skill compare equal.
+
+        Known skills map to their skill token; anything else to its normalized
+        words, so "Data  Pipelines" and "data pipelines" still compare equal.
+        """
+        tokens = tokenize(text, stemming=False)
+        skill_id = self.lookup(tokens)
+        return skill_token(skill_id) if skill_id else " ".join(tokens)
+
+    def display_name(self, skill_id: str) -> str:
+        return self.names.get(skill_id, skill_id)
+
+    def variants(self, skill_id: str) -> List[Tuple[str, ...]]:
+        """Get the unstemmed token tuples of a skill's name and aliases, name first."""
+        return list(self._skill_variants.get(skill_id, ()))
+
+    def find(self, tokens: Sequence[str]) -> Iterator[Tuple[int, int, str]]:
+        """
+        Find the skills written in a run of unstemmed tokens, longest variant first.
+
+        Yields:
+            Non-overlapping (start, end, skill ID) spans, left to right
+        """
+        start = 0
+        count = len(tokens)
+        while start < count:
+            if tokens[start] in self._first_tokens:
+                for end in range(min(count, start + self.max_variant_length), start, -1):
+                    skill_id = self._variants.get(tuple(tokens[start:end]))
+                    if skill_id:
+                        yield start, end, skill_id
+                        start = end
+                        break
+                else:
+                    start += 1
+            else:
+                start += 1
+
+    def dedupe(self, skills: Iterable[str]) -> List[str]:
+        """Drop the skills that repeat an earlier one under another spelling, keeping the first of each."""
+        seen: Set[str] = set()
+        unique = []
+        for skill in skills:
+            key = self.canonical_key(skill)
+            if key and key not in seen:
+                seen.add(key)
+                unique.append(skill)
+        return unique
+
+_default_taxonomy = None
+_default_taxonomy_lock = threading.Lock()
+
+def get_skill_taxonomy() -> SkillTaxonomy:
+    """Get the shared skill taxonomy (RESUME_BUILDER_SKILL_TAXONOMY may point to a replacement file)."""
+    global _default_taxonomy
+    with _default_taxonomy_lock:
+        if _default_taxonomy is None:
+            _default_taxonomy = SkillTaxonomy.load(
+                os.environ.get("RESUME_BUILDER_SKILL_TAXONOMY") or DEFAULT_TAXONOMY_PATH
+            )
+        return _default_taxonomy
@@ -0,0 +1,39 @@
+import re
+from typing import List
+
+# Words, numbers and tech terms such as "c++", "c#", ".net", "node.js" and "3.5"; "/" and "-" split tokens
+TOKEN_PATTERN = re.compile(r"\.?\w[\w+#]*(?:\.\w[\w+#]*)*")
+
+# Tokens shorter than this are never stemmed, so "aws", "sql" and "data" stay as they are
+MIN_STEM_LENGTH = 5
+
+def stem(token: str) -> str:
+    """
+    Strip common English inflections from a token ("engineers", "engineering" -> "engineer").
+
+    Deliberately light: only plural, -ing, -ed and trailing -e endings are
+    removed, and tokens that are short or contain digits or symbols are left alone.
+    """
+    if len(token) < MIN_STEM_LENGTH or not token.isalpha():
+        return token
+
+    if token.endswith("ies"):
+        token = token[:-3] + "y"
+    elif token.endswith("sses"):
+        token = token[:-2]
+    elif token.endswith("s") and not token.endswith(("ss", "us", "is")):
+        token = token[:-1]
+
+    for suffix in ("ing", "ed"):
+        if token.endswith(suffix) and len(token) - len(suffix) >= 4:
+            token = token[:-len(suffix)]
+            break
+
+    if token.endswith("e") and len(token) >= MIN_STEM_LENGTH:
+        token = token[:-1]
+    return token
+
+def tokenize(text: str, stemming: bool = True) -> List[str]:
+    """Split text into lower-cased (and optionally stemmed) tokens."""
+    tokens = TOKEN_PATTERN.findall(text.lower())
+    return [stem(token) for token in tokens] if stemming else tokens
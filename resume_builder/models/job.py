@@ -1,5 +1,5 @@
-from typing import List, Optional
-from pydantic import BaseModel
+from typing import Any, Dict, List, Optional
+from pydantic import BaseModel, PrivateAttr
 
 class JobDescription(BaseModel):
     title: str
@@ -10,4 +10,9 @@ class JobDescription(BaseModel):
     key_responsibilities: List[str]
     company_values: Optional[List[str]] = None
     experience_years: Optional[str] = None
-    education: Optional[List[str]] = None
\ No newline at end of file
+    education: Optional[List[str]] = None
+    
+    # Derived lookup structures (see resume_builder.matching.job_index), never serialized
+    _indexes: Dict[Any, Any] = PrivateAttr(default_factory=dict)
+    # The posting text the job was analyzed from (set by JobDescriptionAnalyzer), never serialized
+    _posting_text: Optional[str] = PrivateAttr(default=None)
\ No newline at end of file
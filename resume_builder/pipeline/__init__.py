@@ -0,0 +1,2 @@
+"""Resume pipeline package."""
+# This file makes the pipeline directory a Python package
\ No newline at end of file
@@ -0,0 +1,287 @@
+import os
+import re
+import csv
+import json
+import time
+from itertools import islice
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from resume_builder.models.resume import Resume
+from resume_builder.tools.resume_parser import ResumeParser
+from resume_builder.tools.job_analyzer import JobDescriptionAnalyzer
+from resume_builder.tools.keyword_processor import KeywordProcessor
+from resume_builder.tools.resume_generator import ResumeGenerator
+from resume_builder.tools.ats_optimizer import ATSOptimizer
+from resume_builder.pipeline.outputs import save_json, render_resume
+from resume_builder.pipeline.stages import run_bounded
+from resume_builder.pipeline.timing import StageTimer
+from resume_builder.cache.response_cache import get_response_cache
+from resume_builder.llm.scheduler import quota_scheduler
+
+SUMMARY_FIELDS = [
+    "job_id", "title", "company", "status", "ats_score_initial", "ats_score_final",
+    "matched_keywords", "missing_keywords", "output_path", "seconds", "error"
+]
+
+# Field names accepted for the posting text and its identifier in a JSONL feed
+JSONL_TEXT_FIELDS = ("job_description", "description", "text")
+JSONL_ID_FIELDS = ("job_id", "id")
+
+# Jobs analyzed and scored together before they are generated and written to the summary
+SCORE_BLOCK_SIZE = 100
+
+def _safe_job_id(job_id: str) -> str:
+    """Make a job identifier safe to use as a directory name."""
+    safe = re.sub(r'[^A-Za-z0-9._-]+', '_', str(job_id)).strip('._')
+    return safe or "job"
+
+def load_job_descriptions(jobs_dir: Optional[str] = None, jobs_jsonl: Optional[str] = None) -> Iterator[Tuple[str, str]]:
+    """
+    Yield (job_id, job_description) pairs from a directory or a JSONL feed.
+
+    Args:
+        jobs_dir: Directory of job description text files (*.txt, *.md); the
+                  file name without extension is used as the job ID
+        jobs_jsonl: JSONL file with one posting per line, holding the text in a
+                    'job_description', 'description' or 'text' field and an
+                    optional 'job_id' or 'id' field
+    """
+    if jobs_dir:
+        for file_name in sorted(os.listdir(jobs_dir)):
+            if not file_name.lower().endswith(('.txt', '.md')):
+                continue
+            with open(os.path.join(jobs_dir, file_name), 'r', encoding='utf-8') as f:
+                yield _safe_job_id(os.path.splitext(file_name)[0]), f.read()
+
+    if jobs_jsonl:
+        with open(jobs_jsonl, 'r', encoding='utf-8') as f:
+            for line_number, line in enumerate(f, 1):
+                line = line.strip()
+                if not line:
+                    continue
+                record = json.loads(line)
+                text = next((record[k] for k in JSONL_TEXT_FIELDS if record.get(k)), None)
+                if not text:
+                    print(f"Skipping line {line_number} of {jobs_jsonl}: no job description text found")
+                    continue
+                job_id = next((record[k] for k in JSONL_ID_FIELDS if record.get(k)), f"job_{line_number:04d}")
+                yield _safe_job_id(job_id), text
+
+class JobBatchRunner:
+    """Tailor one parsed resume to many job descriptions over a bounded worker pool."""
+
+    def __init__(self, api_key=None, output_format='pdf', template_name=None, user_keywords=None,
+                 skip_ats=False, max_workers=4, score_block_size=SCORE_BLOCK_SIZE):
+        self.output_format = output_format
+        self.template_name = template_name
+        self.user_keywords = user_keywords or []
+        self.skip_ats = skip_ats
+        self.max_workers = max(1, max_workers)
+        self.score_block_size = max(1, score_block_size)
+
+        # The tools keep no per-call state, so one instance of each is shared by all workers
+        self.job_analyzer = JobDescriptionAnalyzer(api_key=api_key)
+        self.keyword_processor = KeywordProcessor()
+        self.resume_generator = ResumeGenerator(api_key=api_key)
+        self.ats_optimizer = ATSOptimizer(api_key=api_key)
+
+    def analyze_job(self, job_id: str, job_description: str) -> Dict[str, Any]:
+        """
+        Analyze one job and extract its ATS keywords.
+
+        Returns:
+            Summary row of the job, holding the analyzed job and its keywords
+            under 'job' and 'keywords' until the job is processed (see process_job)
+        """
+        start = time.perf_counter()
+        row = {"job_id": job_id, "status": "failed"}
+
+        try:
+            job = self.job_analyzer(job_description)
+            row.update({"title": job.title, "company": job.company or ""})
+            row.update({"job": job, "keywords": self.ats_optimizer.extract_keywords(job)})
+        except Exception as e:
+            print(f"[{job_id}] Error: {str(e)}")
+            row["error"] = str(e)
+
+        row["seconds"] = round(time.perf_counter() - start, 2)
+        return row
+
+    def score_jobs(self, resume: Resume, rows: List[Dict[str, Any]]):
+        """
+        Score the resume against the keywords of every analyzed job at once.
+
+        One keyword-by-job matrix is built over all jobs (see KeywordSetMatrix),
+        so each distinct keyword is looked up in the resume once. The scores
+        are stored as each row's 'ats_score_initial'.
+        """
+        analyzed = [row for row in rows if "job" in row]
+        if not analyzed:
+            return
+        scores = self.ats_optimizer.analyze_resume_ats_scores(
+            resume,
+            [(row["job_id"], row["keywords"]) for row in analyzed],
+            include_keywords=False
+        )["score"]
+        for row in analyzed:
+            row["ats_score_initial"] = round(float(scores[row["job_id"]]), 1)
+
+    def process_job(self, resume: Resume, row: Dict[str, Any], output_dir: str) -> Dict[str, Any]:
+        """Run generation, ATS optimization and rendering for one job analyzed by analyze_job."""
+        start = time.perf_counter()
+        job_id = row["job_id"]
+        job_output_dir = os.path.join(output_dir, job_id)
+        job, keywords = row.pop("job"), row.pop("keywords")
+
+        try:
+            selected_keywords = []
+            if self.user_keywords:
+                selected_keywords = self.keyword_processor({
+                    'keywords': self.user_keywords,
+                    'max_count': 10,
+                    'job': job
+                })
+
+            optimized_resume = self.resume_generator({
+                'resume': resume,
+                'job': job,
+                'keywords': selected_keywords
+            })
+
+            os.makedirs(job_output_dir, exist_ok=True)
+            save_json(optimized_resume.model_dump(), os.path.join(job_output_dir, "initial_resume.json"))
+
+            if self.skip_ats:
+                # Still score the tailored resume so the summary can be compared across jobs
+                final_analysis = self.ats_optimizer.analyze_resume_ats_score(optimized_resume, keywords)
+            else:
+                optimized_resume, _, final_analysis = self.ats_optimizer.optimize(optimized_resume, job, keywords)
+
+            output_path = render_resume(optimized_resume, self.output_format, job_output_dir, self.template_name)
+
+            row.update({
+                "status": "done",
+                "ats_score_final": round(final_analysis["score"], 1),
+                "matched_keywords": len(final_analysis["matches"]),
+                "missing_keywords": len(final_analysis["missing"]),
+                "output_path": output_path
+            })
+        except Exception as e:
+            print(f"[{job_id}] Error: {str(e)}")
+            row["error"] = str(e)
+
+        row["seconds"] = round(row["seconds"] + time.perf_counter() - start, 2)
+        return row
+
+    def run(self, resume: Resume, jobs: Iterator[Tuple[str, str]], output_dir: str) -> List[Dict[str, Any]]:
+        """
+        Process every job and write a summary CSV of ATS scores to output_dir.
+
+        Jobs are pulled from the iterator in blocks of score_block_size. Each
+        block is analyzed, the resume is scored against all of its jobs in one
+        pass (see score_jobs), and its jobs are then processed and written to
+        the summary before the next block is read, so output starts after the
+        first block and at most one block of analyses is held in memory.
+        'ats_score_initial' is the score of the resume as parsed, before it is
+        tailored to the job.
+        """
+        os.makedirs(output_dir, exist_ok=True)
+        summary_path = os.path.join(output_dir, "summary.csv")
+        rows = []
+
+        def unique_jobs():
+            # Keep one output folder per job even if IDs repeat
+            seen_ids = set()
+            for job_id, job_description in jobs:
+                unique_id, suffix = job_id, 2
+                while unique_id in seen_ids:
+                    unique_id, suffix = f"{job_id}_{suffix}", suffix + 1
+                seen_ids.add(unique_id)
+                yield unique_id, job_description
+
+        with open(summary_path, 'w', newline='', encoding='utf-8') as summary_file:
+            writer = csv.DictWriter(summary_file, fieldnames=SUMMARY_FIELDS)
+            writer.writeheader()
+
+            def finish(row):
+                writer.writerow(row)
+                summary_file.flush()
+                rows.append(row)
+                print(f"[{row['job_id']}] {row['status']} ({len(rows)} finished, "
+                      f"{quota_scheduler.queue_depth()} waiting on rate limits)")
+
+            pending = unique_jobs()
+            while True:
+                block = list(islice(pending, self.score_block_size))
+                if not block:
+                    break
+
+                analyzed = list(run_bounded(
+                    lambda item: self.analyze_job(item[0], item[1]),
+                    block,
+                    max_workers=self.max_workers
+                ))
+                self.score_jobs(resume, analyzed)
+
+                for row in analyzed:
+                    if "job" not in row:
+                        finish(row)
+
+                results = run_bounded(
+                    lambda row: self.process_job(resume, row, output_dir),
+                    [row for row in analyzed if "job" in row],
+                    max_workers=self.max_workers
+                )
+                for row in results:
+                    finish(row)
+
+        print(f"\nBatch summary saved to: {summary_path}")
+        return rows
+
+def run_job_batch(resume_file_path, jobs, output_dir='output', api_key=None, output_format='pdf',
+                  template_name=None, user_keywords=None, skip_ats=False, max_workers=4) -> str:
+    """
+    Tailor one resume to many job descriptions.
+
+    The resume is loaded and parsed once and scored against each block of
+    jobs in one pass; each job then gets its own output folder under
+    output_dir, and a summary CSV of ATS scores is written next to them.
+
+    Args:
+        resume_file_path: Path to the PDF resume file
+        jobs: Iterable of (job_id, job_description) pairs, see load_job_descriptions
+        output_dir: Directory to save the per-job output folders and summary
+        api_key: Google API key for Gemini
+        output_format: Output format ('pdf', 'html', 'docx', or 'json')
+        template_name: Name of the template to use (optional)
+        user_keywords: List of keywords provided by the user (optional)
+        skip_ats: Skip the ATS optimization step if True (scores are still reported)
+        max_workers: Maximum number of jobs processed at the same time
+
+    Returns:
+        Path to the summary CSV
+    """
+    timer = StageTimer()
+
+    print("Parsing resume...")
+    with timer.stage("parse resume"):
+        resume = ResumeParser(api_key=api_key)(resume_file_path)
+
+    runner = JobBatchRunner(
+        api_key=api_key,
+        output_format=output_format,
+        template_name=template_name,
+        user_keywords=user_keywords,
+        skip_ats=skip_ats,
+        max_workers=max_workers
+    )
+    with timer.stage("process jobs"):
+        rows = runner.run(resume, iter(jobs), output_dir)
+
+    succeeded = sum(1 for row in rows if row["status"] == "done")
+    print(f"Processed {len(rows)} jobs: {succeeded} succeeded, {len(rows) - succeeded} failed")
+    timer.report()
+    if get_response_cache():
+        get_response_cache().report()
+
+    return os.path.join(output_dir, "summary.csv")
@@ -0,0 +1,380 @@
+import os
+import csv
+import json
+import time
+import sqlite3
+import hashlib
+import threading
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from resume_builder.pipeline.timing import StageTimer
+from resume_builder.llm.scheduler import quota_scheduler
+from resume_builder.cache.response_cache import get_response_cache
+from resume_builder.cache.sqlite import connect
+
+JOB_STATES = ("queued", "running", "done", "failed")
+DEFAULT_MAX_ATTEMPTS = 3
+RETRY_DELAY_SECONDS = 30.0
+MAX_RETRY_DELAY_SECONDS = 15 * 60.0
+
+QUEUE_SUMMARY_FIELDS = ["id", "name", "status", "attempts", "output_path", "seconds", "error"]
+
+class JobQueue:
+    """
+    SQLite-backed queue of optimize jobs that survives crashes and restarts.
+
+    Each row holds one (resume, job description, template, format, keywords)
+    request and moves through queued -> running -> done/failed. Failed
+    attempts are put back in the queue with an exponential delay until
+    max_attempts is reached. Jobs are keyed by their inputs, so enqueueing
+    the same request again is a no-op and finished jobs are never redone.
+    """
+
+    def __init__(self, db_path: str):
+        self.db_path = db_path
+        self._lock = threading.Lock()
+
+        directory = os.path.dirname(os.path.abspath(self.db_path))
+        os.makedirs(directory, exist_ok=True)
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS jobs (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    key TEXT UNIQUE NOT NULL,
+                    name TEXT NOT NULL,
+                    resume_path TEXT NOT NULL,
+                    job_description TEXT NOT NULL,
+                    template TEXT,
+                    output_format TEXT NOT NULL,
+                    keywords TEXT NOT NULL,
+                    skip_ats INTEGER NOT NULL,
+                    output_dir TEXT NOT NULL,
+                    status TEXT NOT NULL DEFAULT 'queued',
+                    attempts INTEGER NOT NULL DEFAULT 0,
+                    max_attempts INTEGER NOT NULL,
+                    available_at REAL NOT NULL,
+                    created_at REAL NOT NULL,
+                    started_at REAL,
+                    finished_at REAL,
+                    output_path TEXT,
+                    error TEXT,
+                    timings TEXT
+                )
+            """)
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_jobs_status ON jobs (status, available_at)")
+
+    def _connect(self):
+        # Autocommit mode lets claim() take the write lock up front with BEGIN IMMEDIATE
+        return connect(self.db_path, autocommit=True, row_factory=sqlite3.Row)
+
+    @staticmethod
+    def make_key(resume_path: str, job_description: str, template: Optional[str], output_format: str,
+                 keywords: List[str], skip_ats: bool) -> str:
+        """Build a job key from its inputs, so the same request is only queued once."""
+        payload = json.dumps([os.path.abspath(resume_path), job_description, template, output_format,
+                              sorted(keywords), skip_ats])
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+    def enqueue(self, name: str, resume_path: str, job_description: str, output_dir: str,
+                output_format: str = 'pdf', template: Optional[str] = None, keywords: Optional[List[str]] = None,
+                skip_ats: bool = False, max_attempts: int = DEFAULT_MAX_ATTEMPTS) -> bool:
+        """
+        Add a job to the queue unless the same request is already in it.
+
+        Args:
+            name: Readable job name, used in the output folder name
+            resume_path: Path to the PDF resume file
+            job_description: The job description text
+            output_dir: Directory under which the job's output folder is created
+            output_format: Output format ('pdf', 'html', 'docx', or 'json')
+            template: Name of the template to use (optional)
+            keywords: Keywords to include in the resume (optional)
+            skip_ats: Skip the ATS optimization step if True
+            max_attempts: Attempts before the job is marked as failed
+
+        Returns:
+            True if the job was added, False if it was already queued or processed
+        """
+        keywords = keywords or []
+        key = self.make_key(resume_path, job_description, template, output_format, keywords, skip_ats)
+        now = time.time()
+        with self._lock, self._connect() as conn:
+            cursor = conn.execute(
+                "INSERT OR IGNORE INTO jobs (key, name, resume_path, job_description, template, output_format, "
+                "keywords, skip_ats, output_dir, max_attempts, available_at, created_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (key, name, os.path.abspath(resume_path), job_description, template, output_format,
+                 json.dumps(keywords), int(skip_ats), output_dir, max(1, max_attempts), now, now)
+            )
+            return cursor.rowcount > 0
+
+    def recover(self) -> int:
+        """
+        Put jobs left 'running' by a crashed or interrupted run back in the queue.
+
+        The interrupted attempt still counts towards max_attempts, so a job that
+        keeps crashing the process runs out of attempts instead of taking every
+        run down with it. Only one runner should use a queue database at a
+        time; call this before starting workers. Returns the number of jobs recovered.
+        """
+        with self._lock, self._connect() as conn:
+            cursor = conn.execute(
+                "UPDATE jobs SET status = 'queued', available_at = ?, "
+                "error = 'Interrupted while running' WHERE status = 'running'",
+                (time.time(),)
+            )
+            return cursor.rowcount
+
+    def claim(self) -> Optional[Dict[str, Any]]:
+        """Mark the oldest job that is due as running and return it, or None if none is due."""
+        now = time.time()
+        with self._lock, self._connect() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                row = conn.execute(
+                    "SELECT * FROM jobs WHERE status = 'queued' AND available_at <= ? ORDER BY id LIMIT 1", (now,)
+                ).fetchone()
+                if row is not None:
+                    conn.execute(
+                        "UPDATE jobs SET status = 'running', attempts = attempts + 1, started_at = ? WHERE id = ?",
+                        (now, row["id"])
+                    )
+                conn.execute("COMMIT")
+            except Exception:
+                conn.execute("ROLLBACK")
+                raise
+
+        if row is None:
+            return None
+        job = dict(row)
+        job.update(status="running", attempts=job["attempts"] + 1, started_at=now,
+                   keywords=json.loads(job["keywords"]), skip_ats=bool(job["skip_ats"]))
+        return job
+
+    def complete(self, job_id: int, output_path: str, timings: Dict[str, float]):
+        """Mark a job as done."""
+        with self._lock, self._connect() as conn:
+            conn.execute(
+                "UPDATE jobs SET status = 'done', finished_at = ?, output_path = ?, error = NULL, timings = ? "
+                "WHERE id = ?",
+                (time.time(), output_path, json.dumps(timings), job_id)
+            )
+
+    def fail(self, job_id: int, error: str, timings: Dict[str, float]) -> str:
+        """
+        Record a failed attempt, re-queueing the job with a delay if it has attempts left.
+
+        Returns the job's new status ('queued' or 'failed').
+        """
+        now = time.time()
+        with self._lock, self._connect() as conn:
+            row = conn.execute("SELECT attempts, max_attempts FROM jobs WHERE id = ?", (job_id,)).fetchone()
+            if row["attempts"] < row["max_attempts"]:
+                delay = min(RETRY_DELAY_SECONDS * 2 ** (row["attempts"] - 1), MAX_RETRY_DELAY_SECONDS)
+                conn.execute(
+                    "UPDATE jobs SET status = 'queued', available_at = ?, error = ?, timings = ? WHERE id = ?",
+                    (now + delay, error, json.dumps(timings), job_id)
+                )
+                return "queued"
+
+            conn.execute(
+                "UPDATE jobs SET status = 'failed', finished_at = ?, error = ?, timings = ? WHERE id = ?",
+                (now, error, json.dumps(timings), job_id)
+            )
+            return "failed"
+
+    def retry_failed(self) -> int:
+        """Give every failed job a fresh set of attempts. Returns the number of jobs re-queued."""
+        with self._lock, self._connect() as conn:
+            cursor = conn.execute(
+                "UPDATE jobs SET status = 'queued', attempts = 0, available_at = ?, finished_at = NULL "
+                "WHERE status = 'failed'",
+                (time.time(),)
+            )
+            return cursor.rowcount
+
+    def counts(self) -> Dict[str, int]:
+        """Number of jobs in each state."""
+        counts = {state: 0 for state in JOB_STATES}
+        with self._connect() as conn:
+            for status, count in conn.execute("SELECT status, COUNT(*) FROM jobs GROUP BY status"):
+                counts[status] = count
+        return counts
+
+    def next_due_in(self) -> Optional[float]:
+        """Seconds until the next queued job is due (0 if one is due now), or None if nothing is queued."""
+        with self._connect() as conn:
+            row = conn.execute("SELECT MIN(available_at) FROM jobs WHERE status = 'queued'").fetchone()
+        if row[0] is None:
+            return None
+        return max(0.0, row[0] - time.time())
+
+    def rows(self) -> List[Dict[str, Any]]:
+        """Every job in the queue, oldest first."""
+        with self._connect() as conn:
+            return [dict(row) for row in conn.execute("SELECT * FROM jobs ORDER BY id")]
+
+    def export_summary(self, file_path: str) -> str:
+        """Write the state of every job as a CSV and return its path."""
+        with open(file_path, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.DictWriter(f, fieldnames=QUEUE_SUMMARY_FIELDS)
+            writer.writeheader()
+            for row in self.rows():
+                timings = json.loads(row["timings"]) if row["timings"] else {}
+                seconds = timings.get("total")
+                writer.writerow({
+                    **{field: row[field] for field in QUEUE_SUMMARY_FIELDS if field in row},
+                    "seconds": round(seconds, 2) if seconds is not None else ""
+                })
+        return file_path
+
+class QueueWorkerPool:
+    """
+    Drain a JobQueue with a bounded number of worker threads.
+
+    Each worker claims one job at a time and runs the optimize pipeline for
+    it in the job's own output folder. Workers exit once nothing is left in
+    the queue; jobs waiting for a retry delay are waited for.
+    """
+
+    def __init__(self, job_queue: JobQueue, api_key: Optional[str] = None, max_workers: int = 4,
+                 poll_interval: float = 1.0):
+        self.queue = job_queue
+        self.api_key = api_key
+        self.max_workers = max(1, max_workers)
+        self.poll_interval = poll_interval
+        self._stop = threading.Event()
+        self._finished = 0
+        self._finished_lock = threading.Lock()
+
+    @staticmethod
+    def job_output_dir(job: Dict[str, Any]) -> str:
+        return os.path.join(job["output_dir"], f"{job['id']:05d}_{job['name']}")
+
+    def process(self, job: Dict[str, Any]):
+        """Run the optimize pipeline for one claimed job and record the outcome."""
+        from resume_builder.pipeline.optimize import optimize_resume
+
+        label = f"[{job['id']}:{job['name']}]"
+        print(f"{label} Running (attempt {job['attempts']} of {job['max_attempts']})")
+        timer = StageTimer()
+        try:
+            output_path = optimize_resume(
+                job["resume_path"],
+                job["job_description"],
+                output_format=job["output_format"],
+                output_dir=self.job_output_dir(job),
+                api_key=self.api_key,
+                skip_ats=job["skip_ats"],
+                template_name=job["template"],
+                user_keywords=job["keywords"],
+                timer=timer
+            )
+        except Exception as e:
+            status = self.queue.fail(job["id"], str(e), timer.as_dict())
+            retry = " (will retry)" if status == "queued" else ""
+            print(f"{label} Error: {str(e)}{retry}")
+            return
+
+        self.queue.complete(job["id"], output_path, timer.as_dict())
+        with self._finished_lock:
+            self._finished += 1
+            finished = self._finished
+        print(f"{label} done in {timer.total:.1f}s ({finished} finished this run, "
+              f"{quota_scheduler.queue_depth()} waiting on rate limits)")
+
+    def _worker(self):
+        while not self._stop.is_set():
+            job = self.queue.claim()
+            if job is not None:
+                self.process(job)
+                continue
+
+            due_in = self.queue.next_due_in()
+            if due_in is None:
+                return
+            # Wait for a delayed retry, waking up regularly in case another worker re-queues a job
+            self._stop.wait(min(max(due_in, 0.05), self.poll_interval))
+
+    def run(self):
+        """Process queued jobs until none are left, or until interrupted with Ctrl+C."""
+        threads = [
+            threading.Thread(target=self._worker, name=f"queue-worker-{i}", daemon=True)
+            for i in range(self.max_workers)
+        ]
+        for thread in threads:
+            thread.start()
+        try:
+            for thread in threads:
+                # Join with a timeout so Ctrl+C reaches the main thread
+                while thread.is_alive():
+                    thread.join(timeout=0.5)
+        except KeyboardInterrupt:
+            self._stop.set()
+            print("\nInterrupted; running jobs will be retried when the queue is resumed.")
+            raise
+
+def run_job_queue(db_path: str, jobs: Iterable[Tuple[str, str]] = (), resume_file_path: Optional[str] = None,
+                  output_dir: str = 'output', api_key: Optional[str] = None, output_format: str = 'pdf',
+                  template_name: Optional[str] = None, user_keywords: Optional[List[str]] = None,
+                  skip_ats: bool = False, max_workers: int = 4, max_attempts: int = DEFAULT_MAX_ATTEMPTS,
+                  retry_failed: bool = False) -> str:
+    """
+    Queue jobs in a SQLite database and process everything pending in it.
+
+    Running it again with the same database picks up where a crashed or
+    interrupted run stopped: jobs that were running are re-queued, finished
+    jobs are skipped, and re-submitted jobs that are already in the queue
+    are not added twice.
+
+    Args:
+        db_path: Path to the SQLite queue database (created if missing)
+        jobs: Iterable of (job_id, job_description) pairs to add, see load_job_descriptions
+        resume_file_path: Path to the PDF resume file for the added jobs
+        output_dir: Directory to save the per-job output folders and summary
+        api_key: Google API key for Gemini
+        output_format: Output format ('pdf', 'html', 'docx', or 'json')
+        template_name: Name of the template to use (optional)
+        user_keywords: List of keywords provided by the user (optional)
+        skip_ats: Skip the ATS optimization step if True
+        max_workers: Maximum number of jobs processed at the same time
+        max_attempts: Attempts per added job before it is marked as failed
+        retry_failed: Also give previously failed jobs a fresh set of attempts
+
+    Returns:
+        Path to the summary CSV
+    """
+    job_queue = JobQueue(db_path)
+
+    recovered = job_queue.recover()
+    if recovered:
+        print(f"Re-queued {recovered} job(s) interrupted in a previous run")
+    if retry_failed:
+        print(f"Re-queued {job_queue.retry_failed()} failed job(s)")
+
+    added = skipped = 0
+    for job_id, job_description in jobs:
+        if job_queue.enqueue(job_id, resume_file_path, job_description, output_dir, output_format,
+                             template_name, user_keywords, skip_ats, max_attempts):
+            added += 1
+        else:
+            skipped += 1
+    if added or skipped:
+        print(f"Queued {added} new job(s); {skipped} already in the queue")
+
+    counts = job_queue.counts()
+    print(f"Queue {db_path}: " + ", ".join(f"{count} {state}" for state, count in counts.items()))
+
+    timer = StageTimer()
+    with timer.stage("process queue"):
+        QueueWorkerPool(job_queue, api_key=api_key, max_workers=max_workers).run()
+
+    counts = job_queue.counts()
+    print(f"Queue finished: {counts['done']} done, {counts['failed']} failed")
+    timer.report()
+    if get_response_cache():
+        get_response_cache().report()
+
+    os.makedirs(output_dir, exist_ok=True)
+    return job_queue.export_summary(os.path.join(output_dir, "queue_summary.csv"))
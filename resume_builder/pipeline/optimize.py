@@ -0,0 +1,92 @@
+import os
+from typing import List, Optional
+
+from resume_builder.tools.resume_parser import ResumeParser
+from resume_builder.tools.job_analyzer import JobDescriptionAnalyzer
+from resume_builder.tools.resume_generator import ResumeGenerator
+from resume_builder.tools.ats_optimizer import ATSOptimizer
+from resume_builder.cache.response_cache import get_response_cache
+from resume_builder.pipeline.outputs import save_json, render_resume
+from resume_builder.pipeline.stages import parse_and_analyze
+from resume_builder.pipeline.timing import StageTimer
+
+def optimize_resume(resume_file_path: str, job_description: str, output_format: str = 'pdf',
+                    output_dir: str = 'output', api_key: Optional[str] = None, skip_ats: bool = False,
+                    template_name: Optional[str] = None, user_keywords: Optional[List[str]] = None,
+                    concurrent: bool = True, timer: Optional[StageTimer] = None) -> str:
+    """
+    Parse, tailor, ATS-optimize and render a resume for one job description.
+
+    Args:
+        resume_file_path: Path to the PDF resume file
+        job_description: The job description text
+        output_format: Output format ('pdf', 'html', 'docx', or 'json')
+        output_dir: Directory to save output files
+        api_key: Google API key for Gemini (optional if already set in the environment)
+        skip_ats: Skip the ATS optimization step if True
+        template_name: Name of the template to use (optional)
+        user_keywords: List of keywords provided by the user (optional)
+        concurrent: Parse the resume and analyze the job description at the same time
+        timer: StageTimer to record stages in; if omitted, one is created and its
+               timings are printed when the run finishes
+
+    Returns:
+        Path to the generated output file
+    """
+    report = timer is None
+    timer = timer or StageTimer()
+    
+    resume, job = parse_and_analyze(
+        ResumeParser(api_key=api_key),
+        JobDescriptionAnalyzer(api_key=api_key),
+        resume_file_path,
+        job_description,
+        concurrent=concurrent,
+        timer=timer
+    )
+    
+    # Process user keywords if provided
+    selected_keywords = []
+    if user_keywords and len(user_keywords) > 0:
+        from resume_builder.tools.keyword_processor import KeywordProcessor
+        keyword_processor = KeywordProcessor()
+        with timer.stage("select keywords"):
+            selected_keywords = keyword_processor({
+                'keywords': user_keywords,
+                'max_count': 10,
+                'job': job
+            })
+        print(f"Selected keywords: {', '.join(selected_keywords)}")
+    
+    print("Generating optimized resume...")
+    resume_generator = ResumeGenerator(api_key=api_key)
+    with timer.stage("generate resume"):
+        optimized_resume = resume_generator({
+            'resume': resume, 
+            'job': job,
+            'keywords': selected_keywords
+        })
+    
+    # Create output directory if it doesn't exist
+    os.makedirs(output_dir, exist_ok=True)
+    
+    # Save initial optimized resume JSON for reference
+    initial_json_path = os.path.join(output_dir, "initial_resume.json")
+    save_json(optimized_resume.model_dump(), initial_json_path)
+    print(f"Initial optimized resume JSON saved to: {initial_json_path}")
+    
+    # ATS optimization step
+    if not skip_ats:
+        print("\nOptimizing for ATS...")
+        ats_optimizer = ATSOptimizer(api_key=api_key)
+        with timer.stage("ATS optimization"):
+            optimized_resume = ats_optimizer(optimized_resume, job)
+    
+    try:
+        with timer.stage("render output"):
+            return render_resume(optimized_resume, output_format, output_dir, template_name)
+    finally:
+        if report:
+            timer.report()
+            if get_response_cache():
+                get_response_cache().report()
@@ -0,0 +1,90 @@
+import os
+import json
+from functools import lru_cache
+
+from resume_builder.models.resume import Resume
+from resume_builder.formatters.template_manager import TemplateManager
+
+def save_json(data, file_path):
+    """Save data as JSON to a file."""
+    with open(file_path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, indent=2)
+
+def resolve_template_filename(template_name=None) -> str:
+    """Get the template filename for a template name, defaulting to Harvard."""
+    template_filename = None
+    if template_name:
+        template_filename = TemplateManager().get_template_filename(template_name)
+
+    return template_filename or "harvard.html"
+
+@lru_cache(maxsize=None)
+def get_html_formatter(template_filename: str = "harvard.html"):
+    """
+    Get a shared HtmlFormatter for a template.
+
+    The formatter's Jinja environment keeps compiled templates, so reusing one
+    per template avoids re-reading and re-compiling the template on every render.
+    Rendering is thread-safe, so the instance can be shared across workers.
+    """
+    from resume_builder.formatters.html_formatter import HtmlFormatter
+    return HtmlFormatter(template_name=template_filename)
+
+@lru_cache(maxsize=None)
+def get_pdf_converter():
+    """Get the shared PdfConverter (imports WeasyPrint on first use)."""
+    from resume_builder.formatters.pdf_converter import PdfConverter
+    return PdfConverter()
+
+@lru_cache(maxsize=None)
+def get_docx_converter():
+    """Get the shared DocxConverter (imports python-docx on first use)."""
+    from resume_builder.formatters.docx_converter import DocxConverter
+    return DocxConverter()
+
+def render_resume(resume: Resume, output_format='pdf', output_dir='output', template_name=None) -> str:
+    """
+    Write the final resume JSON and render it in the requested format.
+
+    Args:
+        resume: The Resume object to render
+        output_format: Output format ('pdf', 'html', 'docx', or 'json')
+        output_dir: Directory to save output files
+        template_name: Name of the template to use (optional)
+
+    Returns:
+        Path to the generated output file
+    """
+    os.makedirs(output_dir, exist_ok=True)
+
+    json_path = os.path.join(output_dir, "resume.json")
+    save_json(resume.model_dump(), json_path)
+    print(f"Final resume JSON saved to: {json_path}")
+
+    if output_format not in ['html', 'pdf', 'docx']:
+        return json_path
+
+    # Generate HTML (converters are created, and imported, only for the format requested)
+    html_formatter = get_html_formatter(resolve_template_filename(template_name))
+    html_path = os.path.join(output_dir, "resume.html")
+    html_formatter.format_resume(resume, html_path)
+    print(f"Resume HTML saved to: {html_path}")
+
+    if output_format == 'pdf':
+        # Convert HTML to PDF
+        pdf_path = get_pdf_converter().convert_html_to_pdf(
+            html_file=html_path,
+            output_path=os.path.join(output_dir, "resume.pdf")
+        )
+        print(f"Resume PDF saved to: {pdf_path}")
+        return pdf_path
+    elif output_format == 'docx':
+        # Convert HTML to DOCX
+        docx_path = get_docx_converter().convert_html_to_docx(
+            html_file=html_path,
+            output_path=os.path.join(output_dir, "resume.docx")
+        )
+        print(f"Resume DOCX saved to: {docx_path}")
+        return docx_path
+
+    return html_path
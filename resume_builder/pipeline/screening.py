@@ -0,0 +1,221 @@
+import os
+import csv
+import heapq
+import time
+from itertools import count
+from typing import Any, Dict, Iterator, List, Optional
+
+from resume_builder.tools.resume_parser import ResumeParser
+from resume_builder.tools.job_analyzer import JobDescriptionAnalyzer
+from resume_builder.tools.resume_generator import ResumeGenerator
+from resume_builder.tools.ats_optimizer import ATSOptimizer
+from resume_builder.pipeline.outputs import render_resume
+from resume_builder.pipeline.stages import run_bounded
+from resume_builder.pipeline.timing import StageTimer
+from resume_builder.cache.response_cache import get_response_cache
+from resume_builder.llm.scheduler import quota_scheduler
+
+SCORE_FIELDS = [
+    "rank", "resume", "name", "email", "status", "ats_score",
+    "matched_keywords", "partial_matches", "missing_keywords", "seconds", "error"
+]
+
+def find_resume_files(resumes_dir: str) -> Iterator[str]:
+    """Yield the paths of all PDF resumes in a directory, in name order."""
+    for file_name in sorted(os.listdir(resumes_dir)):
+        if file_name.lower().endswith('.pdf'):
+            yield os.path.join(resumes_dir, file_name)
+
+class Leaderboard:
+    """
+    Keep the top-k scored resumes with a min-heap.
+
+    Memory stays bounded by k no matter how many resumes are screened: each new
+    entry either displaces the current lowest score or is dropped.
+    """
+
+    def __init__(self, top_k: int = 10):
+        self.top_k = max(1, top_k)
+        self._heap = []
+        self._sequence = count()
+
+    def add(self, score: float, entry: Dict[str, Any]) -> bool:
+        """Offer an entry to the leaderboard. Returns True if it was kept."""
+        # Earlier entries win ties, so later ones sort lower in the min-heap
+        item = (score, -next(self._sequence), entry)
+        if len(self._heap) < self.top_k:
+            heapq.heappush(self._heap, item)
+            return True
+        if item[:2] > self._heap[0][:2]:
+            heapq.heapreplace(self._heap, item)
+            return True
+        return False
+
+    @property
+    def min_score(self) -> Optional[float]:
+        """Lowest score currently on the leaderboard, once it is full."""
+        return self._heap[0][0] if len(self._heap) >= self.top_k else None
+
+    def ranked(self) -> List[Dict[str, Any]]:
+        """Get the kept entries from best to worst."""
+        return [entry for _, _, entry in sorted(self._heap, key=lambda item: item[:2], reverse=True)]
+
+class ResumeScreener:
+    """Score a folder of candidate resumes against a single job description."""
+
+    def __init__(self, api_key=None, max_workers=4, top_k=10):
+        self.max_workers = max(1, max_workers)
+        self.top_k = top_k
+        self.api_key = api_key
+        self.resume_parser = ResumeParser(api_key=api_key)
+        self.ats_optimizer = ATSOptimizer(api_key=api_key)
+
+    def _score_resume(self, resume_path: str, keywords: List[str]) -> Dict[str, Any]:
+        """Parse one resume and score it against the job keywords."""
+        start = time.perf_counter()
+        row = {"resume": resume_path, "status": "failed"}
+
+        try:
+            resume = self.resume_parser(resume_path)
+            analysis = self.ats_optimizer.analyze_resume_ats_score(resume, keywords)
+            row.update({
+                "name": resume.contact.name,
+                "email": resume.contact.email,
+                "status": "done",
+                "ats_score": round(analysis["score"], 1),
+                "matched_keywords": len(analysis["matches"]),
+                "partial_matches": len(analysis["partial_matches"]),
+                "missing_keywords": len(analysis["missing"]),
+                "resume_model": resume
+            })
+        except Exception as e:
+            print(f"[{os.path.basename(resume_path)}] Error: {str(e)}")
+            row["error"] = str(e)
+
+        row["seconds"] = round(time.perf_counter() - start, 2)
+        return row
+
+    def screen(self, resume_paths: Iterator[str], job_description: str, output_dir: str,
+               timer: Optional[StageTimer] = None) -> Dict[str, Any]:
+        """
+        Score every resume and write the results to output_dir.
+
+        Every scored resume is streamed to scores.csv as soon as it finishes;
+        leaderboard.csv holds the top-k once all resumes are scored.
+
+        Returns:
+            Dictionary with the analyzed 'job', the ATS 'keywords' and the ranked 'leaderboard'
+        """
+        timer = timer or StageTimer()
+        os.makedirs(output_dir, exist_ok=True)
+
+        # The job and its keywords are the same for every candidate, so do them once
+        print("Analyzing job description...")
+        with timer.stage("analyze job description"):
+            job = JobDescriptionAnalyzer(api_key=self.api_key)(job_description)
+        with timer.stage("extract keywords"):
+            keywords = self.ats_optimizer.extract_keywords(job)
+        print(f"Screening against {len(keywords)} keywords for: {job.title}")
+
+        leaderboard = Leaderboard(self.top_k)
+        scores_path = os.path.join(output_dir, "scores.csv")
+        screened = 0
+
+        with timer.stage("parse and score resumes"), \
+                open(scores_path, 'w', newline='', encoding='utf-8') as scores_file:
+            writer = csv.DictWriter(scores_file, fieldnames=SCORE_FIELDS, extrasaction='ignore')
+            writer.writeheader()
+
+            results = run_bounded(lambda path: self._score_resume(path, keywords), resume_paths,
+                                  max_workers=self.max_workers)
+            for row in results:
+                screened += 1
+                writer.writerow(row)
+                scores_file.flush()
+
+                name = os.path.basename(row["resume"])
+                if row["status"] != "done":
+                    print(f"[{name}] failed ({screened} screened)")
+                    continue
+
+                kept = leaderboard.add(row["ats_score"], row)
+                status = "on leaderboard" if kept else f"below top {self.top_k} cutoff of {leaderboard.min_score:.1f}%"
+                print(f"[{name}] {row['ats_score']:.1f}% - {status} ({screened} screened, "
+                      f"{quota_scheduler.queue_depth()} waiting on rate limits)")
+
+        ranked = leaderboard.ranked()
+        for rank, row in enumerate(ranked, 1):
+            row["rank"] = rank
+
+        leaderboard_path = os.path.join(output_dir, "leaderboard.csv")
+        with open(leaderboard_path, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.DictWriter(f, fieldnames=SCORE_FIELDS, extrasaction='ignore')
+            writer.writeheader()
+            writer.writerows(ranked)
+
+        print(f"\nTop {len(ranked)} of {screened} resumes:")
+        for row in ranked:
+            print(f"  {row['rank']:>3}. {row['ats_score']:5.1f}%  {row['name'] or os.path.basename(row['resume'])}")
+        print(f"\nAll scores saved to: {scores_path}")
+        print(f"Leaderboard saved to: {leaderboard_path}")
+
+        return {"job": job, "keywords": keywords, "leaderboard": ranked}
+
+    def generate_for_leaderboard(self, screening: Dict[str, Any], output_dir: str, output_format='pdf',
+                                 template_name=None, skip_ats=False) -> List[str]:
+        """Generate and render a tailored resume for each leaderboard entry."""
+        job = screening["job"]
+        resume_generator = ResumeGenerator(api_key=self.api_key)
+
+        def generate(row: Dict[str, Any]) -> Optional[str]:
+            stem = os.path.splitext(os.path.basename(row["resume"]))[0]
+            candidate_dir = os.path.join(output_dir, f"{row['rank']:03d}_{stem}")
+            try:
+                tailored = resume_generator({'resume': row["resume_model"], 'job': job, 'keywords': []})
+                if not skip_ats:
+                    tailored = self.ats_optimizer(tailored, job)
+                return render_resume(tailored, output_format, candidate_dir, template_name)
+            except Exception as e:
+                print(f"[{stem}] Error generating tailored resume: {str(e)}")
+                return None
+
+        return [path for path in run_bounded(generate, screening["leaderboard"], self.max_workers) if path]
+
+def run_resume_screening(resumes_dir, job_description, output_dir='output', api_key=None, top_k=10,
+                         max_workers=4, generate=False, output_format='pdf', template_name=None,
+                         skip_ats=False) -> str:
+    """
+    Rank a folder of candidate resumes against one job description.
+
+    A plain screening pass costs one job analysis (plus at most one keyword
+    extraction call) and one parse per resume; no resumes are generated unless
+    generate is True, in which case only the top-k candidates are tailored and rendered.
+
+    Args:
+        resumes_dir: Directory of candidate PDF resumes
+        job_description: The job description text
+        output_dir: Directory to save scores, leaderboard and generated resumes
+        api_key: Google API key for Gemini
+        top_k: Number of candidates to keep on the leaderboard
+        max_workers: Maximum number of resumes parsed at the same time
+        generate: Generate and render tailored resumes for the leaderboard
+        output_format: Output format for generated resumes ('pdf', 'html', 'docx', or 'json')
+        template_name: Name of the template to use for generated resumes (optional)
+        skip_ats: Skip ATS optimization of generated resumes if True
+
+    Returns:
+        Path to the leaderboard CSV
+    """
+    timer = StageTimer()
+    screener = ResumeScreener(api_key=api_key, max_workers=max_workers, top_k=top_k)
+    screening = screener.screen(find_resume_files(resumes_dir), job_description, output_dir, timer=timer)
+
+    if generate and screening["leaderboard"]:
+        print("\nGenerating tailored resumes for the leaderboard...")
+        with timer.stage("generate resumes"):
+            screener.generate_for_leaderboard(screening, output_dir, output_format, template_name, skip_ats)
+
+    timer.report()
+    if get_response_cache():
+        get_response_cache().report()
+    return os.path.join(output_dir, "leaderboard.csv")
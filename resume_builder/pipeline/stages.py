@@ -0,0 +1,74 @@
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from typing import Any, Callable, Iterable, Iterator, Optional, Tuple
+
+from resume_builder.models.resume import Resume
+from resume_builder.models.job import JobDescription
+from resume_builder.pipeline.timing import StageTimer
+
+def parse_and_analyze(resume_parser, job_analyzer, resume_file_path: str, job_description: str,
+                      concurrent: bool = True, timer: Optional[StageTimer] = None) -> Tuple[Resume, JobDescription]:
+    """
+    Parse a resume and analyze a job description.
+
+    The two stages are independent and each waits on its own model round trip,
+    so by default they run at the same time and are joined before returning.
+    End-to-end latency is then roughly max(parse, analyze) instead of their sum.
+
+    Args:
+        resume_parser: A ResumeParser instance
+        job_analyzer: A JobDescriptionAnalyzer instance
+        resume_file_path: Path to the PDF resume file
+        job_description: The job description text
+        concurrent: Run both stages at once if True, one after the other if False
+        timer: Optional StageTimer to record the duration of each stage
+
+    Returns:
+        Tuple of (Resume, JobDescription)
+    """
+    timer = timer or StageTimer()
+
+    def parse_resume() -> Resume:
+        with timer.stage("parse resume"):
+            return resume_parser(resume_file_path)
+
+    def analyze_job() -> JobDescription:
+        with timer.stage("analyze job description"):
+            return job_analyzer(job_description)
+
+    if not concurrent:
+        print("Parsing resume...")
+        resume = parse_resume()
+        print("Analyzing job description...")
+        job = analyze_job()
+        return resume, job
+
+    print("Parsing resume and analyzing job description concurrently...")
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        resume_future = executor.submit(parse_resume)
+        job_future = executor.submit(analyze_job)
+        # result() re-raises any exception from the worker thread
+        return resume_future.result(), job_future.result()
+
+def run_bounded(func: Callable[[Any], Any], items: Iterable[Any], max_workers: int = 4) -> Iterator[Any]:
+    """
+    Apply func to every item on a thread pool, yielding results as they complete.
+
+    Items are pulled from the iterable lazily and at most twice the worker
+    count are in flight at once, so a large feed is never fully loaded into
+    memory. Exceptions raised by func propagate to the caller.
+    """
+    max_workers = max(1, max_workers)
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        pending = set()
+        for item in items:
+            if len(pending) >= max_workers * 2:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield future.result()
+            pending.add(executor.submit(func, item))
+
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                yield future.result()
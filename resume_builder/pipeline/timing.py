@@ -0,0 +1,61 @@
+import time
+import threading
+from contextlib import contextmanager
+from typing import Callable, Dict, List, Optional, Tuple
+
+from resume_builder.pipeline.tracing import tracer
+
+class StageTimer:
+    """Record the wall-clock time spent in each stage of a pipeline run."""
+
+    def __init__(self, on_stage: Optional[Callable[[str, float], None]] = None):
+        """
+        Args:
+            on_stage: Optional callback invoked with (stage name, seconds) as each stage finishes
+        """
+        self.on_stage = on_stage
+        self._started_at = time.perf_counter()
+        self._stages: List[Tuple[str, float]] = []
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def stage(self, name: str):
+        """
+        Time a block of work as a named stage.
+
+        Safe to use from several threads at once, so overlapping stages
+        (e.g. parsing and job analysis running concurrently) are each recorded
+        with their own duration. Each stage is also traced as a span when tracing is on.
+        """
+        start = time.perf_counter()
+        try:
+            with tracer.span(name, "stage"):
+                yield
+        finally:
+            elapsed = time.perf_counter() - start
+            with self._lock:
+                self._stages.append((name, elapsed))
+            if self.on_stage is not None:
+                self.on_stage(name, elapsed)
+
+    @property
+    def total(self) -> float:
+        """Wall-clock seconds since the timer was created."""
+        return time.perf_counter() - self._started_at
+
+    def as_dict(self) -> Dict[str, float]:
+        """Get stage durations (in seconds) keyed by stage name, plus the total."""
+        with self._lock:
+            timings = {name: elapsed for name, elapsed in self._stages}
+        timings["total"] = self.total
+        return timings
+
+    def report(self):
+        """Print the duration of each stage and the total wall-clock time."""
+        with self._lock:
+            stages = list(self._stages)
+
+        print("\nStage Timings:")
+        for name, elapsed in stages:
+            print(f"  {name:<28} {elapsed:8.2f}s")
+        print(f"  {'total (wall clock)':<28} {self.total:8.2f}s")
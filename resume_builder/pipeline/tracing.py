@@ -0,0 +1,111 @@
+import os
+import json
+import time
+import uuid
+import threading
+from contextlib import contextmanager
+from typing import Any, Dict, List, Optional
+
+class Tracer:
+    """
+    Collect timed spans for a run and export them as a Chrome trace.
+
+    Spans are recorded as complete ('X') events with microsecond timestamps,
+    one track per thread, so nested spans show up nested in chrome://tracing
+    or Perfetto. Every span carries the run ID. Tracing is off until start()
+    is called; while off, span() does no work beyond a flag check.
+    """
+
+    def __init__(self):
+        self.enabled = False
+        self.run_id: Optional[str] = None
+        self._events: List[Dict[str, Any]] = []
+        self._thread_names: Dict[int, str] = {}
+        self._origin = time.perf_counter()
+        self._lock = threading.Lock()
+
+    def start(self, run_id: Optional[str] = None) -> str:
+        """Start recording spans for a new run and return its run ID."""
+        with self._lock:
+            self.run_id = run_id or uuid.uuid4().hex[:12]
+            self._events = []
+            self._thread_names = {}
+            self._origin = time.perf_counter()
+            self.enabled = True
+        return self.run_id
+
+    def stop(self):
+        """Stop recording spans."""
+        self.enabled = False
+
+    def _timestamp(self, moment: float) -> float:
+        return round((moment - self._origin) * 1_000_000, 1)
+
+    def record(self, name: str, category: str, start: float, end: float, args: Optional[Dict[str, Any]] = None,
+               thread: Optional[threading.Thread] = None):
+        """Record a finished span from perf_counter() start and end times."""
+        if not self.enabled:
+            return
+        thread = thread or threading.current_thread()
+        event = {
+            "name": name,
+            "cat": category,
+            "ph": "X",
+            "ts": self._timestamp(start),
+            "dur": round((end - start) * 1_000_000, 1),
+            "pid": os.getpid(),
+            "tid": thread.ident,
+            "args": {"run_id": self.run_id, **(args or {})}
+        }
+        with self._lock:
+            self._events.append(event)
+            self._thread_names.setdefault(thread.ident, thread.name)
+
+    @contextmanager
+    def span(self, name: str, category: str = "stage", **args: Any):
+        """
+        Trace a block of work as a named span.
+
+        Yields a dict of span attributes; anything added to it (such as output
+        sizes) is saved with the span. Exceptions are recorded as an 'error' attribute.
+        """
+        if not self.enabled:
+            yield {}
+            return
+
+        attributes = dict(args)
+        start = time.perf_counter()
+        try:
+            yield attributes
+        except Exception as e:
+            attributes["error"] = str(e)
+            raise
+        finally:
+            self.record(name, category, start, time.perf_counter(), attributes)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Get the trace in Chrome trace event format."""
+        with self._lock:
+            events = list(self._events)
+            thread_names = dict(self._thread_names)
+
+        metadata = [
+            {"name": "thread_name", "ph": "M", "pid": os.getpid(), "tid": tid, "args": {"name": name}}
+            for tid, name in thread_names.items()
+        ]
+        return {
+            "traceEvents": metadata + sorted(events, key=lambda event: event["ts"]),
+            "displayTimeUnit": "ms",
+            "otherData": {"run_id": self.run_id}
+        }
+
+    def save(self, file_path: str) -> str:
+        """Write the trace as JSON and return its path."""
+        directory = os.path.dirname(file_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(file_path, 'w', encoding='utf-8') as f:
+            json.dump(self.to_dict(), f)
+        return file_path
+
+tracer = Tracer()
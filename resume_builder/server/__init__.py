@@ -0,0 +1,2 @@
+"""Resume server package."""
+# This file makes the server directory a Python package
\ No newline at end of file
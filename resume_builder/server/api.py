@@ -0,0 +1,169 @@
+import os
+import json
+import mimetypes
+import socketserver
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Optional
+from urllib.parse import urlparse, parse_qs
+
+from resume_builder.server.jobs import JobManager
+
+MAX_BODY_BYTES = 20 * 1024 * 1024
+MAX_WAIT_SECONDS = 300
+
+class JobRequestHandler(BaseHTTPRequestHandler):
+    """
+    JSON API for submitting optimize jobs and following their progress.
+
+    POST /jobs                 submit a job, returns its ID (202)
+    GET  /jobs                 list known jobs
+    GET  /jobs/<id>[?wait=N]   job state, optionally waiting up to N seconds for it to finish
+    GET  /jobs/<id>/events     stream progress events as newline-delimited JSON until the job finishes
+    GET  /jobs/<id>/result     download the generated file
+    GET  /health               job counts by state
+    """
+
+    server_version = "ResumeBuilder/0.1"
+
+    @property
+    def manager(self) -> JobManager:
+        return self.server.manager
+
+    def address_string(self) -> str:
+        # Unix socket clients have no (host, port) address
+        return self.client_address[0] if isinstance(self.client_address, tuple) else "unix-socket"
+
+    def _send_json(self, status: int, payload: Any):
+        body = json.dumps(payload).encode('utf-8')
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _send_error(self, status: int, message: str):
+        self._send_json(status, {"error": message})
+
+    def _route(self):
+        url = urlparse(self.path)
+        parts = [part for part in url.path.split("/") if part]
+        return parts, parse_qs(url.query)
+
+    def do_POST(self):
+        parts, _ = self._route()
+        if parts != ["jobs"]:
+            return self._send_error(404, f"Not found: {self.path}")
+
+        length = int(self.headers.get("Content-Length") or 0)
+        if length > MAX_BODY_BYTES:
+            return self._send_error(413, "Request body is too large")
+        try:
+            request = json.loads(self.rfile.read(length) or b"{}")
+            job = self.manager.submit(request)
+        except ValueError as e:
+            return self._send_error(400, str(e))
+
+        self._send_json(202, {
+            **job.to_dict(),
+            "links": {
+                "self": f"/jobs/{job.id}",
+                "events": f"/jobs/{job.id}/events",
+                "result": f"/jobs/{job.id}/result"
+            }
+        })
+
+    def do_GET(self):
+        parts, query = self._route()
+
+        if parts == ["health"]:
+            return self._send_json(200, {"status": "ok", "jobs": self.manager.counts()})
+        if parts == ["jobs"]:
+            return self._send_json(200, {"jobs": [job.to_dict() for job in self.manager.list()]})
+        if len(parts) < 2 or parts[0] != "jobs" or len(parts) > 3:
+            return self._send_error(404, f"Not found: {self.path}")
+
+        job = self.manager.get(parts[1])
+        if job is None:
+            return self._send_error(404, f"Unknown job: {parts[1]}")
+
+        if len(parts) == 2:
+            if "wait" in query:
+                try:
+                    job.wait(min(float(query["wait"][0]), MAX_WAIT_SECONDS))
+                except ValueError:
+                    return self._send_error(400, "'wait' must be a number of seconds")
+            return self._send_json(200, job.to_dict())
+        if parts[2] == "events":
+            try:
+                since = int(query.get("since", ["0"])[0])
+            except ValueError:
+                return self._send_error(400, "'since' must be an event number")
+            return self._stream_events(job, since)
+        if parts[2] == "result":
+            return self._send_result(job)
+        return self._send_error(404, f"Not found: {self.path}")
+
+    def _stream_events(self, job, since: int):
+        self.send_response(200)
+        self.send_header("Content-Type", "application/x-ndjson")
+        self.send_header("Cache-Control", "no-cache")
+        self.send_header("Connection", "close")
+        self.end_headers()
+
+        try:
+            for event in job.iter_events(since=since):
+                # A blank line is a heartbeat while nothing has happened
+                line = json.dumps(event) + "\n" if event is not None else "\n"
+                self.wfile.write(line.encode('utf-8'))
+                self.wfile.flush()
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+        self.close_connection = True
+
+    def _send_result(self, job):
+        if job.status != "done":
+            return self._send_error(409, f"Job is {job.status}" + (f": {job.error}" if job.error else ""))
+
+        content_type = mimetypes.guess_type(job.output_path)[0] or "application/octet-stream"
+        self.send_response(200)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(os.path.getsize(job.output_path)))
+        self.send_header("Content-Disposition", f'attachment; filename="{os.path.basename(job.output_path)}"')
+        self.end_headers()
+        with open(job.output_path, 'rb') as f:
+            while chunk := f.read(64 * 1024):
+                self.wfile.write(chunk)
+
+class ThreadingUnixHTTPServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    """HTTP server on a Unix domain socket, one thread per connection."""
+
+    daemon_threads = True
+
+def create_server(manager: JobManager, host: str = "127.0.0.1", port: int = 8765,
+                  socket_path: Optional[str] = None):
+    """Create the API server on a TCP port, or on a Unix socket if socket_path is given."""
+    if socket_path:
+        if os.path.exists(socket_path):
+            os.remove(socket_path)
+        server = ThreadingUnixHTTPServer(socket_path, JobRequestHandler)
+    else:
+        server = ThreadingHTTPServer((host, port), JobRequestHandler)
+        server.daemon_threads = True
+    server.manager = manager
+    return server
+
+def run_server(manager: JobManager, host: str = "127.0.0.1", port: int = 8765, socket_path: Optional[str] = None):
+    """Serve the job API until interrupted, then stop the workers."""
+    server = create_server(manager, host, port, socket_path)
+    address = socket_path or f"http://{host}:{server.server_address[1]}"
+    print(f"Serving resume optimize jobs on {address} (Ctrl+C to stop)")
+
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("\nShutting down...")
+    finally:
+        server.server_close()
+        manager.shutdown(wait=False)
+        if socket_path and os.path.exists(socket_path):
+            os.remove(socket_path)
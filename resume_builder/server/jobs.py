@@ -0,0 +1,252 @@
+import os
+import time
+import uuid
+import base64
+import importlib
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterator, List, Optional
+
+from resume_builder.pipeline.timing import StageTimer
+
+JOB_STATES = ("queued", "running", "done", "failed")
+OUTPUT_FORMATS = ("pdf", "html", "docx", "json")
+
+class Job:
+    """One optimize request, its state and the progress events emitted while it runs."""
+
+    def __init__(self, job_id: str, request: Dict[str, Any], output_dir: str):
+        self.id = job_id
+        self.request = request
+        self.output_dir = output_dir
+        self.status = "queued"
+        self.created_at = time.time()
+        self.started_at: Optional[float] = None
+        self.finished_at: Optional[float] = None
+        self.output_path: Optional[str] = None
+        self.error: Optional[str] = None
+        self.timings: Dict[str, float] = {}
+        self.events: List[Dict[str, Any]] = []
+        self._cond = threading.Condition()
+        self.emit("status", status="queued")
+
+    @property
+    def finished(self) -> bool:
+        return self.status in ("done", "failed")
+
+    def emit(self, event: str, **data: Any):
+        """Append a progress event and wake anyone waiting on this job."""
+        with self._cond:
+            self.events.append({"seq": len(self.events), "event": event, "time": time.time(), **data})
+            self._cond.notify_all()
+
+    def set_status(self, status: str, **data: Any):
+        with self._cond:
+            self.status = status
+            if status == "running":
+                self.started_at = time.time()
+            elif status in ("done", "failed"):
+                self.finished_at = time.time()
+        self.emit("status", status=status, **data)
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """Block until the job finishes or the timeout passes. Returns True if it finished."""
+        with self._cond:
+            return self._cond.wait_for(lambda: self.finished, timeout=timeout)
+
+    def iter_events(self, since: int = 0, heartbeat: float = 15.0) -> Iterator[Optional[Dict[str, Any]]]:
+        """
+        Yield events from sequence number since onwards as they happen, until the job finishes.
+
+        Yields None every heartbeat seconds without news, so streaming callers can
+        keep the connection alive (and notice disconnected clients).
+        """
+        position = since
+        while True:
+            with self._cond:
+                self._cond.wait_for(lambda: len(self.events) > position or self.finished, timeout=heartbeat)
+                pending = self.events[position:]
+                finished = self.finished
+            if not pending:
+                if finished:
+                    return
+                yield None
+                continue
+            for event in pending:
+                yield event
+            position += len(pending)
+            if finished and position >= len(self.events):
+                return
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "job_id": self.id,
+            "status": self.status,
+            "created_at": self.created_at,
+            "started_at": self.started_at,
+            "finished_at": self.finished_at,
+            "output_format": self.request["output_format"],
+            "output_path": self.output_path,
+            "error": self.error,
+            "timings": self.timings
+        }
+
+def validate_request(request: Any) -> Dict[str, Any]:
+    """Check an optimize request and fill in defaults. Raises ValueError on bad input."""
+    if not isinstance(request, dict):
+        raise ValueError("Request body must be a JSON object")
+
+    job_description = request.get("job_description")
+    if not isinstance(job_description, str) or not job_description.strip():
+        raise ValueError("'job_description' is required")
+
+    if not request.get("resume_path") and not request.get("resume_pdf"):
+        raise ValueError("Either 'resume_path' or 'resume_pdf' (base64-encoded PDF) is required")
+    if request.get("resume_path") and not os.path.isfile(request["resume_path"]):
+        raise ValueError(f"Resume file not found: {request['resume_path']}")
+
+    output_format = request.get("output_format", "pdf")
+    if output_format not in OUTPUT_FORMATS:
+        raise ValueError(f"'output_format' must be one of: {', '.join(OUTPUT_FORMATS)}")
+
+    keywords = request.get("keywords") or []
+    if not isinstance(keywords, list) or not all(isinstance(keyword, str) for keyword in keywords):
+        raise ValueError("'keywords' must be a list of strings")
+
+    return {
+        "job_description": job_description,
+        "resume_path": request.get("resume_path"),
+        "resume_pdf": request.get("resume_pdf"),
+        "output_format": output_format,
+        "template": request.get("template"),
+        "keywords": keywords,
+        "skip_ats": bool(request.get("skip_ats", False))
+    }
+
+class JobManager:
+    """
+    Run optimize jobs on a pool of worker threads inside one warm process.
+
+    Jobs get an ID as soon as they are submitted and move through
+    queued -> running -> done/failed. Each job writes to its own directory
+    under output_dir. Finished jobs beyond max_jobs are forgotten oldest first
+    (their files stay on disk).
+    """
+
+    def __init__(self, output_dir: str = os.path.join("output", "jobs"), max_workers: int = 2,
+                 max_jobs: int = 1000, api_key: Optional[str] = None):
+        self.output_dir = output_dir
+        self.max_jobs = max_jobs
+        self.api_key = api_key
+        self._jobs: "OrderedDict[str, Job]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=max(1, max_workers), thread_name_prefix="resume-job")
+
+    def submit(self, request: Dict[str, Any]) -> Job:
+        """Validate and queue an optimize request. Raises ValueError on bad input."""
+        request = validate_request(request)
+        # Decode the upload before anything is written, so a bad request leaves no job directory behind
+        pdf_bytes = None
+        if request["resume_pdf"]:
+            try:
+                pdf_bytes = base64.b64decode(request["resume_pdf"], validate=True)
+            except ValueError:
+                raise ValueError("'resume_pdf' is not valid base64")
+
+        job_id = uuid.uuid4().hex[:16]
+        job_dir = os.path.join(self.output_dir, job_id)
+        os.makedirs(job_dir, exist_ok=True)
+
+        if pdf_bytes is not None:
+            request["resume_path"] = os.path.join(job_dir, "resume_input.pdf")
+            with open(request["resume_path"], 'wb') as f:
+                f.write(pdf_bytes)
+        request.pop("resume_pdf")
+
+        job = Job(job_id, request, job_dir)
+        with self._lock:
+            self._jobs[job_id] = job
+            self._forget_old_jobs()
+        self._executor.submit(self._run, job)
+        return job
+
+    def _forget_old_jobs(self):
+        # Callers hold self._lock
+        excess = len(self._jobs) - self.max_jobs
+        for job_id in [job_id for job_id, job in self._jobs.items() if job.finished][:max(0, excess)]:
+            del self._jobs[job_id]
+
+    def _run(self, job: Job):
+        from resume_builder.pipeline.optimize import optimize_resume
+
+        job.set_status("running")
+        timer = StageTimer(on_stage=lambda name, seconds: job.emit("stage", stage=name, seconds=round(seconds, 3)))
+        try:
+            job.output_path = optimize_resume(
+                job.request["resume_path"],
+                job.request["job_description"],
+                output_format=job.request["output_format"],
+                output_dir=job.output_dir,
+                api_key=self.api_key,
+                skip_ats=job.request["skip_ats"],
+                template_name=job.request["template"],
+                user_keywords=job.request["keywords"],
+                timer=timer
+            )
+            job.timings = {name: round(seconds, 3) for name, seconds in timer.as_dict().items()}
+            job.set_status("done", output_path=job.output_path)
+        except Exception as e:
+            job.error = str(e)
+            job.timings = {name: round(seconds, 3) for name, seconds in timer.as_dict().items()}
+            job.set_status("failed", error=job.error)
+
+    def get(self, job_id: str) -> Optional[Job]:
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def list(self) -> List[Job]:
+        with self._lock:
+            return list(self._jobs.values())
+
+    def counts(self) -> Dict[str, int]:
+        """Number of known jobs in each state."""
+        counts = {state: 0 for state in JOB_STATES}
+        for job in self.list():
+            counts[job.status] += 1
+        return counts
+
+    def shutdown(self, wait: bool = True):
+        """Stop accepting work; queued jobs are cancelled unless wait is True."""
+        self._executor.shutdown(wait=wait, cancel_futures=not wait)
+
+def warm_up(output_formats=OUTPUT_FORMATS, model_name: str = "gemini-1.5-pro"):
+    """
+    Import the pipeline and create the shared clients and formatters up front.
+
+    Run once at server start so the first request does not pay for importing
+    LangChain, WeasyPrint and python-docx or for building clients and Jinja
+    environments. Formats whose native libraries are missing are reported and skipped.
+    """
+    from resume_builder.pipeline.outputs import get_html_formatter, get_pdf_converter, get_docx_converter
+    from resume_builder.formatters.template_manager import TemplateManager
+    from resume_builder.llm.clients import get_chat_model
+
+    # Importing the pipeline imports every tool
+    importlib.import_module("resume_builder.pipeline.optimize")
+
+    # One client per temperature the tools use
+    for temperature in (None, 0.1, 0.2):
+        get_chat_model(model_name, temperature)
+
+    for template_filename in TemplateManager().templates.values():
+        # Compile each template once; the formatter's Jinja environment keeps it
+        get_html_formatter(template_filename).env.get_template(template_filename)
+
+    converters = {"pdf": get_pdf_converter, "docx": get_docx_converter}
+    for output_format in output_formats:
+        if output_format in converters:
+            try:
+                converters[output_format]()
+            except (ImportError, OSError) as e:
+                print(f"Warning: {output_format} output is unavailable: {str(e).splitlines()[0]}")
@@ -1,25 +1,75 @@
 import os
 import json
-import time
 import random
 import re
-from typing import Dict, Any, List
-from langchain_google_genai import ChatGoogleGenerativeAI
+import time
+from typing import Dict, Any, List, Optional, Tuple
 from langchain.prompts import PromptTemplate
 from langchain_core.output_parsers import StrOutputParser
 
 from resume_builder.models.resume import Resume
 from resume_builder.models.job import JobDescription
+from resume_builder.llm.clients import get_chat_model
+from resume_builder.llm.scheduler import quota_scheduler, is_rate_limit_error
+from resume_builder.matching.keyword_scorer import get_keyword_scorer
+from resume_builder.matching.keyword_extractor import corpus_settings, get_keyword_extractor
+from resume_builder.matching.skill_taxonomy import get_skill_taxonomy
+from resume_builder.matching.job_index import job_index
+
+DEFAULT_TARGET_SCORE = 90.0
+# Unlike the old rule (no model call once a resume scored above 70), any resume below the
+# target may use this call, so resumes scoring 70-90 now cost one model call by default
+DEFAULT_MAX_LLM_CALLS = 1
+DEFAULT_MAX_SECONDS = 120.0
+# Assumed duration of a model rewrite, including rate limit waits, until one has been timed
+EXPECTED_LLM_CALL_SECONDS = 15.0
+
+class OptimizationBudget:
+    """Limits of the ATS optimization loop for one resume (set from --ats-target and friends)."""
+
+    def __init__(self, max_llm_calls: int = DEFAULT_MAX_LLM_CALLS, max_seconds: float = DEFAULT_MAX_SECONDS,
+                 target_score: float = DEFAULT_TARGET_SCORE):
+        """
+        Args:
+            max_llm_calls: Model calls allowed per resume once local edits stop improving the score
+            max_seconds: Wall time allowed per resume; no new round starts after it, and
+                no model call starts unless a typical one can finish before it
+            target_score: ATS score at which optimization stops
+        """
+        self.max_llm_calls = max_llm_calls
+        self.max_seconds = max_seconds
+        self.target_score = target_score
+
+optimization_budget = OptimizationBudget()
+
+def configure_optimization_budget(max_llm_calls: Optional[int] = None, max_seconds: Optional[float] = None,
+                                  target_score: Optional[float] = None):
+    """Set the process-wide ATS optimization budget; arguments left as None keep their current value."""
+    if max_llm_calls is not None:
+        optimization_budget.max_llm_calls = max_llm_calls
+    if max_seconds is not None:
+        optimization_budget.max_seconds = max_seconds
+    if target_score is not None:
+        optimization_budget.target_score = target_score
 
 class ATSOptimizer:
     """Tool to optimize a resume for Applicant Tracking Systems (ATS) with local fallbacks."""
     
-    def __init__(self, model_name="gemini-1.5-pro", api_key=None):
+    def __init__(self, model_name="gemini-1.5-pro", api_key=None, stemming=True, budget=None):
         self.model_name = model_name
+        # Match keywords to inflected forms in the resume ("engineers" for "Engineer")
+        self.stemming = stemming
+        # Defaults to the process-wide budget, so configure_optimization_budget applies to every optimizer
+        self.budget = budget or optimization_budget
+        # Moving average of how long model rewrites take, to tell whether one still fits the time budget
+        self.llm_call_seconds = EXPECTED_LLM_CALL_SECONDS
         if api_key:
             os.environ["GOOGLE_API_KEY"] = api_key
-        # Flag to track if we've hit quota limits
-        self.quota_exhausted = False
+
+    @property
+    def quota_exhausted(self) -> bool:
+        """Whether the model ran out of quota; shared by every tool through the quota scheduler."""
+        return quota_scheduler.is_exhausted(self.model_name)
     
     def _extract_keywords_local(self, job_description: JobDescription) -> List[str]:
         """
@@ -49,8 +99,22 @@ class ATSOptimizer:
                 if len(term) > 2 and term.lower() not in common_words:
                     keywords.add(term)
         
-        # Return as a list
-        return list(keywords)
+        # Add the posting's most distinctive terms, ranked against the corpus of postings seen so far.
+        # The corpus is built from raw postings, so only a job that still has its posting text is ranked
+        posting_text = job_description._posting_text
+        if corpus_settings.enabled and posting_text:
+            try:
+                taxonomy = get_skill_taxonomy()
+                seen = {taxonomy.canonical_key(keyword) for keyword in keywords}
+                for term in get_keyword_extractor().extract(posting_text):
+                    if taxonomy.canonical_key(term) not in seen:
+                        keywords.add(term)
+                        seen.add(taxonomy.canonical_key(term))
+            except Exception as e:
+                print(f"Warning: Could not rank terms against the keyword corpus: {str(e)}")
+        
+        # Return as a list, one spelling per skill ("JS" and "JavaScript" are one keyword)
+        return get_skill_taxonomy().dedupe(keywords)
     
     def extract_keywords(self, job_description: JobDescription) -> List[str]:
         """
@@ -71,69 +135,54 @@ class ATSOptimizer:
                 print("Using local keyword extraction (sufficient keywords found)")
                 return local_keywords
             
-            # Try API-based extraction with retry logic
-            max_retries = 2  # Limit retries to conserve quota
-            retries = 0
-            backoff = 2
+            # Try API-based extraction; rate limits are retried by the quota scheduler
+            llm = get_chat_model(self.model_name, temperature=0.1)
             
-            while retries <= max_retries:
-                try:
-                    llm = ChatGoogleGenerativeAI(model=self.model_name, temperature=0.1)
-                    
-                    template = """
-                    Extract important keywords from this job description that would be 
-                    relevant for ATS systems. Focus on hard skills, technical abilities,
-                    tools, and domain knowledge.
-                    
-                    Job Description:
-                    {job_description}
-                    
-                    Return ONLY a JSON array of keywords, with no explanation.
-                    For example: ["Python", "AWS", "Machine Learning"]
-                    """
-                    
-                    job_text = f"""
-                    Title: {job_description.title}
-                    Required Skills: {', '.join(job_description.required_skills)}
-                    Preferred Skills: {', '.join(job_description.preferred_skills)}
-                    Responsibilities: {', '.join(job_description.key_responsibilities)}
-                    """
-                    
-                    prompt = PromptTemplate.from_template(template)
-                    chain = prompt | llm | StrOutputParser()
-                    
-                    result = chain.invoke({"job_description": job_text})
-                    
-                    # Extract JSON array
-                    json_start = result.find("[")
-                    json_end = result.rfind("]") + 1
-                    
-                    if json_start >= 0 and json_end > json_start:
-                        json_str = result[json_start:json_end]
-                        keywords = json.loads(json_str)
-                        
-                        # Merge with local keywords for better coverage
-                        combined = list(set(keywords + local_keywords))
-                        return combined
-                    else:
-                        raise ValueError("No valid JSON array found in response")
-                    
-                except Exception as e:
-                    retries += 1
-                    if '429' in str(e) or 'Resource has been exhausted' in str(e):
-                        print(f"API quota exhausted. Switching to local keyword extraction.")
-                        self.quota_exhausted = True  # Mark quota as exhausted for future calls
-                        return local_keywords
-                    
-                    if retries > max_retries:
-                        print(f"API keyword extraction failed after {max_retries} retries.")
-                        return local_keywords
-                    
-                    print(f"Keyword extraction error: {str(e)}. Retrying in {backoff}s...")
-                    time.sleep(backoff)
-                    backoff *= 2
+            template = """
+            Extract important keywords from this job description that would be 
+            relevant for ATS systems. Focus on hard skills, technical abilities,
+            tools, and domain knowledge.
+            
+            Job Description:
+            {job_description}
+            
+            Return ONLY a JSON array of keywords, with no explanation.
+            For example: ["Python", "AWS", "Machine Learning"]
+            """
+            
+            job_text = f"""
+            Title: {job_description.title}
+            Required Skills: {', '.join(job_description.required_skills)}
+            Preferred Skills: {', '.join(job_description.preferred_skills)}
+            Responsibilities: {', '.join(job_description.key_responsibilities)}
+            """
             
-            return local_keywords
+            prompt = PromptTemplate.from_template(template)
+            chain = prompt | llm | StrOutputParser()
+            
+            try:
+                result = chain.invoke({"job_description": job_text})
+                
+                # Extract JSON array
+                json_start = result.find("[")
+                json_end = result.rfind("]") + 1
+                
+                if json_start >= 0 and json_end > json_start:
+                    json_str = result[json_start:json_end]
+                    keywords = json.loads(json_str)
+                    
+                    # Merge with local keywords for better coverage
+                    combined = get_skill_taxonomy().dedupe(keywords + local_keywords)
+                    return combined
+                else:
+                    raise ValueError("No valid JSON array found in response")
+                
+            except Exception as e:
+                if is_rate_limit_error(e):
+                    print("API quota exhausted. Switching to local keyword extraction.")
+                else:
+                    print(f"API keyword extraction failed: {str(e)}")
+                return local_keywords
             
         except Exception as e:
             print(f"Error in keyword extraction: {str(e)}")
@@ -144,47 +193,28 @@ class ATSOptimizer:
         Analyze how well a resume matches ATS keywords and score it.
         This function works entirely locally without API calls.
         """
-        # Create a complete text representation of the resume
-        resume_text = json.dumps(resume.model_dump()).lower()
+        # The scorer keeps each section's match state, so re-scoring an optimized
+        # copy only re-examines the sections the optimization changed
+        return get_keyword_scorer(tuple(keywords), self.stemming).score(resume)
+    
+    def analyze_resume_ats_scores(self, resume: Resume, keyword_sets, include_keywords: bool = True):
+        """
+        Score one resume against the ATS keywords of many jobs at once.
         
-        # Count keyword matches with smarter matching
-        matches = []
-        missing = []
-        partial_matches = []
+        Equivalent to calling analyze_resume_ats_score per job, but the resume is
+        indexed once and each distinct keyword is looked up once across all jobs.
         
-        for keyword in keywords:
-            keyword_lower = keyword.lower()
-            
-            # Check for exact match
-            if keyword_lower in resume_text:
-                matches.append(keyword)
-            else:
-                # Check if all words in multi-word keyword appear
-                all_words_present = True
-                for word in keyword_lower.split():
-                    if len(word) > 3 and word not in resume_text:  # Only check significant words
-                        all_words_present = False
-                        break
-                
-                if all_words_present and len(keyword_lower.split()) > 1:
-                    partial_matches.append(keyword)
-                else:
-                    missing.append(keyword)
-        
-        # Compute score with partial credit for partial matches
-        total_keywords = len(keywords)
-        if total_keywords == 0:
-            return {"score": 100, "matches": [], "missing": [], "partial_matches": [], "total_keywords": 0}
-        
-        match_percentage = ((len(matches) + (len(partial_matches) * 0.5)) / total_keywords) * 100
-        
-        return {
-            "score": match_percentage,
-            "matches": matches,
-            "missing": missing,
-            "partial_matches": partial_matches,
-            "total_keywords": total_keywords
-        }
+        Args:
+            resume: The resume to score
+            keyword_sets: Mapping (or iterable of pairs) of job ID to that job's keywords
+            include_keywords: Also list the matched, partial and missing keywords of each job
+        
+        Returns:
+            pandas DataFrame of scores indexed by job ID
+        """
+        # NumPy and pandas are only needed for batch scoring
+        from resume_builder.matching.batch_scoring import score_keyword_sets
+        return score_keyword_sets(resume, keyword_sets, stemming=self.stemming, include_keywords=include_keywords)
     
     def _enhance_summary_locally(self, summary: str, missing_keywords: List[str], max_keywords=3) -> str:
         """
@@ -216,13 +246,24 @@ class ATSOptimizer:
         """
         Optimize a resume for ATS systems with fallback to local processing.
         """
-        # If quota is already exhausted or high score, use local optimization
-        if self.quota_exhausted or ats_analysis["score"] > 70:
+        if self.quota_exhausted:
+            return self._optimize_locally(resume, job, ats_analysis)
+        
+        updated_resume = self._optimize_with_model(resume, job, ats_analysis)
+        if updated_resume is None:
             return self._optimize_locally(resume, job, ats_analysis)
+        return updated_resume
+    
+    def _optimize_with_model(self, resume: Resume, job: JobDescription, ats_analysis: Dict[str, Any]) -> Optional[Resume]:
+        """
+        Ask the model to rewrite the summary and skills around the missing keywords.
         
+        Returns:
+            The updated resume, or None if the call failed or its response could not be used
+        """
         try:
             # Try API-based optimization first
-            llm = ChatGoogleGenerativeAI(model=self.model_name, temperature=0.2)
+            llm = get_chat_model(self.model_name, temperature=0.2)
             
             template = """
             Optimize this resume summary and skills for ATS systems:
@@ -243,7 +284,7 @@ class ATSOptimizer:
             """
             
             # Prepare a list of skills
-            current_skills = resume.skills.technical
+            current_skills = list(resume.skills.technical)
             if resume.skills.soft:
                 current_skills.extend(resume.skills.soft)
             
@@ -278,29 +319,29 @@ class ATSOptimizer:
                     
                     # Update skills if provided
                     if "skills" in updates and isinstance(updates["skills"], list):
-                        # Add new skills to technical skills
-                        existing_skills_set = set(updated_resume.skills.technical)
+                        # Add new skills to technical skills, skipping other spellings of skills already listed
+                        taxonomy = get_skill_taxonomy()
+                        existing_skills_set = {taxonomy.canonical_key(s) for s in updated_resume.skills.technical}
                         for skill in updates["skills"]:
-                            if skill not in existing_skills_set:
+                            if taxonomy.canonical_key(skill) not in existing_skills_set:
                                 updated_resume.skills.technical.append(skill)
+                                existing_skills_set.add(taxonomy.canonical_key(skill))
                     
                     return updated_resume
                 else:
-                    # Fallback to local optimization
                     print("Invalid JSON response from API, falling back to local optimization")
-                    return self._optimize_locally(resume, job, ats_analysis)
+                    return None
             except Exception as e:
                 print(f"Error parsing API response: {str(e)}")
-                return self._optimize_locally(resume, job, ats_analysis)
+                return None
                 
         except Exception as e:
-            if '429' in str(e) or 'Resource has been exhausted' in str(e):
+            if is_rate_limit_error(e):
                 print("API quota exhausted, using local optimization")
-                self.quota_exhausted = True
             else:
                 print(f"ATS optimization error: {str(e)}")
             
-            return self._optimize_locally(resume, job, ats_analysis)
+            return None
     
     def _optimize_locally(self, resume: Resume, job: JobDescription, ats_analysis: Dict[str, Any]) -> Resume:
         """
@@ -313,32 +354,26 @@ class ATSOptimizer:
         # 1. Add missing keywords to skills section
         missing_relevant = []
         
-        # Check which missing keywords are in job requirements
-        req_skills_lower = [s.lower() for s in job.required_skills]
-        pref_skills_lower = [s.lower() for s in job.preferred_skills]
-        
+        # Check which missing keywords are in job requirements, using the job's cached index
+        index = job_index(job, self.stemming)
         for keyword in ats_analysis["missing"]:
-            keyword_lower = keyword.lower()
-            if (keyword_lower in req_skills_lower or 
-                keyword_lower in pref_skills_lower or
-                any(keyword_lower in resp.lower() for resp in job.key_responsibilities)):
+            if index.is_skill(keyword) or index.in_responsibilities(keyword):
                 missing_relevant.append(keyword)
         
-        # Add relevant missing skills
-        existing_skills = set(s.lower() for s in updated_resume.skills.technical)
+        # Add relevant missing skills, unless the resume already lists them under another spelling
+        taxonomy = get_skill_taxonomy()
+        existing_skills = {taxonomy.canonical_key(s) for s in updated_resume.skills.technical + (updated_resume.skills.soft or [])}
         for skill in missing_relevant:
-            if skill.lower() not in existing_skills:
+            if taxonomy.canonical_key(skill) not in existing_skills:
                 updated_resume.skills.technical.append(skill)
+                existing_skills.add(taxonomy.canonical_key(skill))
         
         # 2. Enhance summary with important missing keywords
         # Choose keywords that appear in required skills or job title
         critical_keywords = []
-        job_title_lower = job.title.lower()
         
         for keyword in ats_analysis["missing"]:
-            keyword_lower = keyword.lower()
-            if (keyword_lower in job_title_lower or
-                keyword_lower in req_skills_lower):
+            if index.in_title(keyword) or index.is_required(keyword):
                 critical_keywords.append(keyword)
         
         # Enhance the summary
@@ -350,35 +385,102 @@ class ATSOptimizer:
         
         return updated_resume
     
-    def __call__(self, resume: Resume, job: JobDescription) -> Resume:
+    def optimize(self, resume: Resume, job: JobDescription,
+                 keywords: Optional[List[str]] = None) -> Tuple[Resume, Dict[str, Any], Dict[str, Any]]:
         """
-        Optimize a resume to pass ATS systems for a specific job.
+        Optimize a resume for ATS and report the scores before and after.
+        
+        Args:
+            resume: The resume to optimize
+            job: The job to optimize it for
+            keywords: The job's ATS keywords, if already extracted (see extract_keywords)
+        
+        Returns:
+            Tuple of (optimized Resume, initial ATS analysis, final ATS analysis)
         """
         # 1. Extract important keywords from job description
-        keywords = self.extract_keywords(job)
+        if keywords is None:
+            keywords = self.extract_keywords(job)
         
         # 2. Analyze how well the resume matches these keywords
         ats_analysis = self.analyze_resume_ats_score(resume, keywords)
         
         # 3. Print ATS analysis
-        print(f"\nATS Analysis:")
+        print("\nATS Analysis:")
         print(f"Current Score: {ats_analysis['score']:.1f}%")
         print(f"Matched Keywords ({len(ats_analysis['matches'])}): {', '.join(ats_analysis['matches'])}")
         if ats_analysis["partial_matches"]:
             print(f"Partial Matches ({len(ats_analysis['partial_matches'])}): {', '.join(ats_analysis['partial_matches'])}")
         print(f"Missing Keywords ({len(ats_analysis['missing'])}): {', '.join(ats_analysis['missing'])}")
+        if ats_analysis.get("fuzzy_matches"):
+            near_misses = [f"{m['keyword']} ~ {m['match']} ({m['confidence']:.0%})" for m in ats_analysis["fuzzy_matches"]]
+            print(f"Near Misses ({len(near_misses)}): {', '.join(near_misses)}")
         
-        # 4. If score is already very high, skip optimization
-        if ats_analysis["score"] > 90:
+        # 4. If the score already reaches the target, skip optimization
+        if ats_analysis["score"] >= self.budget.target_score:
             print(f"\nATS score is already excellent ({ats_analysis['score']:.1f}%). Skipping optimization.")
-            return resume
+            return resume, ats_analysis, ats_analysis
         
-        # 5. Optimize the resume
-        optimized_resume = self.optimize_resume_for_ats(resume, job, ats_analysis)
+        # 5. Improve the resume round by round within the budget
+        optimized_resume, new_analysis = self.optimize_within_budget(resume, job, keywords, ats_analysis)
         
-        # 6. Re-analyze the optimized resume
-        new_analysis = self.analyze_resume_ats_score(optimized_resume, keywords)
         print(f"\nOptimized Resume Score: {new_analysis['score']:.1f}%")
         print(f"Improvement: +{new_analysis['score'] - ats_analysis['score']:.1f}%")
         
-        return optimized_resume
\ No newline at end of file
+        return optimized_resume, ats_analysis, new_analysis
+    
+    def optimize_within_budget(self, resume: Resume, job: JobDescription, keywords: List[str],
+                               ats_analysis: Dict[str, Any]) -> Tuple[Resume, Dict[str, Any]]:
+        """
+        Improve a resume in rounds until it reaches the target score or the budget runs out.
+        
+        Each round applies local edits first; the model is only called once a
+        local round no longer raises the score. Every candidate is scored
+        locally (re-scoring only examines the sections a round changed) and
+        kept only if it scores higher, so the result never scores lower than
+        the input. Stops at the target score, after budget.max_llm_calls model
+        calls, once budget.max_seconds have passed, or when a model call is
+        due but the time left is shorter than model calls have been taking
+        (see llm_call_seconds), so a call does not run far past the deadline.
+        
+        Returns:
+            Tuple of (best resume found, its ATS analysis)
+        """
+        budget = self.budget
+        deadline = time.monotonic() + budget.max_seconds
+        best, best_analysis = resume, ats_analysis
+        rounds = llm_calls = 0
+        
+        while best_analysis["score"] < budget.target_score and time.monotonic() < deadline:
+            rounds += 1
+            candidate = self._optimize_locally(best, job, best_analysis)
+            candidate_analysis = self.analyze_resume_ats_score(candidate, keywords)
+            
+            if candidate_analysis["score"] <= best_analysis["score"]:
+                # Local edits have plateaued; only the model can add more
+                if llm_calls >= budget.max_llm_calls or self.quota_exhausted:
+                    break
+                if deadline - time.monotonic() < self.llm_call_seconds:
+                    print(f"ATS optimization: skipping the model call, less than {self.llm_call_seconds:.0f}s of the time budget left")
+                    break
+                llm_calls += 1
+                started = time.monotonic()
+                candidate = self._optimize_with_model(best, job, best_analysis)
+                self.llm_call_seconds = (self.llm_call_seconds + time.monotonic() - started) / 2
+                if candidate is None:
+                    break
+                candidate_analysis = self.analyze_resume_ats_score(candidate, keywords)
+                if candidate_analysis["score"] <= best_analysis["score"]:
+                    break
+            
+            best, best_analysis = candidate, candidate_analysis
+        
+        print(f"ATS optimization: {rounds} round(s), {llm_calls} model call(s), score {best_analysis['score']:.1f}%")
+        return best, best_analysis
+    
+    def __call__(self, resume: Resume, job: JobDescription) -> Resume:
+        """
+        Optimize a resume to pass ATS systems for a specific job.
+        """
+        optimized_resume, _, _ = self.optimize(resume, job)
+        return optimized_resume
@@ -1,24 +1,68 @@
 import os
 import json
-from typing import Dict, Any
-from langchain_google_genai import ChatGoogleGenerativeAI
+import sqlite3
+from typing import Dict, Any, Optional
 from langchain.prompts import PromptTemplate
 from langchain_core.output_parsers import StrOutputParser
 
 from resume_builder.models.job import JobDescription
+from resume_builder.cache.job_cache import JobAnalysisCache, get_job_cache
+from resume_builder.cache.settings import cache_settings
+from resume_builder.matching.keyword_extractor import corpus_settings, get_keyword_extractor
+from resume_builder.llm.clients import get_chat_model
+
+# Bump whenever the analysis prompt changes so cached analyses are recomputed
+PROMPT_VERSION = "1"
 
 class JobDescriptionAnalyzer:
     """Tool to analyze job descriptions and extract key requirements."""
     
-    def __init__(self, model_name="gemini-1.5-pro", api_key=None):
+    def __init__(self, model_name="gemini-1.5-pro", api_key=None, cache: Optional[JobAnalysisCache] = None):
         self.model_name = model_name
+        self.cache = cache
         if api_key:
             os.environ["GOOGLE_API_KEY"] = api_key
     
     def __call__(self, job_description: str) -> JobDescription:
-        """Extract key requirements and preferences from a job description."""
+        """
+        Extract key requirements and preferences from a job description.
+        
+        Analyses are cached by the normalized posting text, so a posting that
+        has been seen before costs a local lookup instead of a model call.
+        """
+        # Every posting, whether analyzed now or cached, also feeds the corpus used for local keyword extraction
+        if corpus_settings.enabled:
+            try:
+                get_keyword_extractor().corpus.add(job_description)
+            except sqlite3.Error as e:
+                print(f"Warning: Could not add the posting to the keyword corpus: {str(e)}")
+        
+        job = self._analyze_cached(job_description)
+        # Local keyword extraction ranks the posting itself, the text the corpus is built from
+        job._posting_text = job_description
+        return job
+    
+    def _analyze_cached(self, job_description: str) -> JobDescription:
+        if not cache_settings.enabled:
+            return self.analyze(job_description)
+        
+        cache = self.cache or get_job_cache()
+        cache_key = cache.make_key(job_description, self.model_name, PROMPT_VERSION)
+        
+        if not cache_settings.refresh:
+            cached_job = cache.get(cache_key)
+            if cached_job is not None:
+                print(f"Using cached job description analysis for: {cached_job.title}")
+                return cached_job
+        
+        job = self.analyze(job_description)
+        cache.put(cache_key, job, self.model_name)
+        return job
+    
+    def analyze(self, job_description: str) -> JobDescription:
+        """Extract key requirements and preferences from a job description, always calling the model."""
         try:
-            llm = ChatGoogleGenerativeAI(model=self.model_name)
+            llm = get_chat_model(self.model_name)
             
             template = """
             Analyze the following job description and extract:
@@ -2,6 +2,34 @@
 
 from typing import Dict, List, Any
 from resume_builder.models.job import JobDescription
+from resume_builder.matching.skill_taxonomy import get_skill_taxonomy
+from resume_builder.matching.job_index import JobIndex, job_index
+
+# Near misses within this many edits (one swap, substitution, insertion or deletion,
+# in words of 4 or more characters) are rewritten to the job's skill
+MAX_CORRECTION_EDITS = 1
+
+def relevance(index: JobIndex, keyword: str) -> int:
+    """Score how relevant a keyword is to the indexed job."""
+    score = 0
+    
+    # Check for exact match with job skills
+    if index.is_skill(keyword):
+        score += 10
+    
+    # Check for partial match with job skills
+    if index.in_skills(keyword):
+        score += 5
+    
+    # Check for presence in job title
+    if index.in_title(keyword):
+        score += 8
+    
+    # Check for presence in job responsibilities
+    if index.in_responsibilities(keyword):
+        score += 3
+    
+    return score
 
 class KeywordProcessor:
     """Tool to process and select the most relevant keywords from user input."""
@@ -26,36 +54,30 @@ class KeywordProcessor:
         if not keywords or not job:
             return []
         
-        # Extract required and preferred skills from job for comparison
-        job_skills = set([skill.lower() for skill in job.required_skills + job.preferred_skills])
+        # The job's skills, title and responsibilities are indexed once and cached on the job
+        index = job_index(job)
         
-        # Score keywords based on relevance to the job
-        scored_keywords = []
+        # Replace near misses of the job's skills ("Pyhton", "Tensorflow2") with the skill as the job writes it.
+        # Keywords that name a known skill ("MySQL") are never near misses of another one
+        taxonomy = get_skill_taxonomy()
+        confidences = {}
+        corrected_keywords = []
         for keyword in keywords:
-            score = 0
-            keyword_lower = keyword.lower()
-            
-            # Check for exact match with job skills
-            if keyword_lower in job_skills:
-                score += 10
-            
-            # Check for partial match with job skills
-            for skill in job_skills:
-                if keyword_lower in skill or skill in keyword_lower:
-                    score += 5
-                    break
-            
-            # Check for presence in job title
-            if keyword_lower in job.title.lower():
-                score += 8
-            
-            # Check for presence in job responsibilities
-            for resp in job.key_responsibilities:
-                if keyword_lower in resp.lower():
-                    score += 3
-                    break
-            
-            scored_keywords.append((keyword, score))
+            confidence = 1.0
+            if not index.is_skill(keyword) and taxonomy.canonical_id(keyword) is None:
+                closest = index.closest_skill(keyword)
+                if closest and closest[1] <= MAX_CORRECTION_EDITS:
+                    print(f"Matched keyword '{keyword}' to job skill '{closest[0]}' ({closest[2]:.0%} confidence)")
+                    keyword, confidence = closest[0], closest[2]
+            confidences[keyword] = max(confidences.get(keyword, 0.0), confidence)
+            corrected_keywords.append(keyword)
+        
+        # Spellings of the same skill ("K8s", "Kubernetes") count as one keyword
+        keywords = taxonomy.dedupe(corrected_keywords)
+        
+        # Score keywords based on relevance to the job; corrected keywords count
+        # in proportion to how sure the correction is
+        scored_keywords = [(keyword, relevance(index, keyword) * confidences[keyword]) for keyword in keywords]
         
         # Sort keywords by score (descending) and take top max_count
         sorted_keywords = [kw for kw, score in sorted(scored_keywords, key=lambda x: x[1], reverse=True)]
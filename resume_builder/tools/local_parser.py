@@ -0,0 +1,375 @@
+import re
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+EMAIL_PATTERN = re.compile(r"[A-Za-z0-9._%+-]+@[A-Za-z0-9-]+(?:\.[A-Za-z0-9-]+)*\.[A-Za-z]{2,}")
+# At least 7 digits, optionally grouped with spaces, dots, dashes or parentheses ("+1 (555) 010-0100")
+PHONE_PATTERN = re.compile(r"(?<![\w.])\+?\(?\d[\d\s().-]{5,}\d(?![\w.])")
+LINKEDIN_PATTERN = re.compile(r"(?:https?://)?(?:[a-z]{2,3}\.)?linkedin\.com/(?:in|pub)/[A-Za-z0-9_%-]+/?", re.IGNORECASE)
+URL_PATTERN = re.compile(r"(?:https?://|www\.)\S+|\b[a-z0-9-]+\.(?:com|dev|io|me|net|org)(?:/\S*)?", re.IGNORECASE)
+
+# "-", "•", "*" or "1." at the start of a line, followed by the bullet's text
+BULLET_PATTERN = re.compile(r"^\s*(?:[-–•*▪◦‣●■►]|\d{1,2}[.)])\s+(?=\S)")
+YEAR_PATTERN = re.compile(r"\b(?:19|20)\d{2}\b")
+_MONTH = r"(?:jan|feb|mar|apr|may|jun|jul|aug|sep|sept|oct|nov|dec)[a-z]*\.?"
+_DATE = rf"(?:{_MONTH}\s+)?(?:\d{{1,2}}/)?(?:19|20)\d{{2}}"
+# "2019 - 2021", "Jan 2020 – Present", "03/2018 to 06/2020", or a lone year
+DURATION_PATTERN = re.compile(
+    rf"\(?\s*({_DATE}\s*(?:-|–|—|to)\s*(?:{_DATE}|present|current|now)|{_DATE})\s*\)?",
+    re.IGNORECASE
+)
+# "Label: text" line, which starts an item of its own rather than continuing the one before
+LABEL_PATTERN = re.compile(r"^[A-Za-z][\w /&+-]{0,30}:\s")
+# Label before a comma-separated list on a line of its own ("Technologies: Python, Flask")
+TECHNOLOGIES_PATTERN = re.compile(r"^\s*(?:technologies|tech stack|stack|tools|built with)\s*:\s*(.+)$", re.IGNORECASE)
+LIST_SEPARATORS = re.compile(r"\s*(?:[,;|•·]|\s-\s)\s*")
+
+# Section headings as resumes write them, lower-cased without trailing punctuation
+SECTION_HEADINGS = {
+    "summary": ["summary", "professional summary", "profile", "professional profile", "about", "about me",
+                "objective", "career objective", "career summary", "overview"],
+    "experience": ["experience", "work experience", "professional experience", "employment",
+                   "employment history", "work history", "career history", "relevant experience"],
+    "education": ["education", "academic background", "education and training", "qualifications"],
+    "skills": ["skills", "technical skills", "core skills", "key skills", "core competencies",
+               "competencies", "skills and tools", "technologies", "tools and technologies"],
+    "projects": ["projects", "personal projects", "selected projects", "key projects", "side projects"],
+    "certifications": ["certifications", "certificates", "licenses and certifications",
+                       "licenses & certifications", "certifications and licenses"],
+    "publications": ["publications", "selected publications", "papers"],
+    "awards": ["awards", "honors", "honors and awards", "awards and honors", "achievements"],
+}
+_HEADING_SECTIONS = {heading: section for section, headings in SECTION_HEADINGS.items() for heading in headings}
+SOFT_SKILL_LABELS = ("soft skills", "interpersonal skills", "soft")
+
+# Sections that are plain lists of strings
+LIST_SECTIONS = ("certifications", "publications", "awards")
+# Unmarked list lines up to this long are taken to be whole items rather than wrapped ones
+MAX_UNMARKED_ITEM_CHARS = 60
+
+# Fields each entry of a section needs before the model can be skipped for it
+REQUIRED_ENTRY_FIELDS = {
+    "experience": ("title", "company", "duration"),
+    "education": ("degree", "institution"),
+    "projects": ("name",),
+}
+
+def _heading_section(line: str) -> Optional[str]:
+    # A heading is a short line of its own, in any case, optionally ending with ":"
+    text = line.strip().rstrip(":").strip()
+    if not text or len(text) > 40:
+        return None
+    return _HEADING_SECTIONS.get(re.sub(r"\s+", " ", text.lower()))
+
+def split_sections(text: str) -> Tuple[List[str], Dict[str, List[str]]]:
+    """
+    Split resume text at its section headings.
+
+    Returns:
+        Tuple of (the lines before the first heading, non-blank lines of each
+        recognized section). Lines under a repeated heading are appended to
+        the section's earlier lines.
+    """
+    header: List[str] = []
+    sections: Dict[str, List[str]] = {}
+    current = header
+    for line in text.splitlines():
+        section = _heading_section(line)
+        if section:
+            current = sections.setdefault(section, [])
+        elif line.strip():
+            current.append(line.strip())
+    return header, sections
+
+def split_bullets(lines: List[str]) -> List[str]:
+    """
+    Get the bullet points in a run of lines, with their markers removed.
+
+    A line without a marker continues the bullet before it (PDF text wraps
+    long bullets), so it is joined onto that bullet rather than read as one,
+    unless it starts with a label ("Technologies: ...").
+    """
+    bullets: List[str] = []
+    for line in lines:
+        match = BULLET_PATTERN.match(line)
+        if match:
+            bullets.append(line[match.end():].strip())
+        elif bullets and not LABEL_PATTERN.match(line):
+            bullets[-1] = f"{bullets[-1]} {line.strip()}"
+        else:
+            bullets.append(line.strip())
+    return bullets
+
+def _entry_starts(lines: List[str]) -> List[int]:
+    # Where each entry starts: at a line that is neither a bullet nor the continuation of one, after bullets
+    starts: List[int] = []
+    in_bullets = False
+    last_bullet = ""
+    for number, line in enumerate(lines):
+        if BULLET_PATTERN.match(line):
+            if not starts:
+                starts.append(number)
+            in_bullets = True
+            last_bullet = line
+        elif in_bullets and (LABEL_PATTERN.match(line) or _continues(last_bullet, line)):
+            last_bullet = line
+        else:
+            if in_bullets or not starts:
+                starts.append(number)
+            in_bullets = False
+    return starts
+
+def split_entries(lines: List[str]) -> List[Tuple[List[str], List[str]]]:
+    """
+    Split a section into entries, each made of heading lines followed by bullets.
+
+    Returns:
+        List of (heading lines, bullet points) per entry, in order
+    """
+    starts = _entry_starts(lines)
+    entries = []
+    for start, end in zip(starts, starts[1:] + [len(lines)]):
+        entry = lines[start:end]
+        first_bullet = next((number for number, line in enumerate(entry) if BULLET_PATTERN.match(line)), len(entry))
+        entries.append((entry[:first_bullet], split_bullets(entry[first_bullet:])))
+    return entries
+
+def _continues(previous: str, line: str) -> bool:
+    # A wrapped bullet continues in lower case, or after a line that did not end a sentence;
+    # a line with a year in it after an unfinished bullet is more likely the next entry's heading
+    if line[:1].islower():
+        return True
+    return not previous.rstrip().endswith((".", "!", "?", ")")) and not YEAR_PATTERN.search(line)
+
+def split_list(text: str) -> List[str]:
+    """Split a comma, semicolon, pipe or bullet separated list into its items."""
+    return [item.strip(" .") for item in LIST_SEPARATORS.split(text) if item.strip(" .")]
+
+def find_duration(text: str) -> Tuple[str, str]:
+    """
+    Find the date range in an entry heading.
+
+    Returns:
+        Tuple of (the date range or "", the heading without it)
+    """
+    match = None
+    for match in DURATION_PATTERN.finditer(text):
+        pass
+    if match is None:
+        return "", text.strip()
+    rest = (text[:match.start()] + " " + text[match.end():]).strip(" ,|-–—")
+    return match.group(1).strip(), re.sub(r"\s+", " ", rest)
+
+def _split_heading(text: str) -> List[str]:
+    # "Engineer, Acme", "Engineer at Acme", "Engineer | Acme" and "Engineer - Acme" all name two parts
+    return [part.strip() for part in re.split(r"\s*(?:,|\||\s-\s|\s–\s|\s—\s|\sat\s|\s@\s)\s*", text) if part.strip()]
+
+def extract_contact(lines: List[str], text: str) -> Dict[str, str]:
+    """
+    Find the contact details of a resume.
+
+    Args:
+        lines: The lines before the first section heading, where the name is looked for
+        text: The whole resume text, searched for the email and LinkedIn URL
+
+    Returns:
+        The contact fields that were found; absent fields are left out
+    """
+    contact: Dict[str, str] = {}
+    email = EMAIL_PATTERN.search(text)
+    if email:
+        contact["email"] = email.group(0)
+    linkedin = LINKEDIN_PATTERN.search(text)
+    if linkedin:
+        contact["linkedin"] = linkedin.group(0).rstrip("/")
+    # Phone numbers are only looked for near the top, where digit runs are not dates or figures
+    for phone in PHONE_PATTERN.finditer("\n".join(lines[:6] or text.splitlines()[:6])):
+        digits = re.sub(r"\D", "", phone.group(0))
+        if 7 <= len(digits) <= 15 and not DURATION_PATTERN.fullmatch(phone.group(0).strip(" ()")):
+            contact["phone"] = phone.group(0).strip()
+            break
+
+    for line in lines[:3]:
+        # The name is the first header line that holds no contact details and reads like a name
+        if EMAIL_PATTERN.search(line) or PHONE_PATTERN.search(line) or URL_PATTERN.search(line):
+            continue
+        words = line.split()
+        if 1 < len(words) <= 5 and all(word[:1].isupper() for word in words) and not any(c.isdigit() for c in line):
+            contact["name"] = line
+            break
+    return contact
+
+def _skill_lines(lines: List[str]) -> Iterator[Tuple[str, str]]:
+    # (lower-cased label, or "" if there is none, and the items) of each line of a skills section;
+    # skill lists are rarely wrapped, so every line is a list of its own
+    for line in lines:
+        match = BULLET_PATTERN.match(line)
+        text = line[match.end():] if match else line
+        label, _, items = text.partition(":")
+        if not items or len(label) > 30:
+            label, items = "", text
+        yield label.strip().lower(), items
+
+def _parse_skills(lines: List[str]) -> Dict[str, List[str]]:
+    skills: Dict[str, List[str]] = {"technical": [], "soft": []}
+    for label, items in _skill_lines(lines):
+        # "Languages: Python, Go" names a category; only "Soft skills:" goes to the soft list.
+        # Unlabelled items are technical until the model tells them apart (see missing_fields)
+        target = "soft" if label in SOFT_SKILL_LABELS else "technical"
+        skills[target] += split_list(items)
+    return skills
+
+def _parse_experience(lines: List[str]) -> List[Dict[str, Any]]:
+    experience = []
+    for heading, bullets in split_entries(lines):
+        duration, rest = find_duration(" | ".join(heading))
+        parts = _split_heading(rest)
+        experience.append({
+            "title": parts[0] if parts else "",
+            "company": parts[1] if len(parts) > 1 else "",
+            "location": parts[2] if len(parts) > 2 else "",
+            "duration": duration,
+            "responsibilities": bullets
+        })
+    return experience
+
+def _parse_education(lines: List[str]) -> List[Dict[str, Any]]:
+    education = []
+    for heading, bullets in split_entries(lines):
+        duration, rest = find_duration(" | ".join(heading))
+        years = YEAR_PATTERN.findall(duration)
+        parts = _split_heading(rest)
+        entry = {
+            "degree": parts[0] if parts else "",
+            "institution": parts[1] if len(parts) > 1 else "",
+            "location": parts[2] if len(parts) > 2 else "",
+            "year": years[-1] if years else duration
+        }
+        if bullets:
+            entry["highlights"] = bullets
+        education.append(entry)
+    return education
+
+def _parse_projects(lines: List[str]) -> List[Dict[str, Any]]:
+    projects = []
+    for heading, bullets in split_entries(lines):
+        technologies: List[str] = []
+        description = []
+        for item in bullets + heading[1:]:
+            match = TECHNOLOGIES_PATTERN.match(item)
+            if match:
+                technologies += split_list(match.group(1))
+            else:
+                description.append(item)
+        name, _, tagline = (heading[0] if heading else "").partition(":")
+        projects.append({
+            "name": name.strip(),
+            "description": " ".join(([tagline.strip()] if tagline.strip() else []) + description),
+            "technologies": technologies
+        })
+    return projects
+
+def local_parse(text: str) -> Dict[str, Any]:
+    """
+    Parse what can be read off a resume's text without a model.
+
+    Finds the contact details with regular expressions, splits the text at
+    its section headings and each section into entries and bullet points.
+    Fields that are not found are left out of the result, so the model (or
+    ResumeParser.validate_and_fix_resume_dict) can tell them from empty ones.
+
+    Returns:
+        Partial resume dictionary in the format of Resume
+    """
+    header, sections = split_sections(text)
+    resume: Dict[str, Any] = {"contact": extract_contact(header, text)}
+
+    if sections.get("summary"):
+        resume["summary"] = " ".join(sections["summary"])
+    else:
+        # Without a heading, the summary is the prose between the contact lines and the first section
+        prose = [line for line in header if len(line.split()) >= 8 and not EMAIL_PATTERN.search(line)]
+        if prose:
+            resume["summary"] = " ".join(prose)
+    if sections.get("skills"):
+        resume["skills"] = _parse_skills(sections["skills"])
+    if sections.get("experience"):
+        resume["experience"] = _parse_experience(sections["experience"])
+    if sections.get("education"):
+        resume["education"] = _parse_education(sections["education"])
+    if sections.get("projects"):
+        resume["projects"] = _parse_projects(sections["projects"])
+    for section in LIST_SECTIONS:
+        lines = sections.get(section)
+        if not lines:
+            continue
+        if any(BULLET_PATTERN.match(line) for line in lines):
+            resume[section] = split_bullets(lines)
+        elif all(len(line) <= MAX_UNMARKED_ITEM_CHARS for line in lines):
+            # Short unmarked lines are one item each ("AWS Certified Developer")
+            resume[section] = list(lines)
+        # Otherwise the items wrap over several unmarked lines (citations), which only the model can tell apart
+    return resume
+
+def missing_fields(resume: Dict[str, Any], sections: Optional[Dict[str, List[str]]] = None) -> List[str]:
+    """
+    Get the top-level fields of a partial resume the model still has to fill or normalize.
+
+    A section counts as missing if local parsing did not find it, or found
+    entries without their required fields (REQUIRED_ENTRY_FIELDS), e.g. a
+    job heading the pre-parser could not split into title and company.
+    Projects and the list sections are optional, so they are only missing if
+    found incomplete, or (given the text's sections) present but left unparsed.
+    Given the text's sections, skills are also missing if any line of them has
+    no label, since only the model can split it into technical and soft skills.
+    """
+    missing = []
+    contact = resume.get("contact", {})
+    if not all(contact.get(field) for field in ("name", "email")):
+        missing.append("contact")
+    if not resume.get("summary"):
+        missing.append("summary")
+    if not resume.get("skills", {}).get("technical"):
+        missing.append("skills")
+    elif sections and any(not label for label, _ in _skill_lines(sections.get("skills", []))):
+        # An unlabelled list ("Python, SQL, Leadership") mixes technical and soft skills
+        missing.append("skills")
+    for section, fields in REQUIRED_ENTRY_FIELDS.items():
+        entries = resume.get(section)
+        if entries is None:
+            if section != "projects":
+                missing.append(section)
+        elif any(not entry.get(field) for entry in entries for field in fields):
+            missing.append(section)
+    for section in LIST_SECTIONS:
+        if sections and sections.get(section) and section not in resume:
+            missing.append(section)
+    return missing
+
+def split_chunks(lines: List[str], max_chars: int) -> List[List[str]]:
+    """
+    Split the lines of a long section into chunks of about max_chars characters.
+
+    A chunk only ends where a new entry starts (see split_entries), so the
+    heading of a job stays with all of its bullets and no entry is cut in
+    two; an entry longer than max_chars becomes a chunk of its own. Sections
+    without entry headings, such as lists of publications, are split between
+    items instead: before a bullet or after a line ending a sentence.
+    Sections shorter than max_chars come back as a single chunk.
+    """
+    starts = _entry_starts(lines)
+    if len(starts) <= 1:
+        starts = [
+            number for number, line in enumerate(lines)
+            if number == 0 or BULLET_PATTERN.match(line) or lines[number - 1].rstrip().endswith((".", "!", "?"))
+        ]
+
+    chunks: List[List[str]] = []
+    size = max_chars
+    for start, end in zip(starts, starts[1:] + [len(lines)]):
+        entry = lines[start:end]
+        if size >= max_chars:
+            chunks.append([])
+            size = 0
+        chunks[-1].extend(entry)
+        size += sum(len(line) + 1 for line in entry)
+    return chunks
@@ -0,0 +1,127 @@
+import io
+import os
+import hashlib
+from typing import Dict, FrozenSet, List, Optional, Tuple
+
+import pypdf
+from pypdf import PdfReader
+from pypdf.generic import ArrayObject, DictionaryObject, IndirectObject, StreamObject
+
+from resume_builder.cache.page_text_cache import PageTextCache, get_page_text_cache
+from resume_builder.cache.settings import cache_settings
+from resume_builder.pipeline.tracing import tracer
+
+# Page entries that do not change the page's text
+IGNORED_PAGE_KEYS = frozenset({"/Annots", "/StructParents", "/Tabs", "/Thumb", "/B"})
+# Entries skipped at any depth: stream encoding details (the decoded data is hashed) and
+# /Parent, which would walk the whole page tree
+IGNORED_KEYS = frozenset({"/Length", "/Filter", "/DecodeParms", "/Parent"})
+
+def _hash_object(obj, digest, seen: Dict[Tuple[int, int], int], ignored: FrozenSet[str] = frozenset()):
+    # Hash a PDF object and everything it references, once per indirect object so cycles end
+    if isinstance(obj, IndirectObject):
+        ref = (obj.idnum, obj.generation)
+        if ref in seen:
+            # Object numbers differ between files, so refer back by order of first visit
+            digest.update(f"<ref {seen[ref]}>".encode('utf-8'))
+            return
+        seen[ref] = len(seen)
+        obj = obj.get_object()
+
+    if isinstance(obj, StreamObject):
+        digest.update(b"<stream>")
+        try:
+            digest.update(obj.get_data())
+        except Exception:
+            # Image filters pypdf cannot decode: the encoded bytes identify the stream just as well
+            digest.update(obj._data or b"")
+    # Streams are dictionaries as well, and their entries (a form's /Resources) matter too
+    if isinstance(obj, DictionaryObject):
+        digest.update(b"<<")
+        for key in sorted(obj.keys()):
+            if key in ignored or key in IGNORED_KEYS:
+                continue
+            digest.update(key.encode('utf-8'))
+            _hash_object(obj.raw_get(key), digest, seen)
+        digest.update(b">>")
+    elif isinstance(obj, ArrayObject):
+        digest.update(b"[")
+        for item in obj:
+            _hash_object(item, digest, seen)
+        digest.update(b"]")
+    else:
+        digest.update(repr(obj).encode('utf-8'))
+
+def page_key(page, layout: bool = False) -> str:
+    """
+    Build a cache key for the text of one PDF page.
+
+    The key hashes the page object with everything it references: the
+    decoded content streams and the resources they draw with, including
+    fonts and Form XObjects at any depth (a page may be nothing but
+    "/Fm0 Do"). Together with the extraction mode and pypdf version, that is
+    everything the extracted text depends on, so the key is the same for
+    the same page in any file and differs for pages that read differently.
+    """
+    digest = hashlib.sha256()
+    _hash_object(page, digest, {}, IGNORED_PAGE_KEYS)
+    digest.update(f"|{'layout' if layout else 'plain'}|{pypdf.__version__}".encode('utf-8'))
+    return digest.hexdigest()
+
+def _extract_page(page, layout: bool) -> str:
+    if layout:
+        # Keeps columns side by side and bullets indented as they are laid out on the page
+        return page.extract_text(extraction_mode="layout").strip("\n")
+    return page.extract_text().strip()
+
+def extract_pdf_text(file_path: str, layout: bool = False, cache: Optional[PageTextCache] = None) -> str:
+    """
+    Extract the text of a PDF directly with pypdf, one page after the other.
+
+    Page text is written into a single buffer as it is extracted, rather than
+    wrapped in a Document per page and joined afterwards. With caching
+    enabled, pages whose content has been seen before (see page_key) are
+    read from the page text cache instead of being extracted again.
+
+    Args:
+        file_path: Path to the PDF
+        layout: Extract layout-aware text, which keeps the columns and
+            indentation of the page, instead of plain reading-order text
+        cache: Page text cache to use (defaults to the shared one)
+
+    Returns:
+        The text of all pages, separated by newlines
+    """
+    with tracer.span("load pdf", "parse", file=os.path.basename(file_path), layout=layout) as span:
+        reader = PdfReader(file_path)
+        pages = reader.pages
+
+        cached: Dict[str, str] = {}
+        keys: List[str] = []
+        if cache_settings.enabled:
+            cache = cache or get_page_text_cache()
+            keys = [page_key(page, layout) for page in pages]
+            if not cache_settings.refresh:
+                cached = cache.get_many(keys)
+
+        buffer = io.StringIO()
+        extracted: Dict[str, str] = {}
+        for number, page in enumerate(pages):
+            if number:
+                buffer.write("\n")
+            key = keys[number] if keys else None
+            text = cached.get(key) if key else None
+            if text is None:
+                text = _extract_page(page, layout)
+                if key:
+                    extracted[key] = text
+            buffer.write(text)
+
+        if extracted:
+            cache.put_many(extracted)
+
+        text = buffer.getvalue()
+        span["pages"] = len(pages)
+        span["cached_pages"] = len(pages) - len(extracted) if keys else 0
+        span["text_chars"] = len(text)
+        return text
@@ -4,12 +4,13 @@ import os
 import json
 import re
 from typing import List, Dict, Any
-from langchain_google_genai import ChatGoogleGenerativeAI
 from langchain.prompts import PromptTemplate
 from langchain_core.output_parsers import StrOutputParser
 
 from resume_builder.models.resume import Resume
 from resume_builder.models.job import JobDescription
+from resume_builder.llm.clients import get_chat_model
+from resume_builder.pipeline.tracing import tracer
 
 class ResumeGenerator:
     """Tool to generate a tailored resume based on an existing resume, job description, and keywords."""
@@ -85,7 +86,7 @@ class ResumeGenerator:
             if not resume:
                 raise ValueError("Resume is required")
             
-            llm = ChatGoogleGenerativeAI(model=self.model_name, temperature=0.2)
+            llm = get_chat_model(self.model_name, temperature=0.2)
             
             # Convert models to dictionaries for prompt
             resume_dict = resume.model_dump()
@@ -135,8 +136,9 @@ class ResumeGenerator:
             except json.JSONDecodeError as e:
                 # If that fails, try to extract and fix the JSON
                 try:
-                    sanitized_json = self._sanitize_json_from_llm(result)
-                    parsed_result = json.loads(sanitized_json)
+                    with tracer.span("repair json", "generate", response_chars=len(result)):
+                        sanitized_json = self._sanitize_json_from_llm(result)
+                        parsed_result = json.loads(sanitized_json)
                     return Resume.model_validate(parsed_result)
                 except Exception as json_error:
                     # If all parsing fails, make one more attempt with a simplified approach
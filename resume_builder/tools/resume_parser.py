@@ -1,40 +1,242 @@
 import os
 import json
-from typing import Dict, List, Any, Optional
-from langchain.text_splitter import RecursiveCharacterTextSplitter
-from langchain_community.document_loaders import PyPDFLoader
-from langchain_core.documents import Document
-from langchain_google_genai import ChatGoogleGenerativeAI
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Any, Optional, Tuple
 from langchain.prompts import PromptTemplate
 from langchain_core.output_parsers import StrOutputParser
 
 from resume_builder.models.resume import Resume, Experience, Education, Project, Skills, ContactInfo
+from resume_builder.cache.resume_cache import ResumeCache, get_resume_cache
+from resume_builder.cache.settings import cache_settings
+from resume_builder.llm.clients import get_chat_model
+from resume_builder.pipeline.tracing import tracer
+from resume_builder.tools.local_parser import local_parse, missing_fields, split_chunks, split_sections
+from resume_builder.tools.pdf_text import extract_pdf_text
+
+# Bump whenever the extraction prompt or post-processing changes so cached resumes are re-parsed
+PROMPT_VERSION = "3"
+
+# Cache key "model" of resumes parsed without a model (--local-parse)
+LOCAL_PARSE_MODEL = "local"
+
+# Resumes with at least this much text (about five pages) are extracted section by section
+DEFAULT_SECTIONED_MIN_CHARS = 12000
+# Sections longer than this are split into several extraction requests, to stay within output-token limits
+SECTION_CHUNK_CHARS = 6000
+MAX_SECTION_WORKERS = 8
+
+class ParseSettings:
+    """Process-wide resume parsing switches (set from --local-parse, --pdf-layout and --section-parse-chars)."""
+
+    def __init__(self):
+        self.local_only = os.environ.get("RESUME_BUILDER_LOCAL_PARSE", "") != ""
+        self.layout = os.environ.get("RESUME_BUILDER_PDF_LAYOUT", "") != ""
+        self.sectioned_min_chars = DEFAULT_SECTIONED_MIN_CHARS
+
+parse_settings = ParseSettings()
+
+def configure_parsing(local_only: bool = False, layout: bool = False, sectioned_min_chars: Optional[int] = None):
+    """
+    Configure resume parsing for this process.
+
+    Args:
+        local_only: Parse resumes with the local pre-parser alone, never calling the model
+        layout: Extract layout-aware PDF text, keeping columns and indentation
+        sectioned_min_chars: Extract resumes with at least this much text section by
+            section, concurrently (0 for every resume; None keeps the current value)
+    """
+    parse_settings.local_only = local_only
+    parse_settings.layout = layout
+    if sectioned_min_chars is not None:
+        parse_settings.sectioned_min_chars = sectioned_min_chars
+
+# One entry of each field of a Resume, to show the model the structure of the fields it should fill
+EXTRACTION_EXAMPLE = {
+    "contact": {"name": "", "email": "", "phone": "", "linkedin": ""},
+    "summary": "",
+    "skills": {"technical": [], "soft": []},
+    "experience": [{"title": "", "company": "", "location": "", "duration": "", "responsibilities": []}],
+    "education": [{"degree": "", "institution": "", "location": "", "year": ""}],
+    "projects": [{"name": "", "description": "", "technologies": []}],
+    "certifications": [],
+    "publications": [],
+    "awards": []
+}
+
+# What to watch out for in each field, added to the prompts that ask for it
+FIELD_GUIDANCE = {
+    "experience": "Return one experience entry per position, keeping its bullet points verbatim as responsibilities.",
+    "education": "Return one education entry per degree.",
+    "projects": "Return one project entry per project.",
+    "skills": "Split the skills into technical and soft skills.",
+    "certifications": "Return one string per certification.",
+    "publications": "Return one string per publication with its full citation, joining lines that wrap.",
+    "awards": "Return one string per award."
+}
+
+def merge_parsed(partial: Dict[str, Any], filled: Dict[str, Any], missing: List[str]) -> Dict[str, Any]:
+    """
+    Merge the fields the model filled into a locally parsed resume.
+    
+    The model's value replaces a missing section only if it is not empty.
+    Contact details found locally are kept, since the regular expressions
+    read them verbatim; the model only adds the ones they did not find.
+    """
+    merged = dict(partial)
+    for field in missing:
+        value = filled.get(field) if isinstance(filled, dict) else None
+        if not value:
+            continue
+        if field == "contact" and isinstance(value, dict):
+            merged["contact"] = {**value, **{key: text for key, text in partial.get("contact", {}).items() if text}}
+        else:
+            merged[field] = value
+    return merged
+
+def merge_sections(results: List[Tuple[List[str], Dict[str, Any]]]) -> Dict[str, Any]:
+    """
+    Combine the fields extracted from each section (or chunk of a section) into one result.
+    
+    Lists, such as the entries of a section split into several chunks, are
+    concatenated in order, dictionaries (contact, skills) are merged, and of
+    strings the first non-empty one is kept.
+    """
+    merged: Dict[str, Any] = {}
+    for fields, result in results:
+        if not isinstance(result, dict):
+            continue
+        for field in fields:
+            value = result.get(field)
+            if not value:
+                continue
+            if isinstance(value, list):
+                merged.setdefault(field, []).extend(value)
+            elif isinstance(value, dict):
+                target = merged.setdefault(field, {})
+                for key, item in value.items():
+                    if isinstance(item, list):
+                        target.setdefault(key, []).extend(item)
+                    elif item and not target.get(key):
+                        target[key] = item
+            else:
+                merged.setdefault(field, value)
+    return merged
 
 class ResumeParser:
     """Tool to parse and extract information from a resume."""
     
-    def __init__(self, model_name="gemini-1.5-pro", api_key=None):
-        self.text_splitter = RecursiveCharacterTextSplitter(
-            chunk_size=1000,
-            chunk_overlap=200
-        )
+    def __init__(self, model_name="gemini-1.5-pro", api_key=None, cache: Optional[ResumeCache] = None,
+                 local_only: Optional[bool] = None, layout: Optional[bool] = None,
+                 sectioned_min_chars: Optional[int] = None):
         self.model_name = model_name
+        self.cache = cache
+        # Default to the process-wide settings, so configure_parsing applies to every parser
+        self._local_only = local_only
+        self._layout = layout
+        self._sectioned_min_chars = sectioned_min_chars
         if api_key:
             os.environ["GOOGLE_API_KEY"] = api_key
     
-    def load_resume(self, file_path: str) -> List[Document]:
-        """Load a resume from a PDF file."""
+    @property
+    def local_only(self) -> bool:
+        return parse_settings.local_only if self._local_only is None else self._local_only
+    
+    @property
+    def layout(self) -> bool:
+        return parse_settings.layout if self._layout is None else self._layout
+    
+    @property
+    def sectioned_min_chars(self) -> int:
+        if self._sectioned_min_chars is None:
+            return parse_settings.sectioned_min_chars
+        return self._sectioned_min_chars
+    
+    def load_resume(self, file_path: str) -> str:
+        """Load the text of a resume from a PDF file."""
         if file_path.endswith('.pdf'):
-            loader = PyPDFLoader(file_path)
-            documents = loader.load()
-            return documents
+            return extract_pdf_text(file_path, layout=self.layout)
         else:
             raise ValueError("Unsupported file format. Please provide a PDF file.")
     
     def extract_resume_info(self, resume_text: str) -> Dict[str, Any]:
-        """Extract structured information from resume text."""
+        """
+        Extract structured information from resume text.
+        
+        The local pre-parser reads the contact details, sections and bullet
+        points off the text first. The model is then only asked for the fields
+        it could not fill (see missing_fields), and only sent the text of those
+        sections, so a resume with conventional headings costs a fraction of
+        the prompt and response tokens, or no model call at all. In local-only
+        mode the partial result is returned as is.
+        
+        Long resumes (see sectioned_min_chars) are extracted section by
+        section instead, concurrently, so latency follows the longest section
+        rather than the whole document (see _extract_sections).
+        """
+        with tracer.span("local parse", "parse") as span:
+            resume_dict = local_parse(resume_text)
+            header, sections = split_sections(resume_text)
+            missing = missing_fields(resume_dict, sections)
+            span["missing"] = ",".join(missing)
+        
+        if self.local_only or not missing:
+            return resume_dict
+        
+        if not sections:
+            # No recognizable headings: the model has to structure the whole resume
+            return self._extract_with_model(resume_text)
+        
+        if len(resume_text) >= self.sectioned_min_chars:
+            filled = self._extract_sections(header, sections, missing)
+        else:
+            gap_text = self._gap_text(header, sections, missing) or resume_text
+            filled = self._extract_with_model(gap_text, missing)
+        return merge_parsed(resume_dict, filled, missing)
+    
+    def _extract_sections(self, header: List[str], sections: Dict[str, List[str]],
+                          missing: List[str]) -> Dict[str, Any]:
+        """
+        Extract the missing fields with one concurrent request per section.
+        
+        Each request only carries one section's text and asks for that
+        section's fields, and sections longer than SECTION_CHUNK_CHARS are
+        split at entry boundaries into several requests, so no single
+        response has to hold a 10-page publication list. Fields the text
+        has no section for are left to validate_and_fix_resume_dict.
+        """
+        requests: List[Tuple[List[str], str]] = []
+        # The name and an unheaded summary are in the lines before the first heading
+        header_fields = [field for field in ("contact", "summary") if field in missing]
+        if header_fields and header:
+            requests.append((header_fields, "\n".join(header)))
+        for field in missing:
+            if field in header_fields or not sections.get(field):
+                continue
+            for chunk in split_chunks(sections[field], SECTION_CHUNK_CHARS):
+                requests.append(([field], field.capitalize() + "\n" + "\n".join(chunk)))
+        if not requests:
+            return {}
+        
+        with tracer.span("extract sections", "parse", requests=len(requests)):
+            with ThreadPoolExecutor(max_workers=min(MAX_SECTION_WORKERS, len(requests))) as executor:
+                # map() keeps the requests' order, so chunks of a section are merged in order
+                results = list(executor.map(lambda request: self._extract_with_model(request[1], request[0]),
+                                            requests))
+        return merge_sections([(fields, result) for (fields, _), result in zip(requests, results)])
+    
+    def _gap_text(self, header: List[str], sections: Dict[str, List[str]], missing: List[str]) -> str:
+        # The sections the model is asked to fill, not the whole resume; the header holds
+        # the name and, in resumes without a "Summary" heading, the summary
+        parts = ["\n".join(header)] if "contact" in missing or "summary" in missing else []
+        for section in missing:
+            if section in sections:
+                parts.append(section.capitalize() + "\n" + "\n".join(sections[section]))
+        return "\n\n".join(part for part in parts if part)
+    
+    def _extract_with_model(self, resume_text: str, missing: Optional[List[str]] = None) -> Dict[str, Any]:
+        """Extract structured information from resume text with the model, optionally only the missing fields."""
         try:
-            llm = ChatGoogleGenerativeAI(model=self.model_name)
+            llm = get_chat_model(self.model_name)
             
             template = """
             Extract the following information from the resume text:
@@ -96,11 +298,38 @@ class ResumeParser:
             All string fields must be non-null - use empty strings if you can't extract the information, but NEVER use null values.
             For arrays, if there's no relevant information, use an empty array [], not null.
             """
+            inputs = {"resume_text": resume_text}
+            
+            if missing:
+                template = """
+            Extract the following information from the resume text: {fields}
+            
+            The other fields have already been parsed, so leave them out.
+            
+            Resume text (only the sections to extract):
+            {resume_text}
+            
+            Return a JSON object with only the keys {fields}, in the same structure as:
+            ```json
+            {example}
+            ```
+            
+            For sections given as a list of entries, return every entry in the text, splitting headings like
+            "Senior Engineer | Acme Corp" into their fields and keeping bullet points verbatim.
+            {guidance}
+            Make sure the JSON is valid. All string fields must be non-null - use empty strings if you can't extract
+            the information, but NEVER use null values. For arrays with no relevant information, use [].
+            """
+                inputs.update({
+                    "fields": ", ".join(missing),
+                    "guidance": " ".join(FIELD_GUIDANCE[field] for field in missing if field in FIELD_GUIDANCE),
+                    "example": json.dumps({key: EXTRACTION_EXAMPLE[key] for key in missing if key in EXTRACTION_EXAMPLE})
+                })
             
             prompt = PromptTemplate.from_template(template)
             chain = prompt | llm | StrOutputParser()
             
-            result = chain.invoke({"resume_text": resume_text})
+            result = chain.invoke(inputs)
             
             # Parse the JSON string to a Python dictionary
             try:
@@ -215,10 +444,36 @@ class ResumeParser:
         return resume_dict
     
     def __call__(self, file_path: str) -> Resume:
-        """Parse resume from a PDF file."""
+        """
+        Parse resume from a PDF file.
+        
+        Results are cached by the PDF's content hash, so parsing the same file
+        again returns the stored Resume without loading the PDF or calling the model.
+        """
+        if not cache_settings.enabled:
+            return self.parse(file_path)
+        
+        cache = self.cache or get_resume_cache()
+        try:
+            cache_key = cache.make_key(file_path, LOCAL_PARSE_MODEL if self.local_only else self.model_name,
+                                       f"{PROMPT_VERSION}-layout" if self.layout else PROMPT_VERSION)
+        except OSError as e:
+            raise ValueError(f"Error parsing resume: {str(e)}")
+        
+        if not cache_settings.refresh:
+            cached_resume = cache.get(cache_key)
+            if cached_resume is not None:
+                print(f"Using cached resume for {os.path.basename(file_path)}")
+                return cached_resume
+        
+        resume = self.parse(file_path)
+        cache.put(cache_key, resume)
+        return resume
+    
+    def parse(self, file_path: str) -> Resume:
+        """Parse resume from a PDF file, always loading the PDF and (unless local-only) calling the model."""
         try:
-            documents = self.load_resume(file_path)
-            full_text = "\n".join([doc.page_content for doc in documents])
+            full_text = self.load_resume(file_path)
             resume_dict = self.extract_resume_info(full_text)
             
             # Validate and fix the resume dictionary
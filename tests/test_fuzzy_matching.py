@@ -0,0 +1,49 @@
+from resume_builder.benchmark.fixtures import make_resume
+from resume_builder.matching.keyword_scorer import KeywordScorer
+from resume_builder.models.job import JobDescription
+from resume_builder.tools.keyword_processor import KeywordProcessor
+
+def _resume_with_skills(skills):
+    resume = make_resume(1)
+    resume.skills.technical = skills
+    resume.skills.soft = []
+    for experience in resume.experience:
+        experience.responsibilities = ["Shipped features"]
+        experience.achievements = None
+    resume.projects = None
+    return resume
+
+def test_misspelled_resume_skills_are_reported_as_near_misses():
+    resume = _resume_with_skills(["Pyhton", "Tensorflow2", "Kuberentes"])
+    result = KeywordScorer(["Python", "TensorFlow", "Kubernetes"]).score(resume)
+
+    assert result["matches"] == []
+    near = {match["keyword"]: match["match"] for match in result["fuzzy_matches"]}
+    assert near == {"Python": "pyhton", "TensorFlow": "tensorflow2", "Kubernetes": "kuberentes"}
+    # Near misses are reported, not credited
+    assert result["score"] == 0
+
+def test_correctly_spelled_skills_are_not_near_misses():
+    resume = _resume_with_skills(["Python", "TensorFlow", "Kubernetes"])
+    result = KeywordScorer(["Python", "TensorFlow", "Kubernetes"]).score(resume)
+
+    assert result["matches"] == ["Python", "TensorFlow", "Kubernetes"]
+    assert result["fuzzy_matches"] == []
+
+def test_known_skill_keyword_is_not_rewritten_to_another_job_skill():
+    job = JobDescription(title="Database Engineer", company="Example Corp", location="Remote",
+                         required_skills=["MSSQL", "TensorFlow"], preferred_skills=[],
+                         key_responsibilities=["Run databases"], experience_years="3+")
+    selected = KeywordProcessor()({"keywords": ["MySQL", "Tensorflow2"], "job": job, "max_count": 10})
+
+    assert "MySQL" in selected
+    assert "MSSQL" not in selected
+    assert "TensorFlow" in selected
+
+def test_single_typos_of_job_skills_are_corrected():
+    job = JobDescription(title="Web Developer", company="Example Corp", location="Remote",
+                         required_skills=["Python", "Django", "Docker", "React"], preferred_skills=[],
+                         key_responsibilities=["Build web applications"], experience_years="3+")
+    selected = KeywordProcessor()({"keywords": ["Pyhton", "Djnago", "Dokcer", "Raect"], "job": job, "max_count": 10})
+
+    assert sorted(selected) == ["Django", "Docker", "Python", "React"]
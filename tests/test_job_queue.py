@@ -0,0 +1,89 @@
+import time
+
+from resume_builder.cache.sqlite import connect
+from resume_builder.pipeline.job_queue import RETRY_DELAY_SECONDS, JobQueue
+
+def _enqueue(queue, name, max_attempts=3):
+    return queue.enqueue(name, "resume.pdf", f"Posting for {name}", "output", max_attempts=max_attempts)
+
+def _job(queue, name):
+    return next(row for row in queue.rows() if row["name"] == name)
+
+def _make_due(queue):
+    # Skip the retry delay instead of sleeping through it
+    with connect(queue.db_path) as conn:
+        conn.execute("UPDATE jobs SET available_at = 0 WHERE status = 'queued'")
+
+def test_crashed_run_resumes_without_redoing_finished_jobs(tmp_path):
+    db_path = str(tmp_path / "queue.sqlite3")
+    queue = JobQueue(db_path)
+    assert _enqueue(queue, "first") and _enqueue(queue, "second")
+
+    first = queue.claim()
+    queue.complete(first["id"], "output/first.pdf", {"total": 1.0})
+    second = queue.claim()
+    assert (first["name"], second["name"], second["attempts"]) == ("first", "second", 1)
+
+    # The process dies while "second" is running; a new run opens the same database
+    queue = JobQueue(db_path)
+    assert queue.recover() == 1
+    assert queue.counts() == {"queued": 1, "running": 0, "done": 1, "failed": 0}
+    interrupted = _job(queue, "second")
+    assert interrupted["error"] == "Interrupted while running"
+    # The interrupted attempt counts, so a job that keeps crashing the process still runs out of attempts
+    assert interrupted["attempts"] == 1
+
+    # Enqueueing the feed again neither adds nor redoes anything
+    assert not _enqueue(queue, "first") and not _enqueue(queue, "second")
+    resumed = queue.claim()
+    assert (resumed["name"], resumed["attempts"]) == ("second", 2)
+    assert queue.claim() is None
+    queue.complete(resumed["id"], "output/second.pdf", {"total": 1.0})
+    assert queue.counts() == {"queued": 0, "running": 0, "done": 2, "failed": 0}
+    assert _job(queue, "first")["output_path"] == "output/first.pdf"
+
+def test_failed_attempts_are_retried_with_backoff_until_failed(tmp_path):
+    queue = JobQueue(str(tmp_path / "queue.sqlite3"))
+    _enqueue(queue, "flaky", max_attempts=3)
+
+    job = queue.claim()
+    before = time.time()
+    assert queue.fail(job["id"], "Model error", {}) == "queued"
+    delay = _job(queue, "flaky")["available_at"] - before
+    assert RETRY_DELAY_SECONDS - 1 <= delay <= RETRY_DELAY_SECONDS + 1
+    # Not due until the delay has passed
+    assert queue.claim() is None
+
+    _make_due(queue)
+    job = queue.claim()
+    assert job["attempts"] == 2
+    before = time.time()
+    assert queue.fail(job["id"], "Model error", {}) == "queued"
+    # The delay doubles with every attempt
+    delay = _job(queue, "flaky")["available_at"] - before
+    assert 2 * RETRY_DELAY_SECONDS - 1 <= delay <= 2 * RETRY_DELAY_SECONDS + 1
+
+    _make_due(queue)
+    job = queue.claim()
+    assert job["attempts"] == 3
+    assert queue.fail(job["id"], "Model error", {}) == "failed"
+    assert queue.counts()["failed"] == 1
+    _make_due(queue)
+    assert queue.claim() is None
+
+    # --retry-failed gives the job a fresh set of attempts
+    assert queue.retry_failed() == 1
+    job = queue.claim()
+    assert (job["name"], job["attempts"]) == ("flaky", 1)
+
+def test_recovered_crash_uses_up_an_attempt(tmp_path):
+    db_path = str(tmp_path / "queue.sqlite3")
+    queue = JobQueue(db_path)
+    _enqueue(queue, "crashes", max_attempts=2)
+
+    queue.claim()
+    queue = JobQueue(db_path)
+    queue.recover()
+    job = queue.claim()
+    assert job["attempts"] == 2
+    assert queue.fail(job["id"], "Model error", {}) == "failed"
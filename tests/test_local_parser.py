@@ -0,0 +1,57 @@
+from resume_builder.tools.local_parser import local_parse, missing_fields, split_chunks, split_entries, split_sections
+from resume_builder.tools.resume_parser import SECTION_CHUNK_CHARS
+
+def _entry(number, bullets):
+    heading = [f"Software Engineer {number}, Company {number} (2010 - 2012)"]
+    return heading + [f"- Did a long thing number {i} for entry {number}. " + "x" * 600 for i in range(bullets)]
+
+def test_entry_longer_than_chunk_stays_whole():
+    long_entry = _entry(1, 12)
+    assert sum(len(line) + 1 for line in long_entry) > SECTION_CHUNK_CHARS
+    lines = long_entry + _entry(2, 2) + _entry(3, 2)
+
+    chunks = split_chunks(lines, SECTION_CHUNK_CHARS)
+
+    assert chunks[0] == long_entry
+    assert [line for chunk in chunks for line in chunk] == lines
+    # Every chunk starts with an entry heading, never with a stray bullet
+    assert all(chunk[0].startswith("Software Engineer") for chunk in chunks)
+    assert len(split_entries(chunks[0])) == 1
+
+def test_entries_are_packed_up_to_the_chunk_size():
+    lines = [line for number in range(20) for line in _entry(number, 3)]
+
+    chunks = split_chunks(lines, SECTION_CHUNK_CHARS)
+
+    assert len(chunks) > 1
+    assert [line for chunk in chunks for line in chunk] == lines
+    assert all(chunk[0].startswith("Software Engineer") for chunk in chunks)
+
+def test_unmarked_list_is_split_between_items():
+    lines = []
+    for number in range(200):
+        lines += [f"Smith, J. ({2000 + number % 20}). A study of systems number {number} with a long",
+                  f"title that wraps. Journal {number}, pp. {number}-{number + 9}."]
+
+    chunks = split_chunks(lines, SECTION_CHUNK_CHARS)
+
+    assert len(chunks) > 1
+    assert all(chunk[0].startswith("Smith, J.") for chunk in chunks)
+
+def _skills_resume(skills_lines):
+    text = "\n".join(["Jane Doe", "jane@example.com", "Summary",
+                      "Backend engineer with ten years of experience building data platforms.",
+                      "Skills"] + skills_lines)
+    _, sections = split_sections(text)
+    return local_parse(text), sections
+
+def test_unlabelled_skills_are_left_to_the_model():
+    resume, sections = _skills_resume(["Python, SQL, Leadership, Communication"])
+
+    assert "skills" in missing_fields(resume, sections)
+
+def test_labelled_skills_are_parsed_locally():
+    resume, sections = _skills_resume(["Languages: Python, SQL", "Soft skills: Leadership, Communication"])
+
+    assert resume["skills"] == {"technical": ["Python", "SQL"], "soft": ["Leadership", "Communication"]}
+    assert "skills" not in missing_fields(resume, sections)
@@ -0,0 +1,54 @@
+from resume_builder.cache.page_text_cache import PageTextCache
+from resume_builder.cache.settings import configure_caches
+from resume_builder.cache.sqlite import connect
+from resume_builder.tools.pdf_text import extract_pdf_text
+
+def _write_form_pdf(file_path, text, first_object=1):
+    """Write a one-page PDF whose page only draws a Form XObject ("/Fm0 Do") holding the text."""
+    form = f"BT /F1 12 Tf 50 700 Td ({text}) Tj ET"
+    numbers = {name: first_object + offset for offset, name in enumerate(["catalog", "pages", "page", "contents",
+                                                                          "form", "font"])}
+    bodies = {
+        "catalog": f"<< /Type /Catalog /Pages {numbers['pages']} 0 R >>",
+        "pages": f"<< /Type /Pages /Kids [{numbers['page']} 0 R] /Count 1 >>",
+        "page": (f"<< /Type /Page /Parent {numbers['pages']} 0 R /MediaBox [0 0 612 792] "
+                 f"/Contents {numbers['contents']} 0 R /Resources << /XObject << /Fm0 {numbers['form']} 0 R >> >> >>"),
+        "contents": "<< /Length 7 >>\nstream\n/Fm0 Do\nendstream",
+        "form": (f"<< /Type /XObject /Subtype /Form /BBox [0 0 612 792] "
+                 f"/Resources << /Font << /F1 {numbers['font']} 0 R >> >> /Length {len(form)} >>\n"
+                 f"stream\n{form}\nendstream"),
+        "font": "<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>",
+    }
+
+    output = "%PDF-1.4\n"
+    offsets = {}
+    for name, number in sorted(numbers.items(), key=lambda item: item[1]):
+        offsets[number] = len(output)
+        output += f"{number} 0 obj\n{bodies[name]}\nendobj\n"
+    xref_offset = len(output)
+    size = max(numbers.values()) + 1
+    output += f"xref\n0 {size}\n0000000000 65535 f \n"
+    output += "".join(f"{offsets[number]:010d} 00000 n \n" if number in offsets else "0000000000 65535 f \n"
+                      for number in range(1, size))
+    output += f"trailer\n<< /Size {size} /Root {numbers['catalog']} 0 R >>\nstartxref\n{xref_offset}\n%%EOF\n"
+    with open(file_path, 'w', encoding='latin-1') as f:
+        f.write(output)
+    return str(file_path)
+
+def test_pages_drawn_through_forms_are_cached_by_their_form_content(tmp_path):
+    configure_caches(enabled=True, refresh=False, cache_dir=str(tmp_path))
+    cache = PageTextCache(str(tmp_path / "page_text.sqlite3"))
+    try:
+        first = _write_form_pdf(tmp_path / "first.pdf", "Jordan Smith")
+        second = _write_form_pdf(tmp_path / "second.pdf", "Alex Jones")
+        renumbered = _write_form_pdf(tmp_path / "renumbered.pdf", "Jordan Smith", first_object=10)
+
+        assert extract_pdf_text(first, cache=cache) == "Jordan Smith"
+        # Same page content stream ("/Fm0 Do"), different form: must not hit the first page's entry
+        assert extract_pdf_text(second, cache=cache) == "Alex Jones"
+        # Same page with other object numbers: served from the cache
+        extract_pdf_text(renumbered, cache=cache)
+        with connect(cache.db_path) as conn:
+            assert conn.execute("SELECT COUNT(*) FROM page_text").fetchone()[0] == 2
+    finally:
+        configure_caches()